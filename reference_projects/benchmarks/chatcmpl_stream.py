@@ -0,0 +1,117 @@
+"""
+Benchmark converting a Chat Completions stream into Responses API stream events.
+
+Streams `--chunks` pre-built chunks through `ChatCmplStreamHandler.handle_stream` and
+`ChatCmplStreamHandler.stream_text`, and reports chunks per second and microseconds per chunk.
+Chunks are built before timing starts, so only the conversion is measured.
+
+Scenarios:
+    text        Each chunk is one text token.
+    arguments   Each chunk is one token of a single function call's arguments.
+    text-only   Text chunks, read through `stream_text`, which builds no events.
+
+Usage:
+    PYTHONPATH=src python benchmarks/chatcmpl_stream.py --chunks 100000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from agents.models.chatcmpl_stream_handler import ChatCmplStreamHandler
+from openai.types.chat.chat_completion_chunk import (
+    ChatCompletionChunk,
+    Choice,
+    ChoiceDelta,
+    ChoiceDeltaToolCall,
+    ChoiceDeltaToolCallFunction,
+)
+from openai.types.responses import Response
+
+
+def chunk(delta: ChoiceDelta) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chunk-id",
+        created=1,
+        model="fake",
+        object="chat.completion.chunk",
+        choices=[Choice(index=0, delta=delta)],
+    )
+
+
+def text_chunks(count: int) -> list[ChatCompletionChunk]:
+    return [chunk(ChoiceDelta(content=f"tok{i} ")) for i in range(count)]
+
+
+def argument_chunks(count: int) -> list[ChatCompletionChunk]:
+    first = ChoiceDeltaToolCall(
+        index=0, id="call-id", function=ChoiceDeltaToolCallFunction(name="tool", arguments='{"a":"')
+    )
+    rest = [
+        ChoiceDeltaToolCall(index=0, function=ChoiceDeltaToolCallFunction(arguments=f"tok{i} "))
+        for i in range(count - 1)
+    ]
+    return [chunk(ChoiceDelta(tool_calls=[call])) for call in [first, *rest]]
+
+
+def response() -> Response:
+    return Response(
+        id="resp-id",
+        created_at=0,
+        model="fake",
+        object="response",
+        output=[],
+        tool_choice="none",
+        tools=[],
+        parallel_tool_calls=False,
+    )
+
+
+async def stream(chunks: list[ChatCompletionChunk]) -> AsyncIterator[ChatCompletionChunk]:
+    for c in chunks:
+        yield c
+
+
+async def convert(chunks: list[ChatCompletionChunk], text_only: bool) -> int:
+    events = 0
+    iterator: AsyncIterator[Any] = (
+        ChatCmplStreamHandler.stream_text(stream(chunks))  # type: ignore[arg-type]
+        if text_only
+        else ChatCmplStreamHandler.handle_stream(response(), stream(chunks))  # type: ignore[arg-type]
+    )
+    async for _ in iterator:
+        events += 1
+    return events
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = text_chunks(args.chunks)
+    scenarios = {
+        "text": (text, False),
+        "arguments": (argument_chunks(args.chunks), False),
+        "text-only": (text, True),
+    }
+
+    print(f"{'scenario':>10} {'chunks':>8} {'events':>8} {'chunks/s':>11} {'us/chunk':>9}")
+    for name, (chunks, text_only) in scenarios.items():
+        best = float("inf")
+        events = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            events = await convert(chunks, text_only)
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{name:>10} {len(chunks):>8} {events:>8} {len(chunks) / best:>11.0f} "
+            f"{best / len(chunks) * 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
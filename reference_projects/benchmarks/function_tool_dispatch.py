@@ -0,0 +1,141 @@
+"""
+Benchmark the per-call overhead of dispatching function tool arguments.
+
+Compares the previous dispatch path (`json.loads`, building the params model from the resulting
+dict and walking the signature) with `FuncSchema.validate_json` plus the precompiled argument
+binder, on a wide schema with many scalar parameters and on a nested one. Also reports the full
+`FunctionTool.on_invoke_tool` round trip for an inline tool.
+
+Usage:
+    PYTHONPATH=src python benchmarks/function_tool_dispatch.py --calls 20000
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import time
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from agents import RunContextWrapper, function_tool
+from agents.function_schema import FuncSchema, function_schema
+
+WIDE_PARAMS = 40
+
+
+def make_wide_function() -> Callable[..., int]:
+    params = ", ".join(f"p{i}: int = 0" for i in range(WIDE_PARAMS))
+    namespace: dict[str, Any] = {}
+    exec(f"def wide_tool({params}) -> int:\n    return p0", namespace)
+    return namespace["wide_tool"]  # type: ignore[no-any-return]
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    tags: list[str]
+
+
+class Attribute(BaseModel):
+    key: str
+    value: str
+
+
+class Customer(BaseModel):
+    name: str
+    addresses: list[Address]
+    attributes: list[Attribute]
+
+
+def nested_tool(customer: Customer, notes: list[str], priority: int) -> int:
+    return priority
+
+
+def nested_input() -> str:
+    address = {"street": "1 Main St", "city": "Springfield", "tags": ["home", "billing"]}
+    return json.dumps(
+        {
+            "customer": {
+                "name": "Ada",
+                "addresses": [address] * 5,
+                "attributes": [{"key": f"key{i}", "value": f"value{i}"} for i in range(10)],
+            },
+            "notes": ["first", "second", "third"],
+            "priority": 2,
+        }
+    )
+
+
+def legacy_dispatch(schema: FuncSchema, input: str) -> tuple[list[Any], dict[str, Any]]:
+    json_data = json.loads(input) if input else {}
+    data = schema.params_pydantic_model(**json_data)
+    positional_args: list[Any] = []
+    keyword_args: dict[str, Any] = {}
+    seen_var_positional = False
+    for idx, (name, param) in enumerate(schema.signature.parameters.items()):
+        if schema.takes_context and idx == 0:
+            continue
+        value = getattr(data, name, None)
+        if param.kind == param.VAR_POSITIONAL:
+            positional_args.extend(value or [])
+            seen_var_positional = True
+        elif param.kind == param.VAR_KEYWORD:
+            keyword_args.update(value or {})
+        elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            if not seen_var_positional:
+                positional_args.append(value)
+            else:
+                keyword_args[name] = value
+        else:
+            keyword_args[name] = value
+    return positional_args, keyword_args
+
+
+def compiled_dispatch(schema: FuncSchema, input: str) -> tuple[list[Any], dict[str, Any]]:
+    return schema.to_call_args(schema.validate_json(input))
+
+
+def time_calls(call: Callable[[], Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def time_invoke(func: Callable[..., Any], input: str, calls: int) -> float:
+    tool = function_tool(func, executor="inline")
+    ctx = RunContextWrapper(None)
+    start = time.perf_counter()
+    for _ in range(calls):
+        await tool.on_invoke_tool(ctx, input)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    wide_tool = make_wide_function()
+    cases = {
+        "wide": (wide_tool, json.dumps({f"p{i}": i for i in range(WIDE_PARAMS)})),
+        "nested": (nested_tool, nested_input()),
+    }
+
+    print(f"{'schema':>8} {'legacy us':>10} {'compiled us':>12} {'speedup':>8} {'invoke us':>10}")
+    for name, (func, input) in cases.items():
+        schema = function_schema(func)
+        assert legacy_dispatch(schema, input) == compiled_dispatch(schema, input)
+
+        legacy = time_calls(functools.partial(legacy_dispatch, schema, input), args.calls)
+        compiled = time_calls(functools.partial(compiled_dispatch, schema, input), args.calls)
+        invoke = asyncio.run(time_invoke(func, input, args.calls))
+        print(
+            f"{name:>8} {legacy:>10.2f} {compiled:>12.2f} {legacy / compiled:>7.2f}x {invoke:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Benchmark the SDK's own overhead in the agent run loop.
+
+Each scenario is recorded once against a scripted model, then replayed with `ReplayModelProvider`
+under `--concurrency` concurrent runs, for `Runner.run` and `Runner.run_streamed`, with tracing
+on (spans go through the batch processor to an exporter that drops them) and off. Reports runs,
+turns and stream events per second, and the CPU time spent per turn. With no replay latency the
+runs are CPU-bound, so 1 / (CPU per turn) is roughly the most turns per second one worker can
+sustain before the framework itself is the bottleneck.
+
+Scenarios:
+    run         One turn with a text answer.
+    tools       Three parallel function tool calls, then a text answer.
+    handoffs    A handoff to a second agent, which answers.
+    guardrails  One turn with an input and an output guardrail.
+
+Usage:
+    PYTHONPATH=src python benchmarks/run_loop.py --runs 500 --concurrency 1 32
+    PYTHONPATH=src python benchmarks/run_loop.py --latency-ms 200 --concurrency 100 1000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from agents import (
+    Agent,
+    GuardrailFunctionOutput,
+    Model,
+    ModelProvider,
+    RunConfig,
+    RunContextWrapper,
+    Runner,
+    TResponseInputItem,
+    function_tool,
+    handoff,
+    input_guardrail,
+    output_guardrail,
+    set_trace_processors,
+)
+from agents.items import ModelResponse, TResponseOutputItem
+from agents.models.fake_id import FAKE_RESPONSES_ID
+from agents.models.replay import (
+    ModelRecording,
+    RecordingModelProvider,
+    ReplayModelProvider,
+    constant_latency,
+)
+from agents.tracing import Span, Trace
+from agents.tracing.processor_interface import TracingExporter
+from agents.tracing.processors import BatchTraceProcessor
+from agents.usage import Usage
+from openai.types.responses import (
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+)
+
+INPUT = "What's the weather in Tokyo and Paris?"
+
+
+def text_message(text: str) -> ResponseOutputMessage:
+    return ResponseOutputMessage(
+        id=FAKE_RESPONSES_ID,
+        type="message",
+        role="assistant",
+        status="completed",
+        content=[ResponseOutputText(text=text, type="output_text", annotations=[])],
+    )
+
+
+def function_call(name: str, arguments: dict[str, Any], call_id: str) -> ResponseFunctionToolCall:
+    return ResponseFunctionToolCall(
+        id=FAKE_RESPONSES_ID,
+        call_id=call_id,
+        type="function_call",
+        name=name,
+        arguments=json.dumps(arguments),
+    )
+
+
+class ScriptedModel(Model):
+    """Returns a fixed list of outputs in order. Only used to record each scenario once."""
+
+    def __init__(self, outputs: list[list[TResponseOutputItem]]) -> None:
+        self.outputs = outputs
+        self.turn = 0
+
+    async def get_response(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        output = self.outputs[self.turn]
+        self.turn += 1
+        usage = Usage(requests=1, input_tokens=50, output_tokens=20, total_tokens=70)
+        return ModelResponse(output=output, usage=usage, response_id=None)
+
+    def stream_response(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+
+class SingleModelProvider(ModelProvider):
+    def __init__(self, model: Model) -> None:
+        self.model = model
+
+    def get_model(self, model_name: str | None) -> Model:
+        return self.model
+
+
+class DiscardExporter(TracingExporter):
+    def export(self, items: list[Trace | Span[Any]]) -> None:
+        pass
+
+
+@function_tool
+def get_weather(city: str) -> str:
+    return f"The weather in {city} is sunny."
+
+
+@input_guardrail
+def no_secrets(
+    context: RunContextWrapper[Any], agent: Agent[Any], input: str | list[TResponseInputItem]
+) -> GuardrailFunctionOutput:
+    return GuardrailFunctionOutput(output_info=None, tripwire_triggered="password" in str(input))
+
+
+@output_guardrail
+def not_empty(
+    context: RunContextWrapper[Any], agent: Agent[Any], output: Any
+) -> GuardrailFunctionOutput:
+    return GuardrailFunctionOutput(output_info=None, tripwire_triggered=not output)
+
+
+def scenarios() -> dict[str, tuple[Agent[Any], list[list[TResponseOutputItem]]]]:
+    weather_agent = Agent(name="weather", instructions="Answer weather questions.")
+    return {
+        "run": (
+            Agent(name="assistant", instructions="Be brief."),
+            [[text_message("Sunny in both.")]],
+        ),
+        "tools": (
+            Agent(name="assistant", instructions="Use tools.", tools=[get_weather]),
+            [
+                [
+                    function_call("get_weather", {"city": city}, f"call_{i}")
+                    for i, city in enumerate(["Tokyo", "Paris", "Lima"])
+                ],
+                [text_message("Sunny everywhere.")],
+            ],
+        ),
+        "handoffs": (
+            Agent(name="triage", instructions="Route.", handoffs=[handoff(weather_agent)]),
+            [
+                [function_call("transfer_to_weather", {}, "call_0")],
+                [text_message("Sunny in both.")],
+            ],
+        ),
+        "guardrails": (
+            Agent(
+                name="assistant",
+                instructions="Be brief.",
+                input_guardrails=[no_secrets],
+                output_guardrails=[not_empty],
+            ),
+            [[text_message("Sunny in both.")]],
+        ),
+    }
+
+
+async def record(agent: Agent[Any], outputs: list[list[TResponseOutputItem]]) -> ModelRecording:
+    recording = ModelRecording()
+    provider = RecordingModelProvider(SingleModelProvider(ScriptedModel(outputs)), recording)
+    await Runner.run(
+        agent, INPUT, run_config=RunConfig(model_provider=provider, tracing_disabled=True)
+    )
+    return recording
+
+
+async def run_once(agent: Agent[Any], config: RunConfig, streamed: bool) -> tuple[int, int]:
+    """Returns the number of turns and of stream events."""
+    if not streamed:
+        result = await Runner.run(agent, INPUT, run_config=config)
+        return len(result.raw_responses), 0
+
+    streamed_result = Runner.run_streamed(agent, INPUT, run_config=config)
+    events = 0
+    async for _ in streamed_result.stream_events():
+        events += 1
+    return len(streamed_result.raw_responses), events
+
+
+async def measure(
+    agent: Agent[Any], config: RunConfig, streamed: bool, runs: int, concurrency: int
+) -> dict[str, float]:
+    remaining = runs
+    turns = 0
+    events = 0
+
+    async def worker() -> None:
+        nonlocal remaining, turns, events
+        while remaining > 0:
+            remaining -= 1
+            run_turns, run_events = await run_once(agent, config, streamed)
+            turns += run_turns
+            events += run_events
+
+    # Warm up caches (schemas, imports) outside the measurement.
+    await run_once(agent, config, streamed)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return {
+        "runs/s": runs / wall,
+        "turns/s": turns / wall,
+        "events/s": events / wall,
+        "cpu us/turn": cpu / turns * 1e6,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 32])
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="replayed model latency")
+    parser.add_argument("--scenarios", nargs="+", default=list(scenarios()))
+    args = parser.parse_args()
+
+    processor = BatchTraceProcessor(exporter=DiscardExporter())
+    set_trace_processors([processor])
+    latency = constant_latency(args.latency_ms / 1000) if args.latency_ms else None
+
+    print(
+        f"{'scenario':>10} {'mode':>8} {'tracing':>7} {'conc':>5} {'runs/s':>9} {'turns/s':>9} "
+        f"{'events/s':>10} {'cpu us/turn':>12}"
+    )
+    for name, (agent, outputs) in scenarios().items():
+        if name not in args.scenarios:
+            continue
+        provider = ReplayModelProvider(await record(agent, outputs), latency)
+        for streamed in (False, True):
+            for tracing in (True, False):
+                config = RunConfig(model_provider=provider, tracing_disabled=not tracing)
+                for concurrency in args.concurrency:
+                    stats = await measure(agent, config, streamed, args.runs, concurrency)
+                    print(
+                        f"{name:>10} {'stream' if streamed else 'run':>8} "
+                        f"{'on' if tracing else 'off':>7} {concurrency:>5} "
+                        f"{stats['runs/s']:>9.0f} {stats['turns/s']:>9.0f} "
+                        f"{stats['events/s']:>10.0f} {stats['cpu us/turn']:>12.0f}"
+                    )
+    processor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 import time
 
 from rich.console import Console
 
 from agents import Runner, custom_span, gen_trace_id, trace
 
-from .agents.planner_agent import WebSearchItem, WebSearchPlan, planner_agent
+from .agents.planner_agent import WebSearchPlan, planner_agent
 from .agents.search_agent import search_agent
 from .agents.writer_agent import ReportData, writer_agent
 from .printer import Printer
@@ -65,31 +64,21 @@ class ResearchManager:
     async def _perform_searches(self, search_plan: WebSearchPlan) -> list[str]:
         with custom_span("Search the web"):
             self.printer.update_item("searching", "Searching...")
-            num_completed = 0
-            tasks = [asyncio.create_task(self._search(item)) for item in search_plan.searches]
+            inputs = [
+                f"Search term: {item.query}\nReason for searching: {item.reason}"
+                for item in search_plan.searches
+            ]
+            searches = Runner.run_many(search_agent, inputs, on_error="continue")
             results = []
-            for task in asyncio.as_completed(tasks):
-                result = await task
-                if result is not None:
-                    results.append(result)
-                num_completed += 1
+            async for outcome in searches.stream_results():
+                if outcome.result is not None:
+                    results.append(str(outcome.result.final_output))
                 self.printer.update_item(
-                    "searching", f"Searching... {num_completed}/{len(tasks)} completed"
+                    "searching", f"Searching... {searches.completed}/{len(inputs)} completed"
                 )
             self.printer.mark_item_done("searching")
             return results
 
-    async def _search(self, item: WebSearchItem) -> str | None:
-        input = f"Search term: {item.query}\nReason for searching: {item.reason}"
-        try:
-            result = await Runner.run(
-                search_agent,
-                input,
-            )
-            return str(result.final_output)
-        except Exception:
-            return None
-
     async def _write_report(self, query: str, search_results: list[str]) -> ReportData:
         self.printer.update_item("writing", "Thinking about report...")
         input = f"Original query: {query}\nSummarized search results: {search_results}"
@@ -8,12 +8,22 @@ from . import _config
 from .agent import Agent, ToolsToFinalOutputFunction, ToolsToFinalOutputResult
 from .agent_output import AgentOutputSchema, AgentOutputSchemaBase
 from .computer import AsyncComputer, Button, Computer, Environment
+from .context_window import (
+    CompactionContext,
+    ContextWindow,
+    ContextWindowPolicy,
+    DropOldToolOutputs,
+    KeepLastTurns,
+    SummarizeOldTurns,
+    estimate_tokens,
+)
 from .exceptions import (
     AgentsException,
     InputGuardrailTripwireTriggered,
     MaxTurnsExceeded,
     ModelBehaviorError,
     OutputGuardrailTripwireTriggered,
+    StreamSubscriberEvicted,
     UserError,
 )
 from .guardrail import (
@@ -23,7 +33,9 @@ from .guardrail import (
     OutputGuardrail,
     OutputGuardrailResult,
     input_guardrail,
+    input_guardrail_cascade,
     output_guardrail,
+    output_guardrail_cascade,
 )
 from .handoffs import Handoff, HandoffInputData, HandoffInputFilter, handoff
 from .items import (
@@ -36,15 +48,30 @@ from .items import (
     RunItem,
     ToolCallItem,
     ToolCallOutputItem,
+    ToolCallProgressItem,
     TResponseInputItem,
 )
 from .lifecycle import AgentHooks, RunHooks
 from .model_settings import ModelSettings
+from .models.caching import (
+    CachingModel,
+    CachingModelProvider,
+    LRUResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+    TTLResponseCache,
+)
 from .models.interface import Model, ModelProvider, ModelTracing
 from .models.openai_chatcompletions import OpenAIChatCompletionsModel
 from .models.openai_provider import OpenAIProvider
 from .models.openai_responses import OpenAIResponsesModel
-from .result import RunResult, RunResultStreaming
+from .result import (
+    RunManyFailurePolicy,
+    RunManyOutcome,
+    RunManyResult,
+    RunResult,
+    RunResultStreaming,
+)
 from .run import RunConfig, Runner
 from .run_context import RunContextWrapper, TContext
 from .stream_events import (
@@ -53,6 +80,8 @@ from .stream_events import (
     RunItemStreamEvent,
     StreamEvent,
 )
+from .stream_multicast import StreamMulticast, StreamSubscription
+from .stream_queue import StreamBackpressurePolicy, StreamQueueSettings
 from .tool import (
     ComputerTool,
     FileSearchTool,
@@ -63,6 +92,7 @@ from .tool import (
     default_tool_error_function,
     function_tool,
 )
+from .tool_cache import CachedToolResult, DiskToolCache, LRUToolCache, ToolCache, TTLToolCache
 from .tracing import (
     AgentSpanData,
     CustomSpanData,
@@ -157,11 +187,24 @@ __all__ = [
     "OpenAIChatCompletionsModel",
     "OpenAIProvider",
     "OpenAIResponsesModel",
+    "CachingModel",
+    "CachingModelProvider",
+    "ResponseCache",
+    "LRUResponseCache",
+    "TTLResponseCache",
+    "SQLiteResponseCache",
     "AgentOutputSchema",
     "AgentOutputSchemaBase",
     "Computer",
     "AsyncComputer",
     "Environment",
+    "ContextWindow",
+    "ContextWindowPolicy",
+    "CompactionContext",
+    "DropOldToolOutputs",
+    "KeepLastTurns",
+    "SummarizeOldTurns",
+    "estimate_tokens",
     "Button",
     "AgentsException",
     "InputGuardrailTripwireTriggered",
@@ -169,6 +212,7 @@ __all__ = [
     "MaxTurnsExceeded",
     "ModelBehaviorError",
     "UserError",
+    "StreamSubscriberEvicted",
     "InputGuardrail",
     "InputGuardrailResult",
     "OutputGuardrail",
@@ -176,6 +220,8 @@ __all__ = [
     "GuardrailFunctionOutput",
     "input_guardrail",
     "output_guardrail",
+    "input_guardrail_cascade",
+    "output_guardrail_cascade",
     "handoff",
     "Handoff",
     "HandoffInputData",
@@ -188,6 +234,7 @@ __all__ = [
     "HandoffOutputItem",
     "ToolCallItem",
     "ToolCallOutputItem",
+    "ToolCallProgressItem",
     "ReasoningItem",
     "ModelResponse",
     "ItemHelpers",
@@ -197,11 +244,18 @@ __all__ = [
     "TContext",
     "RunResult",
     "RunResultStreaming",
+    "RunManyResult",
+    "RunManyOutcome",
+    "RunManyFailurePolicy",
     "RunConfig",
     "RawResponsesStreamEvent",
     "RunItemStreamEvent",
     "AgentUpdatedStreamEvent",
     "StreamEvent",
+    "StreamQueueSettings",
+    "StreamMulticast",
+    "StreamSubscription",
+    "StreamBackpressurePolicy",
     "FunctionTool",
     "FunctionToolResult",
     "ComputerTool",
@@ -209,6 +263,11 @@ __all__ = [
     "Tool",
     "WebSearchTool",
     "function_tool",
+    "ToolCache",
+    "CachedToolResult",
+    "LRUToolCache",
+    "TTLToolCache",
+    "DiskToolCache",
     "Usage",
     "add_trace_processor",
     "agent_span",
@@ -31,6 +31,7 @@ from openai.types.responses.response_reasoning_item import ResponseReasoningItem
 from .agent import Agent, ToolsToFinalOutputResult
 from .agent_output import AgentOutputSchemaBase
 from .computer import AsyncComputer, Computer
+from .context_window import ContextWindowState
 from .exceptions import AgentsException, ModelBehaviorError, UserError
 from .guardrail import InputGuardrail, InputGuardrailResult, OutputGuardrail, OutputGuardrailResult
 from .handoffs import Handoff, HandoffInputData
@@ -44,6 +45,7 @@ from .items import (
     RunItem,
     ToolCallItem,
     ToolCallOutputItem,
+    ToolCallProgressItem,
     TResponseInputItem,
 )
 from .lifecycle import RunHooks
@@ -52,6 +54,7 @@ from .model_settings import ModelSettings
 from .models.interface import ModelTracing
 from .run_context import RunContextWrapper, TContext
 from .stream_events import RunItemStreamEvent, StreamEvent
+from .stream_queue import StreamEventQueue
 from .tool import ComputerTool, FunctionTool, FunctionToolResult, Tool
 from .tracing import (
     SpanError,
@@ -63,6 +66,8 @@ from .tracing import (
     trace,
 )
 from .util import _coro, _error_tracing
+from .util._tool_executor import ToolExecutors, get_thread_pool, use_tool_executors
+from .util._tool_progress import reporting_tool_progress
 
 if TYPE_CHECKING:
     from .run import RunConfig
@@ -94,6 +99,89 @@ class AgentToolUseTracker:
         return existing_data is not None and len(existing_data[1]) > 0
 
 
+@dataclass
+class InputBuffer:
+    """Append-only model input for a run, holding the original input and the generated items
+    already converted to input items. Each turn only converts the items generated since the
+    previous turn. The buffer is rebuilt from scratch when the history is rewritten, e.g. by a
+    handoff input filter.
+    """
+
+    _original_input: str | list[TResponseInputItem] | None = None
+    _items: list[RunItem] = field(default_factory=list)
+    _converted: list[TResponseInputItem] = field(default_factory=list)
+    context_window_state: ContextWindowState = field(default_factory=ContextWindowState)
+    """State kept by `RunConfig.context_window` between turns of the run."""
+
+    def build(
+        self,
+        original_input: str | list[TResponseInputItem],
+        generated_items: list[RunItem],
+    ) -> list[TResponseInputItem]:
+        """Returns the model input for the given history. The returned list and its items are
+        shallow copies, so callers can append to the list or set an item's keys without affecting
+        later turns, and the original input is copied once so the caller's items are never handed
+        to the model. Values nested inside the items are shared across turns and must not be
+        mutated in place.
+        """
+        if original_input is not self._original_input or not self._extends(generated_items):
+            self._original_input = original_input
+            self._items = []
+            self._converted = ItemHelpers.input_to_new_input_list(original_input)
+
+        for item in generated_items[len(self._items) :]:
+            self._items.append(item)
+            self._converted.append(item.to_input_item())
+
+        # A shallow copy per item is far cheaper than converting the items again.
+        return [item.copy() for item in self._converted]
+
+    def _extends(self, generated_items: list[RunItem]) -> bool:
+        # Identity checks only; comparing items by value would cost as much as converting them.
+        if len(generated_items) < len(self._items):
+            return False
+        return all(new is old for new, old in zip(generated_items, self._items))
+
+
+@dataclass
+class SpeculativeToolCalls:
+    """Function tool calls started while the model response was still streaming, keyed by call ID.
+    When the response is processed, each call is matched with its started task instead of being
+    run again.
+    """
+
+    _started: dict[str, tuple[ResponseFunctionToolCall, asyncio.Task[Any]]] = field(
+        default_factory=dict
+    )
+
+    def add(self, tool_call: ResponseFunctionToolCall, task: asyncio.Task[Any]) -> None:
+        self._started[tool_call.call_id] = (tool_call, task)
+
+    def take(self, tool_call: ResponseFunctionToolCall) -> asyncio.Task[Any] | None:
+        """Returns the task started for this tool call, if any. A task started with different
+        arguments than the final response has is cancelled instead.
+        """
+        started = self._started.pop(tool_call.call_id, None)
+        if started is None:
+            return None
+        started_call, task = started
+        if started_call.name != tool_call.name or started_call.arguments != tool_call.arguments:
+            task.cancel()
+            return None
+        return task
+
+    def cancel_remaining(self) -> None:
+        """Cancels tasks that weren't taken, e.g. because the turn failed."""
+        for _, task in self._started.values():
+            if task.done():
+                if not task.cancelled():
+                    # Nobody will await the task, so retrieve its exception to avoid a warning.
+                    task.exception()
+            else:
+                task.cancel()
+        self._started.clear()
+
+
 @dataclass
 class ToolRunHandoff:
     handoff: Handoff
@@ -199,6 +287,8 @@ class RunImpl:
         hooks: RunHooks[TContext],
         context_wrapper: RunContextWrapper[TContext],
         run_config: RunConfig,
+        event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] | None = None,
+        speculative_calls: SpeculativeToolCalls | None = None,
     ) -> SingleStepResult:
         # Make a copy of the generated items
         pre_step_items = list(pre_step_items)
@@ -214,6 +304,8 @@ class RunImpl:
                 hooks=hooks,
                 context_wrapper=context_wrapper,
                 config=run_config,
+                event_queue=event_queue,
+                speculative_calls=speculative_calls,
             ),
             cls.execute_computer_actions(
                 agent=agent,
@@ -428,53 +520,27 @@ class RunImpl:
         hooks: RunHooks[TContext],
         context_wrapper: RunContextWrapper[TContext],
         config: RunConfig,
+        event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] | None = None,
+        speculative_calls: SpeculativeToolCalls | None = None,
     ) -> list[FunctionToolResult]:
-        async def run_single_tool(
-            func_tool: FunctionTool, tool_call: ResponseFunctionToolCall
-        ) -> Any:
-            with function_span(func_tool.name) as span_fn:
-                if config.trace_include_sensitive_data:
-                    span_fn.span_data.input = tool_call.arguments
-                try:
-                    _, _, result = await asyncio.gather(
-                        hooks.on_tool_start(context_wrapper, agent, func_tool),
-                        (
-                            agent.hooks.on_tool_start(context_wrapper, agent, func_tool)
-                            if agent.hooks
-                            else _coro.noop_coroutine()
-                        ),
-                        func_tool.on_invoke_tool(context_wrapper, tool_call.arguments),
-                    )
-
-                    await asyncio.gather(
-                        hooks.on_tool_end(context_wrapper, agent, func_tool, result),
-                        (
-                            agent.hooks.on_tool_end(context_wrapper, agent, func_tool, result)
-                            if agent.hooks
-                            else _coro.noop_coroutine()
-                        ),
-                    )
-                except Exception as e:
-                    _error_tracing.attach_error_to_current_span(
-                        SpanError(
-                            message="Error running tool",
-                            data={"tool_name": func_tool.name, "error": str(e)},
-                        )
-                    )
-                    if isinstance(e, AgentsException):
-                        raise e
-                    raise UserError(f"Error running tool {func_tool.name}: {e}") from e
-
-                if config.trace_include_sensitive_data:
-                    span_fn.span_data.output = result
-            return result
-
-        tasks = []
+        tasks: list[Awaitable[Any]] = []
         for tool_run in tool_runs:
-            function_tool = tool_run.function_tool
-            tasks.append(run_single_tool(function_tool, tool_run.tool_call))
+            started = speculative_calls.take(tool_run.tool_call) if speculative_calls else None
+            tasks.append(
+                started
+                or cls._run_function_tool(
+                    agent=agent,
+                    func_tool=tool_run.function_tool,
+                    tool_call=tool_run.tool_call,
+                    hooks=hooks,
+                    context_wrapper=context_wrapper,
+                    config=config,
+                    event_queue=event_queue,
+                )
+            )
 
-        results = await asyncio.gather(*tasks)
+        with use_tool_executors(cls._tool_executors(config)):
+            results = await asyncio.gather(*tasks)
 
         return [
             FunctionToolResult(
@@ -489,6 +555,138 @@ class RunImpl:
             for tool_run, result in zip(tool_runs, results)
         ]
 
+    @classmethod
+    def start_speculative_tool_call(
+        cls,
+        *,
+        agent: Agent[TContext],
+        all_tools: list[Tool],
+        tool_call: ResponseFunctionToolCall,
+        speculative_calls: SpeculativeToolCalls,
+        hooks: RunHooks[TContext],
+        context_wrapper: RunContextWrapper[TContext],
+        config: RunConfig,
+        event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] | None = None,
+    ) -> None:
+        """Starts a function tool call whose arguments are complete while the rest of the model
+        response is still streaming, if the tool is marked `speculative`.
+        """
+        func_tool = next(
+            (
+                tool
+                for tool in all_tools
+                if isinstance(tool, FunctionTool) and tool.name == tool_call.name
+            ),
+            None,
+        )
+        if func_tool is None or not func_tool.speculative:
+            return
+
+        # The task copies the current context, so the tool runs on this run's executors and in
+        # the current trace, as it would if started after the response.
+        with use_tool_executors(cls._tool_executors(config)):
+            task = asyncio.create_task(
+                cls._run_function_tool(
+                    agent=agent,
+                    func_tool=func_tool,
+                    tool_call=tool_call,
+                    hooks=hooks,
+                    context_wrapper=context_wrapper,
+                    config=config,
+                    event_queue=event_queue,
+                )
+            )
+        speculative_calls.add(tool_call, task)
+
+    @classmethod
+    async def _run_function_tool(
+        cls,
+        *,
+        agent: Agent[TContext],
+        func_tool: FunctionTool,
+        tool_call: ResponseFunctionToolCall,
+        hooks: RunHooks[TContext],
+        context_wrapper: RunContextWrapper[TContext],
+        config: RunConfig,
+        event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] | None,
+    ) -> Any:
+        if event_queue is None:
+            return await cls._run_traced_function_tool(
+                agent, func_tool, tool_call, hooks, context_wrapper, config
+            )
+
+        # Partial outputs of streaming tools are surfaced as they arrive.
+        def stream_progress(partial_output: Any) -> None:
+            item = ToolCallProgressItem(
+                agent=agent,
+                raw_item=ItemHelpers.tool_call_output_item(tool_call, str(partial_output)),
+                output=partial_output,
+            )
+            event_queue.put_nowait(RunItemStreamEvent(item=item, name="tool_progress"))
+
+        with reporting_tool_progress(stream_progress):
+            return await cls._run_traced_function_tool(
+                agent, func_tool, tool_call, hooks, context_wrapper, config
+            )
+
+    @classmethod
+    async def _run_traced_function_tool(
+        cls,
+        agent: Agent[TContext],
+        func_tool: FunctionTool,
+        tool_call: ResponseFunctionToolCall,
+        hooks: RunHooks[TContext],
+        context_wrapper: RunContextWrapper[TContext],
+        config: RunConfig,
+    ) -> Any:
+        with function_span(func_tool.name) as span_fn:
+            if config.trace_include_sensitive_data:
+                span_fn.span_data.input = tool_call.arguments
+            try:
+                _, _, result = await asyncio.gather(
+                    hooks.on_tool_start(context_wrapper, agent, func_tool),
+                    (
+                        agent.hooks.on_tool_start(context_wrapper, agent, func_tool)
+                        if agent.hooks
+                        else _coro.noop_coroutine()
+                    ),
+                    func_tool.on_invoke_tool(context_wrapper, tool_call.arguments),
+                )
+
+                await asyncio.gather(
+                    hooks.on_tool_end(context_wrapper, agent, func_tool, result),
+                    (
+                        agent.hooks.on_tool_end(context_wrapper, agent, func_tool, result)
+                        if agent.hooks
+                        else _coro.noop_coroutine()
+                    ),
+                )
+            except Exception as e:
+                _error_tracing.attach_error_to_current_span(
+                    SpanError(
+                        message="Error running tool",
+                        data={"tool_name": func_tool.name, "error": str(e)},
+                    )
+                )
+                if isinstance(e, AgentsException):
+                    raise e
+                raise UserError(f"Error running tool {func_tool.name}: {e}") from e
+
+            if config.trace_include_sensitive_data:
+                span_fn.span_data.output = result
+        return result
+
+    @staticmethod
+    def _tool_executors(config: RunConfig) -> ToolExecutors:
+        return ToolExecutors(
+            thread_pool=(
+                get_thread_pool(config.tool_executor_max_workers)
+                if config.tool_executor_max_workers
+                else None
+            ),
+            process_pool_max_workers=config.tool_process_pool_max_workers,
+        )
+
     @classmethod
     async def execute_computer_actions(
         cls,
@@ -712,7 +910,7 @@ class RunImpl:
     def stream_step_result_to_queue(
         cls,
         step_result: SingleStepResult,
-        queue: asyncio.Queue[StreamEvent | QueueCompleteSentinel],
+        queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel],
     ):
         for item in step_result.new_step_items:
             if isinstance(item, MessageOutputItem):
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import abc
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .items import ItemHelpers, TResponseInputItem
+from .logger import logger
+from .model_settings import ModelSettings
+from .models.interface import Model, ModelProvider, ModelTracing
+from .run_context import RunContextWrapper
+
+TokenEstimator = Callable[[TResponseInputItem], int]
+"""Estimates how many tokens an input item takes up in the model's context."""
+
+_MODEL_OUTPUT_TYPES = frozenset(
+    {"function_call", "computer_call", "reasoning", "file_search_call", "web_search_call"}
+)
+_TOOL_OUTPUT_TYPES = frozenset({"function_call_output", "computer_call_output"})
+
+DEFAULT_SUMMARY_INSTRUCTIONS = (
+    "You compress the history of a conversation between a user and an AI assistant that uses "
+    "tools. Write a concise summary of the transcript you are given, keeping the user's goals, "
+    "decisions made, facts learned from tool results and any open questions. If the transcript "
+    "starts with an earlier summary, merge it into yours."
+)
+
+
+def estimate_tokens(item: TResponseInputItem) -> int:
+    """A provider-agnostic estimate of the tokens in an input item: about four characters of text
+    per token, plus a small overhead for the item's framing.
+    """
+    return 4 + _text_length(item) // 4
+
+
+def _text_length(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_text_length(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_text_length(v) for v in value)
+    return 0
+
+
+@dataclass
+class ContextWindowState:
+    """Per-run state kept between turns: token estimates for items already seen, and anything a
+    policy wants to reuse, such as a summary of older turns.
+    """
+
+    estimates: dict[int, tuple[TResponseInputItem, int]] = field(default_factory=dict)
+    policy_state: dict[int, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CompactionContext:
+    """What a `ContextWindowPolicy` gets to work with when the input is over budget."""
+
+    max_tokens: int
+    """The number of tokens the input items must fit in."""
+
+    estimator: TokenEstimator
+    """The estimator used for the budget."""
+
+    model_provider: ModelProvider
+    """The run's model provider, for policies that call a model."""
+
+    tracing: ModelTracing
+    """The run's tracing configuration, for policies that call a model."""
+
+    context_wrapper: RunContextWrapper[Any]
+    """The run context. Policies that call a model should add its usage to the run's usage."""
+
+    state: ContextWindowState
+    """State kept for the rest of the run."""
+
+    def tokens(self, items: Sequence[TResponseInputItem]) -> int:
+        """Returns the estimated tokens in `items`. Estimates are cached for the rest of the run,
+        since the same items are sent again on every turn.
+        """
+        total = 0
+        estimates = self.state.estimates
+        for item in items:
+            cached = estimates.get(id(item))
+            if cached is None or cached[0] is not item:
+                cached = estimates[id(item)] = (item, self.estimator(item))
+            total += cached[1]
+        return total
+
+    def fits(self, items: Sequence[TResponseInputItem]) -> bool:
+        return self.tokens(items) <= self.max_tokens
+
+
+class ContextWindowPolicy(abc.ABC):
+    """Decides how to shrink the model input when it exceeds the `ContextWindow` budget.
+    Policies must not split a tool call from its output, and must not mutate the input items,
+    which are shared across turns.
+    """
+
+    @abc.abstractmethod
+    async def compact(
+        self, items: list[TResponseInputItem], context: CompactionContext
+    ) -> list[TResponseInputItem]:
+        """Returns a smaller input, ideally one that fits in `context.max_tokens`."""
+        pass
+
+
+class DropOldToolOutputs(ContextWindowPolicy):
+    """Replaces the outputs of the oldest function tool calls with a short placeholder, until the
+    input fits. The calls themselves stay, so the model can still see what it did and call a tool
+    again if it needs the result. Outputs in the last `keep_last_turns` turns are never dropped.
+    """
+
+    def __init__(
+        self,
+        keep_last_turns: int = 1,
+        placeholder: str = "[Tool output removed to save context.]",
+    ) -> None:
+        self.keep_last_turns = keep_last_turns
+        self.placeholder = placeholder
+
+    async def compact(
+        self, items: list[TResponseInputItem], context: CompactionContext
+    ) -> list[TResponseInputItem]:
+        _, turns = split_turns(items)
+        recent = turns[-self.keep_last_turns :] if self.keep_last_turns > 0 else []
+        protected = sum(len(turn) for turn in recent)
+
+        compacted = list(items)
+        total = context.tokens(compacted)
+        for index in range(len(compacted) - protected):
+            if total <= context.max_tokens:
+                break
+            item = compacted[index]
+            if _item_type(item) != "function_call_output" or item.get("output") == self.placeholder:
+                continue
+            replacement: TResponseInputItem = {**item, "output": self.placeholder}  # type: ignore
+            total += context.tokens([replacement]) - context.tokens([item])
+            compacted[index] = replacement
+        return compacted
+
+
+class KeepLastTurns(ContextWindowPolicy):
+    """Drops all but the last `turns` turns. A turn is a model response plus the outputs of the
+    tools it called, or a new user message. The original input before the first model response is
+    kept unless `keep_initial_input` is False.
+    """
+
+    def __init__(self, turns: int, keep_initial_input: bool = True) -> None:
+        self.turns = turns
+        self.keep_initial_input = keep_initial_input
+
+    async def compact(
+        self, items: list[TResponseInputItem], context: CompactionContext
+    ) -> list[TResponseInputItem]:
+        leading, turns = split_turns(items)
+        kept = turns[-self.turns :] if self.turns > 0 else []
+        return (leading if self.keep_initial_input else []) + [
+            item for turn in kept for item in turn
+        ]
+
+
+class SummarizeOldTurns(ContextWindowPolicy):
+    """Replaces all but the last `keep_last_turns` turns with a summary written by `model`,
+    usually a small, cheap one. The summary is reused on later turns for as long as the input
+    fits, and is extended with the newly aged-out turns once it doesn't. The original input before
+    the first model response is always kept.
+    """
+
+    def __init__(
+        self,
+        model: str | Model,
+        keep_last_turns: int = 2,
+        instructions: str = DEFAULT_SUMMARY_INSTRUCTIONS,
+        model_settings: ModelSettings | None = None,
+    ) -> None:
+        self.model = model
+        self.keep_last_turns = keep_last_turns
+        self.instructions = instructions
+        self.model_settings = model_settings or ModelSettings()
+
+    async def compact(
+        self, items: list[TResponseInputItem], context: CompactionContext
+    ) -> list[TResponseInputItem]:
+        leading, turns = split_turns(items)
+        if len(turns) <= self.keep_last_turns:
+            return items
+        middle = items[len(leading) :]
+
+        previous: tuple[list[TResponseInputItem], TResponseInputItem] | None = (
+            context.state.policy_state.get(id(self))
+        )
+        summarized: list[TResponseInputItem] = []
+        summary: TResponseInputItem | None = None
+        if previous is not None and _is_prefix(previous[0], middle):
+            summarized, summary = previous
+            candidate = leading + [summary] + middle[len(summarized) :]
+            if context.fits(candidate):
+                return candidate
+
+        recent = turns[-self.keep_last_turns :] if self.keep_last_turns > 0 else []
+        aged_out = len(middle) - sum(len(turn) for turn in recent)
+        to_summarize = middle[len(summarized) : aged_out]
+        if not to_summarize:
+            return items if summary is None else leading + [summary] + middle[len(summarized) :]
+
+        summary = await self._summarize(summary, to_summarize, context)
+        summarized = middle[:aged_out]
+        context.state.policy_state[id(self)] = (summarized, summary)
+        return leading + [summary] + middle[aged_out:]
+
+    async def _summarize(
+        self,
+        previous_summary: TResponseInputItem | None,
+        items: list[TResponseInputItem],
+        context: CompactionContext,
+    ) -> TResponseInputItem:
+        model = (
+            context.model_provider.get_model(self.model)
+            if isinstance(self.model, str)
+            else self.model
+        )
+        transcript = "\n".join(
+            render_item(item) for item in ([previous_summary] if previous_summary else []) + items
+        )
+        response = await model.get_response(
+            system_instructions=self.instructions,
+            input=transcript,
+            model_settings=self.model_settings,
+            tools=[],
+            output_schema=None,
+            handoffs=[],
+            tracing=context.tracing,
+            previous_response_id=None,
+        )
+        context.context_wrapper.add_usage(
+            response.usage,
+            model_name=self.model if isinstance(self.model, str) else type(self.model).__name__,
+        )
+        text = "".join(ItemHelpers.extract_last_text(item) or "" for item in response.output)
+        return {"role": "user", "content": f"Summary of the earlier conversation:\n{text}"}
+
+
+@dataclass
+class ContextWindow:
+    """Keeps the model input within a token budget, whatever the model provider. Before each model
+    call, the system instructions and input items are estimated, and if they exceed `max_tokens`
+    the `policy` shrinks the input. The run's history itself is not changed.
+    """
+
+    max_tokens: int
+    """The budget for the system instructions and input items, in estimated tokens. Leave room
+    for tool schemas and the model's output.
+    """
+
+    policy: ContextWindowPolicy = field(default_factory=DropOldToolOutputs)
+    """What to do when the input is over budget. Defaults to dropping old tool outputs."""
+
+    estimator: TokenEstimator = estimate_tokens
+    """Estimates the tokens in an input item. Plug in a real tokenizer for tighter budgets."""
+
+    async def fit(
+        self,
+        input: list[TResponseInputItem],
+        system_instructions: str | None,
+        *,
+        state: ContextWindowState,
+        model_provider: ModelProvider,
+        tracing: ModelTracing,
+        context_wrapper: RunContextWrapper[Any],
+    ) -> list[TResponseInputItem]:
+        """Returns `input`, compacted by the policy if it's over budget."""
+        reserved = (
+            self.estimator({"role": "system", "content": system_instructions})
+            if system_instructions
+            else 0
+        )
+        context = CompactionContext(
+            max_tokens=self.max_tokens - reserved,
+            estimator=self.estimator,
+            model_provider=model_provider,
+            tracing=tracing,
+            context_wrapper=context_wrapper,
+            state=state,
+        )
+        if context.fits(input):
+            return input
+
+        compacted = await self.policy.compact(input, context)
+        if not context.fits(compacted):
+            logger.warning(
+                f"Model input is still over the context window budget of {self.max_tokens} "
+                f"tokens after compaction ({context.tokens(compacted) + reserved} tokens)"
+            )
+        return compacted
+
+
+def split_turns(
+    items: Sequence[TResponseInputItem],
+) -> tuple[list[TResponseInputItem], list[list[TResponseInputItem]]]:
+    """Splits input items into the leading input (everything before the first model output) and
+    turns. A turn is a model response plus the outputs of the tools it called, or a run of input
+    messages, so a tool call and its output are always in the same turn.
+    """
+    leading: list[TResponseInputItem] = []
+    turns: list[list[TResponseInputItem]] = []
+    previous_kind: str | None = None
+    for item in items:
+        kind = _item_kind(item)
+        if not turns and kind == "input":
+            leading.append(item)
+        elif not turns or (kind != "tool_output" and kind != previous_kind):
+            turns.append([item])
+        else:
+            turns[-1].append(item)
+        previous_kind = kind
+    return leading, turns
+
+
+def render_item(item: TResponseInputItem) -> str:
+    """Renders an input item as a line of transcript text."""
+    item_type = _item_type(item)
+    if item_type == "function_call":
+        return f"[tool call] {item.get('name')}({item.get('arguments')})"
+    if item_type == "function_call_output":
+        return f"[tool output] {item.get('output')}"
+    if item_type == "message" or "role" in item:
+        content: Any = item.get("content")
+        if not isinstance(content, str):
+            content = " ".join(
+                str(part.get("text") or part.get("refusal") or "")
+                for part in content or []
+                if isinstance(part, dict)
+            )
+        return f"[{item.get('role')}] {content}"
+    return f"[{item_type}] {json.dumps(item, default=str)}"
+
+
+def _item_type(item: TResponseInputItem) -> str | None:
+    return item.get("type")
+
+
+def _item_kind(item: TResponseInputItem) -> str:
+    item_type = _item_type(item)
+    if item_type in _TOOL_OUTPUT_TYPES:
+        return "tool_output"
+    if item_type in _MODEL_OUTPUT_TYPES or item.get("role") == "assistant":
+        return "model"
+    return "input"
+
+
+def _is_prefix(prefix: list[TResponseInputItem], items: list[TResponseInputItem]) -> bool:
+    # Each turn's input items are shallow copies sharing their values, so comparing them only
+    # compares those values by identity.
+    return len(prefix) <= len(items) and all(a is b or a == b for a, b in zip(prefix, items))
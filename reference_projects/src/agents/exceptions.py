@@ -37,6 +37,16 @@ class UserError(AgentsException):
         self.message = message
 
 
+class StreamSubscriberEvicted(AgentsException):
+    """Exception raised to a stream subscriber that fell too far behind the run's events."""
+
+    message: str
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
 class InputGuardrailTripwireTriggered(AgentsException):
     """Exception raised when a guardrail tripwire is triggered."""
 
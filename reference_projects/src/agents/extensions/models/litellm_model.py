@@ -101,12 +101,17 @@ class LitellmModel(Model):
 
             if hasattr(response, "usage"):
                 response_usage = response.usage
+                # LiteLLM passes on the provider's token details when it has them.
+                prompt_details = getattr(response_usage, "prompt_tokens_details", None)
+                completion_details = getattr(response_usage, "completion_tokens_details", None)
                 usage = (
                     Usage(
                         requests=1,
                         input_tokens=response_usage.prompt_tokens,
                         output_tokens=response_usage.completion_tokens,
                         total_tokens=response_usage.total_tokens,
+                        cached_input_tokens=getattr(prompt_details, "cached_tokens", None) or 0,
+                        reasoning_tokens=getattr(completion_details, "reasoning_tokens", None) or 0,
                     )
                     if response.usage
                     else Usage()
@@ -4,7 +4,7 @@ import contextlib
 import inspect
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Literal, get_args, get_origin, get_type_hints
 
 from griffe import Docstring, DocstringSectionKind
@@ -37,38 +37,64 @@ class FuncSchema:
     """Whether the JSON schema is in strict mode. We **strongly** recommend setting this to True,
     as it increases the likelihood of correct JSON input."""
 
+    _binder: _ArgumentBinder = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._binder = _ArgumentBinder(self.signature, self.takes_context)
+
+    def validate_json(self, input: str) -> BaseModel:
+        """
+        Validates the raw JSON arguments the model produced, in a single pass. An empty string is
+        treated as no arguments. Raises `pydantic.ValidationError` if the input isn't valid JSON or
+        doesn't match the parameters.
+        """
+        return self.params_pydantic_model.model_validate_json(input or "{}")
+
     def to_call_args(self, data: BaseModel) -> tuple[list[Any], dict[str, Any]]:
         """
         Converts validated data from the Pydantic model into (args, kwargs), suitable for calling
         the original function.
         """
-        positional_args: list[Any] = []
-        keyword_args: dict[str, Any] = {}
-        seen_var_positional = False
+        return self._binder.bind(data)
 
-        # Use enumerate() so we can skip the first parameter if it's context.
-        for idx, (name, param) in enumerate(self.signature.parameters.items()):
+
+class _ArgumentBinder:
+    """Maps validated parameters to (args, kwargs). How each parameter is passed only depends on
+    the signature, so it's worked out once rather than on every call.
+    """
+
+    def __init__(self, signature: inspect.Signature, takes_context: bool) -> None:
+        self.positional: list[str] = []
+        self.var_positional: str | None = None
+        self.keyword: list[str] = []
+        self.var_keyword: str | None = None
+
+        for idx, (name, param) in enumerate(signature.parameters.items()):
             # If the function takes a RunContextWrapper and this is the first parameter, skip it.
-            if self.takes_context and idx == 0:
+            if takes_context and idx == 0:
                 continue
 
-            value = getattr(data, name, None)
             if param.kind == param.VAR_POSITIONAL:
-                # e.g. *args: extend positional args and mark that *args is now seen
-                positional_args.extend(value or [])
-                seen_var_positional = True
+                self.var_positional = name
             elif param.kind == param.VAR_KEYWORD:
-                # e.g. **kwargs handling
-                keyword_args.update(value or {})
-            elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
-                # Before *args, add to positional args. After *args, add to keyword args.
-                if not seen_var_positional:
-                    positional_args.append(value)
-                else:
-                    keyword_args[name] = value
+                self.var_keyword = name
+            elif (
+                param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+                and self.var_positional is None
+            ):
+                self.positional.append(name)
             else:
-                # For KEYWORD_ONLY parameters, always use keyword args.
-                keyword_args[name] = value
+                # Keyword-only parameters, and positional ones after *args, are passed by keyword.
+                self.keyword.append(name)
+
+    def bind(self, data: BaseModel) -> tuple[list[Any], dict[str, Any]]:
+        values = data.__dict__
+        positional_args = [values.get(name) for name in self.positional]
+        if self.var_positional is not None:
+            positional_args.extend(values.get(self.var_positional) or [])
+        keyword_args = {name: values.get(name) for name in self.keyword}
+        if self.var_keyword is not None:
+            keyword_args.update(values.get(self.var_keyword) or {})
         return positional_args, keyword_args
 
 
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import inspect
+import json
 from collections.abc import Awaitable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Generic, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, Union, cast, overload
 
 from typing_extensions import TypeVar
 
 from .exceptions import UserError
 from .items import TResponseInputItem
+from .logger import logger
 from .run_context import RunContextWrapper, TContext
+from .tool_cache import ToolCache
+from .util._json import canonical_json_default
 from .util._types import MaybeAwaitable
 
 if TYPE_CHECKING:
@@ -96,6 +101,14 @@ class InputGuardrail(Generic[TContext]):
     function's name.
     """
 
+    cache: ToolCache | None = None
+    """If provided, verdicts are stored in this cache, keyed on the guardrail's name and a digest
+    of its input, and reused for identical inputs. Only use it for guardrails whose verdict depends
+    on nothing but the input. Input items must be made of JSON types, pydantic models, dataclasses,
+    enums, sets, bytes, dates and times, paths, decimals or UUIDs; anything else raises a
+    `UserError`, since it has no stable digest.
+    """
+
     def get_name(self) -> str:
         if self.name:
             return self.name
@@ -111,16 +124,15 @@ class InputGuardrail(Generic[TContext]):
         if not callable(self.guardrail_function):
             raise UserError(f"Guardrail function must be callable, got {self.guardrail_function}")
 
-        output = self.guardrail_function(context, agent, input)
-        if inspect.isawaitable(output):
-            return InputGuardrailResult(
-                guardrail=self,
-                output=await output,
-            )
+        async def call() -> GuardrailFunctionOutput:
+            output = self.guardrail_function(context, agent, input)
+            if inspect.isawaitable(output):
+                return await output
+            return output
 
         return InputGuardrailResult(
             guardrail=self,
-            output=output,
+            output=await _run_cached(self.cache, "input", self.get_name(), input, call),
         )
 
 
@@ -150,6 +162,14 @@ class OutputGuardrail(Generic[TContext]):
     function's name.
     """
 
+    cache: ToolCache | None = None
+    """If provided, verdicts are stored in this cache, keyed on the guardrail's name and a digest
+    of the agent output, and reused for identical outputs. Only use it for guardrails whose verdict
+    depends on nothing but the output. The output must be made of JSON types, pydantic models,
+    dataclasses, enums, sets, bytes, dates and times, paths, decimals or UUIDs; anything else
+    raises a `UserError`, since it has no stable digest.
+    """
+
     def get_name(self) -> str:
         if self.name:
             return self.name
@@ -162,23 +182,21 @@ class OutputGuardrail(Generic[TContext]):
         if not callable(self.guardrail_function):
             raise UserError(f"Guardrail function must be callable, got {self.guardrail_function}")
 
-        output = self.guardrail_function(context, agent, agent_output)
-        if inspect.isawaitable(output):
-            return OutputGuardrailResult(
-                guardrail=self,
-                agent=agent,
-                agent_output=agent_output,
-                output=await output,
-            )
+        async def call() -> GuardrailFunctionOutput:
+            output = self.guardrail_function(context, agent, agent_output)
+            if inspect.isawaitable(output):
+                return await output
+            return output
 
         return OutputGuardrailResult(
             guardrail=self,
             agent=agent,
             agent_output=agent_output,
-            output=output,
+            output=await _run_cached(self.cache, "output", self.get_name(), agent_output, call),
         )
 
 
+T = TypeVar("T")
 TContext_co = TypeVar("TContext_co", bound=Any, covariant=True)
 
 # For InputGuardrail
@@ -208,6 +226,7 @@ def input_guardrail(
 def input_guardrail(
     *,
     name: str | None = None,
+    cache: ToolCache | None = None,
 ) -> Callable[
     [_InputGuardrailFuncSync[TContext_co] | _InputGuardrailFuncAsync[TContext_co]],
     InputGuardrail[TContext_co],
@@ -220,6 +239,7 @@ def input_guardrail(
     | None = None,
     *,
     name: str | None = None,
+    cache: ToolCache | None = None,
 ) -> (
     InputGuardrail[TContext_co]
     | Callable[
@@ -236,12 +256,14 @@ def input_guardrail(
 
         @input_guardrail(name="guardrail_name")
         async def my_async_guardrail(...): ...
+
+    Pass `cache=` to reuse verdicts for identical inputs.
     """
 
     def decorator(
         f: _InputGuardrailFuncSync[TContext_co] | _InputGuardrailFuncAsync[TContext_co],
     ) -> InputGuardrail[TContext_co]:
-        return InputGuardrail(guardrail_function=f, name=name)
+        return InputGuardrail(guardrail_function=f, name=name, cache=cache)
 
     if func is not None:
         # Decorator was used without parentheses
@@ -277,6 +299,7 @@ def output_guardrail(
 def output_guardrail(
     *,
     name: str | None = None,
+    cache: ToolCache | None = None,
 ) -> Callable[
     [_OutputGuardrailFuncSync[TContext_co] | _OutputGuardrailFuncAsync[TContext_co]],
     OutputGuardrail[TContext_co],
@@ -289,6 +312,7 @@ def output_guardrail(
     | None = None,
     *,
     name: str | None = None,
+    cache: ToolCache | None = None,
 ) -> (
     OutputGuardrail[TContext_co]
     | Callable[
@@ -305,12 +329,14 @@ def output_guardrail(
 
         @output_guardrail(name="guardrail_name")
         async def my_async_guardrail(...): ...
+
+    Pass `cache=` to reuse verdicts for identical outputs.
     """
 
     def decorator(
         f: _OutputGuardrailFuncSync[TContext_co] | _OutputGuardrailFuncAsync[TContext_co],
     ) -> OutputGuardrail[TContext_co]:
-        return OutputGuardrail(guardrail_function=f, name=name)
+        return OutputGuardrail(guardrail_function=f, name=name, cache=cache)
 
     if func is not None:
         # Decorator was used without parentheses
@@ -318,3 +344,123 @@ def output_guardrail(
 
     # Decorator used with keyword arguments
     return decorator
+
+
+_InputGuardrailStageFunc = Callable[
+    [RunContextWrapper[Any], "Agent[Any]", Union[str, list[TResponseInputItem]]],
+    MaybeAwaitable[Optional[GuardrailFunctionOutput]],
+]
+_OutputGuardrailStageFunc = Callable[
+    [RunContextWrapper[Any], "Agent[Any]", Any],
+    MaybeAwaitable[Optional[GuardrailFunctionOutput]],
+]
+
+
+def input_guardrail_cascade(
+    *stages: InputGuardrail[Any] | _InputGuardrailStageFunc,
+    name: str | None = None,
+    cache: ToolCache | None = None,
+) -> InputGuardrail[Any]:
+    """Combines stages into one input guardrail that runs them in order, cheapest first, and stops
+    at the first verdict. A stage is either an `InputGuardrail`, whose verdict is always final, or
+    a function with the guardrail signature that returns `None` when it's unsure, e.g. a regex or
+    keyword check that only recognizes clear cases. Later, more expensive stages such as LLM
+    guardrails only run for inputs the earlier ones were unsure about. If every stage is unsure,
+    the tripwire isn't triggered.
+
+    Args:
+        stages: The stages, in the order to run them.
+        name: The name of the combined guardrail. Defaults to the stage names joined with " > ".
+        cache: If provided, the combined verdicts are cached, as with `InputGuardrail.cache`.
+    """
+    if not stages:
+        raise UserError("A guardrail cascade needs at least one stage")
+    stage_names = [_stage_name(stage) for stage in stages]
+
+    async def cascade(
+        context: RunContextWrapper[Any], agent: Agent[Any], input: str | list[TResponseInputItem]
+    ) -> GuardrailFunctionOutput:
+        for stage, stage_name in zip(stages, stage_names):
+            if isinstance(stage, InputGuardrail):
+                output: GuardrailFunctionOutput | None = (
+                    await stage.run(agent, input, context)
+                ).output
+            else:
+                output = await _maybe_await(stage(context, agent, input))
+            if output is not None:
+                logger.debug("Guardrail cascade decided at stage %s", stage_name)
+                return output
+        return GuardrailFunctionOutput(output_info=None, tripwire_triggered=False)
+
+    return InputGuardrail(
+        guardrail_function=cascade, name=name or " > ".join(stage_names), cache=cache
+    )
+
+
+def output_guardrail_cascade(
+    *stages: OutputGuardrail[Any] | _OutputGuardrailStageFunc,
+    name: str | None = None,
+    cache: ToolCache | None = None,
+) -> OutputGuardrail[Any]:
+    """Combines stages into one output guardrail that runs them in order, cheapest first, and
+    stops at the first verdict. See `input_guardrail_cascade`.
+    """
+    if not stages:
+        raise UserError("A guardrail cascade needs at least one stage")
+    stage_names = [_stage_name(stage) for stage in stages]
+
+    async def cascade(
+        context: RunContextWrapper[Any], agent: Agent[Any], agent_output: Any
+    ) -> GuardrailFunctionOutput:
+        for stage, stage_name in zip(stages, stage_names):
+            if isinstance(stage, OutputGuardrail):
+                output: GuardrailFunctionOutput | None = (
+                    await stage.run(context, agent, agent_output)
+                ).output
+            else:
+                output = await _maybe_await(stage(context, agent, agent_output))
+            if output is not None:
+                logger.debug("Guardrail cascade decided at stage %s", stage_name)
+                return output
+        return GuardrailFunctionOutput(output_info=None, tripwire_triggered=False)
+
+    return OutputGuardrail(
+        guardrail_function=cascade, name=name or " > ".join(stage_names), cache=cache
+    )
+
+
+def _stage_name(stage: Any) -> str:
+    if isinstance(stage, (InputGuardrail, OutputGuardrail)):
+        return stage.get_name()
+    return getattr(stage, "__name__", type(stage).__name__)
+
+
+async def _maybe_await(value: MaybeAwaitable[T]) -> T:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _run_cached(
+    cache: ToolCache | None,
+    kind: str,
+    name: str,
+    value: Any,
+    call: Callable[[], Awaitable[GuardrailFunctionOutput]],
+) -> GuardrailFunctionOutput:
+    if cache is None:
+        return await call()
+
+    output, hit = await cache.get_or_compute(_guardrail_cache_key(kind, name, value), call)
+    if hit:
+        logger.debug("Guardrail %s verdict served from cache", name)
+    return cast(GuardrailFunctionOutput, output)
+
+
+def _guardrail_cache_key(kind: str, name: str, value: Any) -> str:
+    # The checked value can be long, e.g. a whole conversation, so keys hold a digest of it.
+    payload = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=canonical_json_default
+    )
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return json.dumps([f"{kind}_guardrail", name, digest])
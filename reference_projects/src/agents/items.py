@@ -137,6 +137,22 @@ class ToolCallOutputItem(RunItemBase[Union[FunctionCallOutput, ComputerCallOutpu
     type: Literal["tool_call_output_item"] = "tool_call_output_item"
 
 
+@dataclass
+class ToolCallProgressItem(RunItemBase[FunctionCallOutput]):
+    """Represents a partial output of a streaming function tool, i.e. one created from an async
+    generator function. These are only surfaced as stream events while the tool runs; they aren't
+    part of the run's items or sent to the model, which only sees the tool's final output.
+    """
+
+    raw_item: FunctionCallOutput
+    """A string representation of the partial output, in the shape of a tool call output."""
+
+    output: Any
+    """The partial output, i.e. the value the tool yielded."""
+
+    type: Literal["tool_call_progress_item"] = "tool_call_progress_item"
+
+
 @dataclass
 class ReasoningItem(RunItemBase[ResponseReasoningItem]):
     """Represents a reasoning item."""
@@ -153,6 +169,7 @@ RunItem: TypeAlias = Union[
     HandoffOutputItem,
     ToolCallItem,
     ToolCallOutputItem,
+    ToolCallProgressItem,
     ReasoningItem,
 ]
 """An item generated by an agent."""
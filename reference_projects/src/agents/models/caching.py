@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from openai.types.responses import (
+    Response,
+    ResponseCompletedEvent,
+    ResponseContentPartAddedEvent,
+    ResponseContentPartDoneEvent,
+    ResponseCreatedEvent,
+    ResponseFunctionCallArgumentsDeltaEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputItem,
+    ResponseOutputItemAddedEvent,
+    ResponseOutputItemDoneEvent,
+    ResponseOutputMessage,
+    ResponseOutputText,
+    ResponseRefusalDeltaEvent,
+    ResponseTextDeltaEvent,
+    ResponseUsage,
+)
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+from pydantic import TypeAdapter
+
+from ..agent_output import AgentOutputSchemaBase
+from ..handoffs import Handoff
+from ..items import ModelResponse, TResponseInputItem, TResponseStreamEvent
+from ..logger import logger
+from ..tool import ComputerTool, FunctionTool, Tool
+from ..usage import Usage
+from ..util._json import canonical_json_default
+from ..util._lru import LRUStore
+from .fake_id import FAKE_RESPONSES_ID
+from .interface import Model, ModelProvider, ModelTracing
+
+if TYPE_CHECKING:
+    from ..model_settings import ModelSettings
+
+_output_adapter: TypeAdapter[list[ResponseOutputItem]] = TypeAdapter(list[ResponseOutputItem])
+
+
+class ResponseCache(abc.ABC):
+    """Stores model responses for `CachingModel`, keyed by a digest of the full request."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> ModelResponse | None:
+        """Returns the response stored under `key`, or `None` if there is none."""
+        pass
+
+    @abc.abstractmethod
+    async def set(self, key: str, response: ModelResponse) -> None:
+        """Stores a response under `key`."""
+        pass
+
+
+class LRUResponseCache(ResponseCache):
+    """An in-memory cache that keeps the `maxsize` most recently used responses. If `ttl` is set,
+    responses also expire that many seconds after they were stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        self._store: LRUStore[ModelResponse] = LRUStore(maxsize, ttl)
+
+    @property
+    def maxsize(self) -> int:
+        return self._store.maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        return self._store.ttl
+
+    async def get(self, key: str) -> ModelResponse | None:
+        return self._store.get(key)
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        self._store.set(key, response)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+class TTLResponseCache(LRUResponseCache):
+    """An in-memory cache whose responses expire `ttl` seconds after they were stored. At most
+    `maxsize` responses are kept, evicting the least recently used.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """A cache that stores responses as JSON in a SQLite database at `path`, so they survive
+    restarts and can be shared by processes on the same machine, e.g. across CI jobs. If `ttl` is
+    set, responses expire that many seconds after they were stored.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], ttl: float | None = None) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    async def get(self, key: str) -> ModelResponse | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, response: ModelResponse) -> None:
+        data = json.dumps(model_response_to_json(response))
+        await asyncio.to_thread(self._write, key, data)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _read(self, key: str) -> ModelResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            data, created_at = row
+            if self.ttl is not None and created_at + self.ttl <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        try:
+            return model_response_from_json(json.loads(data))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable response cache entry {key}: {e}")
+            return None
+
+    def _write(self, key: str, data: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+
+
+class CachingModel(Model):
+    """Wraps a model so that identical requests are answered from a `ResponseCache` instead of
+    calling the model again. Requests are identical if they have the same model, settings,
+    system instructions, input, tools, handoffs, output schema and previous response ID.
+
+    Cached responses are replayed from `stream_response()` as a synthetic event stream, so
+    responses cached from a streamed run can be reused by a non-streamed one and vice versa.
+    Cache hits report empty usage, since no request was made.
+
+    Only use this where repeating an earlier answer is acceptable, e.g. evals or tests, since it
+    turns off the model's sampling randomness.
+    """
+
+    def __init__(self, model: Model, cache: ResponseCache, model_name: str | None = None) -> None:
+        self.wrapped_model = model
+        self.cache = cache
+        wrapped_name = getattr(model, "model", None)
+        self.model_name = model_name or (
+            wrapped_name if isinstance(wrapped_name, str) else type(model).__qualname__
+        )
+
+    async def get_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> ModelResponse:
+        key = self.cache_key(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            previous_response_id=previous_response_id,
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return dataclasses.replace(cached, usage=Usage())
+
+        response = await self.wrapped_model.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+        )
+        await self.cache.set(key, response)
+        return response
+
+    async def stream_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> AsyncIterator[TResponseStreamEvent]:
+        key = self.cache_key(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            previous_response_id=previous_response_id,
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            for event in replay_response_events(
+                dataclasses.replace(cached, usage=Usage()), self.model_name
+            ):
+                yield event
+            return
+
+        async for event in self.wrapped_model.stream_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+        ):
+            if isinstance(event, ResponseCompletedEvent):
+                # Store before yielding, in case the consumer stops at the last event.
+                await self.cache.set(key, model_response_from(event.response))
+            yield event
+
+    def cache_key(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        *,
+        previous_response_id: str | None,
+    ) -> str:
+        """Returns a digest of everything that is sent to the model for this request."""
+        return request_digest(
+            self.model_name,
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            previous_response_id=previous_response_id,
+        )
+
+
+class CachingModelProvider(ModelProvider):
+    """Wraps a model provider so that every model it returns is a `CachingModel` sharing `cache`.
+    Pass it as `RunConfig.model_provider` to cache all model calls in a run.
+    """
+
+    def __init__(self, provider: ModelProvider, cache: ResponseCache) -> None:
+        self.provider = provider
+        self.cache = cache
+
+    def get_model(self, model_name: str | None) -> Model:
+        return CachingModel(self.provider.get_model(model_name), self.cache, model_name)
+
+
+def replay_response_events(response: ModelResponse, model_name: str) -> list[TResponseStreamEvent]:
+    """Builds the stream events a model would have sent while producing `response`, with each
+    text part delivered as a single delta.
+    """
+    final_response = Response(
+        id=response.response_id or FAKE_RESPONSES_ID,
+        created_at=time.time(),
+        model=model_name,
+        object="response",
+        output=response.output,
+        tool_choice="auto",
+        tools=[],
+        top_p=None,
+        parallel_tool_calls=False,
+        usage=ResponseUsage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            total_tokens=response.usage.total_tokens,
+            input_tokens_details=InputTokensDetails(cached_tokens=0),
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=0),
+        ),
+    )
+    events: list[TResponseStreamEvent] = [
+        ResponseCreatedEvent(
+            response=final_response.model_copy(update={"output": [], "usage": None}),
+            type="response.created",
+        )
+    ]
+    for output_index, item in enumerate(response.output):
+        item_id = getattr(item, "id", None) or FAKE_RESPONSES_ID
+        if isinstance(item, ResponseOutputMessage):
+            events.append(
+                ResponseOutputItemAddedEvent(
+                    item=item.model_copy(update={"content": [], "status": "in_progress"}),
+                    output_index=output_index,
+                    type="response.output_item.added",
+                )
+            )
+            for content_index, part in enumerate(item.content):
+                events.append(
+                    ResponseContentPartAddedEvent(
+                        content_index=content_index,
+                        item_id=item_id,
+                        output_index=output_index,
+                        part=part.model_copy(
+                            update={"text": ""}
+                            if isinstance(part, ResponseOutputText)
+                            else {"refusal": ""}
+                        ),
+                        type="response.content_part.added",
+                    )
+                )
+                if isinstance(part, ResponseOutputText):
+                    events.append(
+                        ResponseTextDeltaEvent(
+                            content_index=content_index,
+                            delta=part.text,
+                            item_id=item_id,
+                            output_index=output_index,
+                            type="response.output_text.delta",
+                        )
+                    )
+                else:
+                    events.append(
+                        ResponseRefusalDeltaEvent(
+                            content_index=content_index,
+                            delta=part.refusal,
+                            item_id=item_id,
+                            output_index=output_index,
+                            type="response.refusal.delta",
+                        )
+                    )
+                events.append(
+                    ResponseContentPartDoneEvent(
+                        content_index=content_index,
+                        item_id=item_id,
+                        output_index=output_index,
+                        part=part,
+                        type="response.content_part.done",
+                    )
+                )
+        else:
+            events.append(
+                ResponseOutputItemAddedEvent(
+                    item=item, output_index=output_index, type="response.output_item.added"
+                )
+            )
+            if isinstance(item, ResponseFunctionToolCall):
+                events.append(
+                    ResponseFunctionCallArgumentsDeltaEvent(
+                        delta=item.arguments,
+                        item_id=item_id,
+                        output_index=output_index,
+                        type="response.function_call_arguments.delta",
+                    )
+                )
+        events.append(
+            ResponseOutputItemDoneEvent(
+                item=item, output_index=output_index, type="response.output_item.done"
+            )
+        )
+    events.append(ResponseCompletedEvent(response=final_response, type="response.completed"))
+    return events
+
+
+def request_digest(
+    model_name: str,
+    system_instructions: str | None,
+    input: str | list[TResponseInputItem],
+    model_settings: ModelSettings,
+    tools: list[Tool],
+    output_schema: AgentOutputSchemaBase | None,
+    handoffs: list[Handoff],
+    *,
+    previous_response_id: str | None,
+) -> str:
+    """Returns a SHA-256 digest of a canonical JSON encoding of a model request.
+
+    Raises:
+        UserError: If the request contains a value without a stable JSON encoding. See
+            `canonical_json_default`.
+    """
+    request = {
+        "model": model_name,
+        "system_instructions": system_instructions,
+        "input": input,
+        "model_settings": model_settings.to_json_dict(),
+        "tools": [_tool_key(tool) for tool in tools],
+        "output_schema": _output_schema_key(output_schema),
+        "handoffs": [
+            [
+                handoff.tool_name,
+                handoff.tool_description,
+                handoff.input_json_schema,
+                handoff.strict_json_schema,
+            ]
+            for handoff in handoffs
+        ],
+        "previous_response_id": previous_response_id,
+    }
+    canonical = json.dumps(
+        request, sort_keys=True, separators=(",", ":"), default=_canonical_json_default
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def model_response_to_json(response: ModelResponse) -> dict[str, Any]:
+    return {
+        "output": [item.model_dump(mode="json", exclude_unset=True) for item in response.output],
+        "usage": dataclasses.asdict(response.usage),
+        "response_id": response.response_id,
+    }
+
+
+def model_response_from_json(data: dict[str, Any]) -> ModelResponse:
+    return ModelResponse(
+        output=_output_adapter.validate_python(data["output"]),
+        usage=Usage(**data["usage"]),
+        response_id=data["response_id"],
+    )
+
+
+def model_response_from(response: Response) -> ModelResponse:
+    """Builds a `ModelResponse` from the response in a `response.completed` stream event."""
+    return ModelResponse(
+        output=response.output,
+        usage=Usage.from_response_usage(response.usage),
+        response_id=response.id,
+    )
+
+
+def _tool_key(tool: Tool) -> Any:
+    if isinstance(tool, FunctionTool):
+        return [
+            "function",
+            tool.name,
+            tool.description,
+            tool.params_json_schema,
+            tool.strict_json_schema,
+        ]
+    if isinstance(tool, ComputerTool):
+        return [tool.name, tool.computer.environment, tool.computer.dimensions]
+    return [tool.name, dataclasses.asdict(tool)]
+
+
+def _output_schema_key(output_schema: AgentOutputSchemaBase | None) -> Any:
+    if output_schema is None or output_schema.is_plain_text():
+        return None
+    return [
+        output_schema.name(),
+        output_schema.json_schema(),
+        output_schema.is_strict_json_schema(),
+    ]
+
+
+def _canonical_json_default(value: Any) -> Any:
+    return canonical_json_default(value, exclude_unset=True)
@@ -41,8 +41,13 @@ from ..exceptions import AgentsException, UserError
 from ..handoffs import Handoff
 from ..items import TResponseInputItem, TResponseOutputItem
 from ..tool import FunctionTool, Tool
+from ..util._identity_cache import IdentityCache
 from .fake_id import FAKE_RESPONSES_ID
 
+# Tool params only depend on a few fields of the tool or handoff, so they're converted once and
+# reused for every request.
+_tool_params_cache: IdentityCache[ChatCompletionToolParam] = IdentityCache()
+
 
 class Converter:
     @classmethod
@@ -440,14 +445,18 @@ class Converter:
     @classmethod
     def tool_to_openai(cls, tool: Tool) -> ChatCompletionToolParam:
         if isinstance(tool, FunctionTool):
-            return {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description or "",
-                    "parameters": tool.params_json_schema,
+            return _tool_params_cache.get_or_create(
+                tool,
+                (tool.name, tool.description, tool.params_json_schema),
+                lambda: {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description or "",
+                        "parameters": tool.params_json_schema,
+                    },
                 },
-            }
+            )
 
         raise UserError(
             f"Hosted tools are not supported with the ChatCompletions API. Got tool type: "
@@ -456,11 +465,15 @@ class Converter:
 
     @classmethod
     def convert_handoff_tool(cls, handoff: Handoff[Any]) -> ChatCompletionToolParam:
-        return {
-            "type": "function",
-            "function": {
-                "name": handoff.tool_name,
-                "description": handoff.tool_description,
-                "parameters": handoff.input_json_schema,
+        return _tool_params_cache.get_or_create(
+            handoff,
+            (handoff.tool_name, handoff.tool_description, handoff.input_json_schema),
+            lambda: {
+                "type": "function",
+                "function": {
+                    "name": handoff.tool_name,
+                    "description": handoff.tool_description,
+                    "parameters": handoff.input_json_schema,
+                },
             },
-        }
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from typing import Any, Generic
 
 from openai import AsyncStream
 from openai.types.chat import ChatCompletionChunk
@@ -25,17 +26,62 @@ from openai.types.responses import (
     ResponseUsage,
 )
 from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+from pydantic import BaseModel
+from typing_extensions import TypeVar
 
 from ..items import TResponseStreamEvent
 from .fake_id import FAKE_RESPONSES_ID
 
+TEvent = TypeVar("TEvent", bound=BaseModel)
+
+
+class _EventTemplate(Generic[TEvent]):
+    """Builds events that differ from a validated template in a few fields, such as `delta`,
+    without running validation again. Streams can have many thousands of chunks, and validating
+    an event per chunk is most of the cost of converting them.
+    """
+
+    def __init__(self, event: TEvent) -> None:
+        self._event = event
+
+    def build(self, **updates: Any) -> TEvent:
+        # The same result as `self._event.model_copy(update=updates)`, which takes about three
+        # times as long per event; `model_construct` is slower still, since it applies defaults.
+        # Every event gets its own fields set and extra dict, as `model_copy` would give it, so
+        # mutating one event never changes another.
+        template = self._event
+        event = object.__new__(type(template))
+        values = template.__dict__.copy()
+        values.update(updates)
+        extra = template.__pydantic_extra__
+        object.__setattr__(event, "__dict__", values)
+        object.__setattr__(
+            event, "__pydantic_fields_set__", template.__pydantic_fields_set__ | updates.keys()
+        )
+        object.__setattr__(event, "__pydantic_extra__", None if extra is None else extra.copy())
+        object.__setattr__(event, "__pydantic_private__", None)
+        return event
+
+
+@dataclass
+class FunctionCallBuffer:
+    name: list[str] = field(default_factory=list)
+    arguments: list[str] = field(default_factory=list)
+    call_id: list[str] = field(default_factory=list)
+
 
 @dataclass
 class StreamingState:
+    """Text, refusal and function call fragments are kept as lists and joined once, at the end of
+    the stream, so long outputs are not copied on every chunk.
+    """
+
     started: bool = False
-    text_content_index_and_output: tuple[int, ResponseOutputText] | None = None
-    refusal_content_index_and_output: tuple[int, ResponseOutputRefusal] | None = None
-    function_calls: dict[int, ResponseFunctionToolCall] = field(default_factory=dict)
+    text_content_index: int | None = None
+    text_parts: list[str] = field(default_factory=list)
+    refusal_content_index: int | None = None
+    refusal_parts: list[str] = field(default_factory=list)
+    function_calls: dict[int, FunctionCallBuffer] = field(default_factory=dict)
 
 
 class ChatCmplStreamHandler:
@@ -47,6 +93,8 @@ class ChatCmplStreamHandler:
     ) -> AsyncIterator[TResponseStreamEvent]:
         usage: CompletionUsage | None = None
         state = StreamingState()
+        text_delta: _EventTemplate[ResponseTextDeltaEvent] | None = None
+        refusal_delta: _EventTemplate[ResponseRefusalDeltaEvent] | None = None
 
         async for chunk in stream:
             if not state.started:
@@ -66,32 +114,17 @@ class ChatCmplStreamHandler:
 
             # Handle text
             if delta.content:
-                if not state.text_content_index_and_output:
+                if text_delta is None:
                     # Initialize a content tracker for streaming text
-                    state.text_content_index_and_output = (
-                        0 if not state.refusal_content_index_and_output else 1,
-                        ResponseOutputText(
-                            text="",
-                            type="output_text",
-                            annotations=[],
-                        ),
-                    )
-                    # Start a new assistant message stream
-                    assistant_item = ResponseOutputMessage(
-                        id=FAKE_RESPONSES_ID,
-                        content=[],
-                        role="assistant",
-                        type="message",
-                        status="in_progress",
-                    )
+                    state.text_content_index = 0 if state.refusal_content_index is None else 1
                     # Notify consumers of the start of a new output message + first content part
                     yield ResponseOutputItemAddedEvent(
-                        item=assistant_item,
+                        item=_in_progress_message(),
                         output_index=0,
                         type="response.output_item.added",
                     )
                     yield ResponseContentPartAddedEvent(
-                        content_index=state.text_content_index_and_output[0],
+                        content_index=state.text_content_index,
                         item_id=FAKE_RESPONSES_ID,
                         output_index=0,
                         part=ResponseOutputText(
@@ -101,42 +134,33 @@ class ChatCmplStreamHandler:
                         ),
                         type="response.content_part.added",
                     )
+                    text_delta = _EventTemplate(
+                        ResponseTextDeltaEvent(
+                            content_index=state.text_content_index,
+                            delta="",
+                            item_id=FAKE_RESPONSES_ID,
+                            output_index=0,
+                            type="response.output_text.delta",
+                        )
+                    )
                 # Emit the delta for this segment of content
-                yield ResponseTextDeltaEvent(
-                    content_index=state.text_content_index_and_output[0],
-                    delta=delta.content,
-                    item_id=FAKE_RESPONSES_ID,
-                    output_index=0,
-                    type="response.output_text.delta",
-                )
-                # Accumulate the text into the response part
-                state.text_content_index_and_output[1].text += delta.content
+                yield text_delta.build(delta=delta.content)
+                state.text_parts.append(delta.content)
 
             # Handle refusals (model declines to answer)
             # This is always set by the OpenAI API, but not by others e.g. LiteLLM
             if hasattr(delta, "refusal") and delta.refusal:
-                if not state.refusal_content_index_and_output:
+                if refusal_delta is None:
                     # Initialize a content tracker for streaming refusal text
-                    state.refusal_content_index_and_output = (
-                        0 if not state.text_content_index_and_output else 1,
-                        ResponseOutputRefusal(refusal="", type="refusal"),
-                    )
-                    # Start a new assistant message if one doesn't exist yet (in-progress)
-                    assistant_item = ResponseOutputMessage(
-                        id=FAKE_RESPONSES_ID,
-                        content=[],
-                        role="assistant",
-                        type="message",
-                        status="in_progress",
-                    )
+                    state.refusal_content_index = 0 if state.text_content_index is None else 1
                     # Notify downstream that assistant message + first content part are starting
                     yield ResponseOutputItemAddedEvent(
-                        item=assistant_item,
+                        item=_in_progress_message(),
                         output_index=0,
                         type="response.output_item.added",
                     )
                     yield ResponseContentPartAddedEvent(
-                        content_index=state.refusal_content_index_and_output[0],
+                        content_index=state.refusal_content_index,
                         item_id=FAKE_RESPONSES_ID,
                         output_index=0,
                         part=ResponseOutputText(
@@ -146,100 +170,108 @@ class ChatCmplStreamHandler:
                         ),
                         type="response.content_part.added",
                     )
+                    refusal_delta = _EventTemplate(
+                        ResponseRefusalDeltaEvent(
+                            content_index=state.refusal_content_index,
+                            delta="",
+                            item_id=FAKE_RESPONSES_ID,
+                            output_index=0,
+                            type="response.refusal.delta",
+                        )
+                    )
                 # Emit the delta for this segment of refusal
-                yield ResponseRefusalDeltaEvent(
-                    content_index=state.refusal_content_index_and_output[0],
-                    delta=delta.refusal,
-                    item_id=FAKE_RESPONSES_ID,
-                    output_index=0,
-                    type="response.refusal.delta",
-                )
-                # Accumulate the refusal string in the output part
-                state.refusal_content_index_and_output[1].refusal += delta.refusal
+                yield refusal_delta.build(delta=delta.refusal)
+                state.refusal_parts.append(delta.refusal)
 
             # Handle tool calls
             # Because we don't know the name of the function until the end of the stream, we'll
             # save everything and yield events at the end
             if delta.tool_calls:
                 for tc_delta in delta.tool_calls:
-                    if tc_delta.index not in state.function_calls:
-                        state.function_calls[tc_delta.index] = ResponseFunctionToolCall(
-                            id=FAKE_RESPONSES_ID,
-                            arguments="",
-                            name="",
-                            type="function_call",
-                            call_id="",
-                        )
+                    buffer = state.function_calls.get(tc_delta.index)
+                    if buffer is None:
+                        buffer = state.function_calls[tc_delta.index] = FunctionCallBuffer()
                     tc_function = tc_delta.function
+                    if tc_function:
+                        if tc_function.arguments:
+                            buffer.arguments.append(tc_function.arguments)
+                        if tc_function.name:
+                            buffer.name.append(tc_function.name)
+                    if tc_delta.id:
+                        buffer.call_id.append(tc_delta.id)
 
-                    state.function_calls[tc_delta.index].arguments += (
-                        tc_function.arguments if tc_function else ""
-                    ) or ""
-                    state.function_calls[tc_delta.index].name += (
-                        tc_function.name if tc_function else ""
-                    ) or ""
-                    state.function_calls[tc_delta.index].call_id += tc_delta.id or ""
+        text_content = (
+            (
+                state.text_content_index,
+                ResponseOutputText(
+                    text="".join(state.text_parts), type="output_text", annotations=[]
+                ),
+            )
+            if state.text_content_index is not None
+            else None
+        )
+        refusal_content = (
+            (
+                state.refusal_content_index,
+                ResponseOutputRefusal(refusal="".join(state.refusal_parts), type="refusal"),
+            )
+            if state.refusal_content_index is not None
+            else None
+        )
 
         function_call_starting_index = 0
-        if state.text_content_index_and_output:
+        if text_content:
             function_call_starting_index += 1
             # Send end event for this content part
             yield ResponseContentPartDoneEvent(
-                content_index=state.text_content_index_and_output[0],
+                content_index=text_content[0],
                 item_id=FAKE_RESPONSES_ID,
                 output_index=0,
-                part=state.text_content_index_and_output[1],
+                part=text_content[1],
                 type="response.content_part.done",
             )
 
-        if state.refusal_content_index_and_output:
+        if refusal_content:
             function_call_starting_index += 1
             # Send end event for this content part
             yield ResponseContentPartDoneEvent(
-                content_index=state.refusal_content_index_and_output[0],
+                content_index=refusal_content[0],
                 item_id=FAKE_RESPONSES_ID,
                 output_index=0,
-                part=state.refusal_content_index_and_output[1],
+                part=refusal_content[1],
                 type="response.content_part.done",
             )
 
         # Actually send events for the function calls
-        for function_call in state.function_calls.values():
+        function_calls: list[ResponseFunctionToolCall] = []
+        for buffer in state.function_calls.values():
+            call_id = "".join(buffer.call_id)
+            arguments = "".join(buffer.arguments)
+            name = "".join(buffer.name)
             # First, a ResponseOutputItemAdded for the function call
             yield ResponseOutputItemAddedEvent(
-                item=ResponseFunctionToolCall(
-                    id=FAKE_RESPONSES_ID,
-                    call_id=function_call.call_id,
-                    arguments=function_call.arguments,
-                    name=function_call.name,
-                    type="function_call",
-                ),
+                item=_function_call(call_id, arguments, name),
                 output_index=function_call_starting_index,
                 type="response.output_item.added",
             )
             # Then, yield the args
             yield ResponseFunctionCallArgumentsDeltaEvent(
-                delta=function_call.arguments,
+                delta=arguments,
                 item_id=FAKE_RESPONSES_ID,
                 output_index=function_call_starting_index,
                 type="response.function_call_arguments.delta",
             )
             # Finally, the ResponseOutputItemDone
             yield ResponseOutputItemDoneEvent(
-                item=ResponseFunctionToolCall(
-                    id=FAKE_RESPONSES_ID,
-                    call_id=function_call.call_id,
-                    arguments=function_call.arguments,
-                    name=function_call.name,
-                    type="function_call",
-                ),
+                item=_function_call(call_id, arguments, name),
                 output_index=function_call_starting_index,
                 type="response.output_item.done",
             )
+            function_calls.append(_function_call(call_id, arguments, name))
 
         # Finally, send the Response completed event
         outputs: list[ResponseOutputItem] = []
-        if state.text_content_index_and_output or state.refusal_content_index_and_output:
+        if text_content or refusal_content:
             assistant_msg = ResponseOutputMessage(
                 id=FAKE_RESPONSES_ID,
                 content=[],
@@ -247,10 +279,10 @@ class ChatCmplStreamHandler:
                 type="message",
                 status="completed",
             )
-            if state.text_content_index_and_output:
-                assistant_msg.content.append(state.text_content_index_and_output[1])
-            if state.refusal_content_index_and_output:
-                assistant_msg.content.append(state.refusal_content_index_and_output[1])
+            if text_content:
+                assistant_msg.content.append(text_content[1])
+            if refusal_content:
+                assistant_msg.content.append(refusal_content[1])
             outputs.append(assistant_msg)
 
             # send a ResponseOutputItemDone for the assistant message
@@ -260,8 +292,7 @@ class ChatCmplStreamHandler:
                 type="response.output_item.done",
             )
 
-        for function_call in state.function_calls.values():
-            outputs.append(function_call)
+        outputs.extend(function_calls)
 
         final_response = response.model_copy()
         final_response.output = outputs
@@ -290,3 +321,32 @@ class ChatCmplStreamHandler:
             response=final_response,
             type="response.completed",
         )
+
+    @classmethod
+    async def stream_text(cls, stream: AsyncStream[ChatCompletionChunk]) -> AsyncIterator[str]:
+        """Yields only the text deltas of a stream, without building any response events, for
+        consumers that only want the text.
+        """
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+
+def _in_progress_message() -> ResponseOutputMessage:
+    return ResponseOutputMessage(
+        id=FAKE_RESPONSES_ID,
+        content=[],
+        role="assistant",
+        type="message",
+        status="in_progress",
+    )
+
+
+def _function_call(call_id: str, arguments: str, name: str) -> ResponseFunctionToolCall:
+    return ResponseFunctionToolCall(
+        id=FAKE_RESPONSES_ID,
+        call_id=call_id,
+        arguments=arguments,
+        name=name,
+        type="function_call",
+    )
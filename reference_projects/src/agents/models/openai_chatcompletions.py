@@ -77,16 +77,22 @@ class OpenAIChatCompletionsModel(Model):
                     f"LLM resp:\n{json.dumps(response.choices[0].message.model_dump(), indent=2)}\n"
                 )
 
-            usage = (
-                Usage(
+            usage = Usage()
+            if response.usage:
+                prompt_details = response.usage.prompt_tokens_details
+                completion_details = response.usage.completion_tokens_details
+                usage = Usage(
                     requests=1,
                     input_tokens=response.usage.prompt_tokens,
                     output_tokens=response.usage.completion_tokens,
                     total_tokens=response.usage.total_tokens,
+                    cached_input_tokens=(prompt_details.cached_tokens or 0)
+                    if prompt_details
+                    else 0,
+                    reasoning_tokens=(completion_details.reasoning_tokens or 0)
+                    if completion_details
+                    else 0,
                 )
-                if response.usage
-                else Usage()
-            )
             if tracing.include_data():
                 span_generation.span_data.output = [response.choices[0].message.model_dump()]
             span_generation.span_data.usage = {
@@ -26,6 +26,7 @@ from ..logger import logger
 from ..tool import ComputerTool, FileSearchTool, FunctionTool, Tool, WebSearchTool
 from ..tracing import SpanError, response_span
 from ..usage import Usage
+from ..util._identity_cache import IdentityCache
 from ..version import __version__
 from .interface import Model, ModelTracing
 
@@ -43,6 +44,10 @@ IncludeLiteral = Literal[
     "computer_call_output.output.image_url",
 ]
 
+# Function tool and handoff params only depend on a few fields, so they're converted once and
+# reused for every request.
+_tool_params_cache: IdentityCache[ToolParam] = IdentityCache()
+
 
 class OpenAIResponsesModel(Model):
     """
@@ -92,16 +97,7 @@ class OpenAIResponsesModel(Model):
                         f"{json.dumps([x.model_dump() for x in response.output], indent=2)}\n"
                     )
 
-                usage = (
-                    Usage(
-                        requests=1,
-                        input_tokens=response.usage.input_tokens,
-                        output_tokens=response.usage.output_tokens,
-                        total_tokens=response.usage.total_tokens,
-                    )
-                    if response.usage
-                    else Usage()
-                )
+                usage = Usage.from_response_usage(response.usage)
 
                 if tracing.include_data():
                     span_response.span_data.response = response
@@ -350,13 +346,17 @@ class Converter:
         """Returns converted tool and includes"""
 
         if isinstance(tool, FunctionTool):
-            converted_tool: ToolParam = {
-                "name": tool.name,
-                "parameters": tool.params_json_schema,
-                "strict": tool.strict_json_schema,
-                "type": "function",
-                "description": tool.description,
-            }
+            converted_tool: ToolParam = _tool_params_cache.get_or_create(
+                tool,
+                (tool.name, tool.description, tool.params_json_schema, tool.strict_json_schema),
+                lambda: {
+                    "name": tool.name,
+                    "parameters": tool.params_json_schema,
+                    "strict": tool.strict_json_schema,
+                    "type": "function",
+                    "description": tool.description,
+                },
+            )
             includes: IncludeLiteral | None = None
         elif isinstance(tool, WebSearchTool):
             ws: WebSearchToolParam = {
@@ -395,10 +395,19 @@ class Converter:
 
     @classmethod
     def _convert_handoff_tool(cls, handoff: Handoff) -> ToolParam:
-        return {
-            "name": handoff.tool_name,
-            "parameters": handoff.input_json_schema,
-            "strict": handoff.strict_json_schema,
-            "type": "function",
-            "description": handoff.tool_description,
-        }
+        return _tool_params_cache.get_or_create(
+            handoff,
+            (
+                handoff.tool_name,
+                handoff.tool_description,
+                handoff.input_json_schema,
+                handoff.strict_json_schema,
+            ),
+            lambda: {
+                "name": handoff.tool_name,
+                "parameters": handoff.input_json_schema,
+                "strict": handoff.strict_json_schema,
+                "type": "function",
+                "description": handoff.tool_description,
+            },
+        )
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from openai.types.responses import ResponseCompletedEvent
+
+from ..agent_output import AgentOutputSchemaBase
+from ..exceptions import UserError
+from ..handoffs import Handoff
+from ..items import ModelResponse, TResponseInputItem, TResponseStreamEvent
+from ..tool import Tool
+from .caching import (
+    model_response_from,
+    model_response_from_json,
+    model_response_to_json,
+    replay_response_events,
+    request_digest,
+)
+from .interface import Model, ModelProvider, ModelTracing
+
+if TYPE_CHECKING:
+    from ..model_settings import ModelSettings
+
+
+@dataclass
+class RecordedResponse:
+    """A model response captured by a `RecordingModel`."""
+
+    response: ModelResponse
+    """The response the model returned."""
+
+    latency: float
+    """How long the model took to return the response, in seconds."""
+
+
+@dataclass
+class ModelRecording:
+    """Model responses keyed by a digest of the request that produced them. Record one with
+    `RecordingModelProvider`, save it with `save()`, and serve it with `ReplayModelProvider`.
+    """
+
+    responses: dict[str, list[RecordedResponse]] = field(default_factory=dict)
+    """The recorded responses for each request digest. Repeated requests record each response."""
+
+    def add(self, key: str, response: ModelResponse, latency: float) -> None:
+        self.responses.setdefault(key, []).append(RecordedResponse(response, latency))
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        data = {
+            key: [
+                {"response": model_response_to_json(r.response), "latency": r.latency}
+                for r in recorded
+            ]
+            for key, recorded in self.responses.items()
+        }
+        Path(path).write_text(json.dumps(data))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> ModelRecording:
+        data = json.loads(Path(path).read_text())
+        return cls(
+            {
+                key: [
+                    RecordedResponse(model_response_from_json(r["response"]), r["latency"])
+                    for r in recorded
+                ]
+                for key, recorded in data.items()
+            }
+        )
+
+    def __len__(self) -> int:
+        return sum(len(recorded) for recorded in self.responses.values())
+
+
+ReplayLatency = Callable[[RecordedResponse], float]
+"""Returns how many seconds to wait before serving a recorded response."""
+
+
+def recorded_latency(scale: float = 1.0) -> ReplayLatency:
+    """Waits as long as the model took when the response was recorded, times `scale`."""
+    return lambda recorded: recorded.latency * scale
+
+
+def constant_latency(seconds: float) -> ReplayLatency:
+    """Waits the same time before every response."""
+    return lambda recorded: seconds
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, seed: int | None = None) -> ReplayLatency:
+    """Waits a log-normally distributed time with the given median, in seconds. Model latencies
+    usually have a long tail like this one.
+    """
+    rng = random.Random(seed)
+    mu = math.log(median)
+    return lambda recorded: rng.lognormvariate(mu, sigma)
+
+
+class RecordingModel(Model):
+    """Wraps a model and records each response, and how long it took, into a `ModelRecording`."""
+
+    def __init__(
+        self, model: Model, recording: ModelRecording, model_name: str | None = None
+    ) -> None:
+        self.wrapped_model = model
+        self.recording = recording
+        self.model_name = model_name or ""
+
+    async def get_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> ModelResponse:
+        key = request_digest(
+            self.model_name,
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            previous_response_id=previous_response_id,
+        )
+        start = time.monotonic()
+        response = await self.wrapped_model.get_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+        )
+        self.recording.add(key, response, time.monotonic() - start)
+        return response
+
+    async def stream_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> AsyncIterator[TResponseStreamEvent]:
+        key = request_digest(
+            self.model_name,
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            previous_response_id=previous_response_id,
+        )
+        start = time.monotonic()
+        async for event in self.wrapped_model.stream_response(
+            system_instructions,
+            input,
+            model_settings,
+            tools,
+            output_schema,
+            handoffs,
+            tracing,
+            previous_response_id=previous_response_id,
+        ):
+            if isinstance(event, ResponseCompletedEvent):
+                self.recording.add(
+                    key, model_response_from(event.response), time.monotonic() - start
+                )
+            yield event
+
+
+class ReplayModel(Model):
+    """Serves responses from a `ModelRecording` instead of calling a model, for tests and
+    benchmarks. Requests are matched by digest, so concurrent runs each get the responses that were
+    recorded for their own requests. If a request was recorded several times, its responses are
+    served in turn.
+
+    Args:
+        recording: The recorded responses.
+        model_name: The model name used when recording.
+        latency: How long to wait before each response. Defaults to no wait.
+    """
+
+    def __init__(
+        self,
+        recording: ModelRecording,
+        model_name: str | None = None,
+        latency: ReplayLatency | None = None,
+    ) -> None:
+        self.recording = recording
+        self.model_name = model_name or ""
+        self.latency = latency
+        self._served: dict[str, int] = {}
+
+    async def get_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> ModelResponse:
+        recorded = self._next_response(
+            request_digest(
+                self.model_name,
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                previous_response_id=previous_response_id,
+            )
+        )
+        await self._wait(recorded)
+        return recorded.response
+
+    async def stream_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> AsyncIterator[TResponseStreamEvent]:
+        recorded = self._next_response(
+            request_digest(
+                self.model_name,
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                previous_response_id=previous_response_id,
+            )
+        )
+        await self._wait(recorded)
+        for event in replay_response_events(recorded.response, self.model_name):
+            yield event
+
+    def _next_response(self, key: str) -> RecordedResponse:
+        recorded = self.recording.responses.get(key)
+        if not recorded:
+            raise UserError(f"No recorded response for this request to {self.model_name!r}")
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return recorded[served % len(recorded)]
+
+    async def _wait(self, recorded: RecordedResponse) -> None:
+        delay = self.latency(recorded) if self.latency is not None else 0.0
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RecordingModelProvider(ModelProvider):
+    """Wraps a model provider so that every model it returns records into `recording`."""
+
+    def __init__(self, provider: ModelProvider, recording: ModelRecording) -> None:
+        self.provider = provider
+        self.recording = recording
+
+    def get_model(self, model_name: str | None) -> Model:
+        return RecordingModel(self.provider.get_model(model_name), self.recording, model_name)
+
+
+class ReplayModelProvider(ModelProvider):
+    """Serves a `ModelRecording` made with `RecordingModelProvider`. Pass it as
+    `RunConfig.model_provider` to rerun recorded runs without calling a model.
+    """
+
+    def __init__(self, recording: ModelRecording, latency: ReplayLatency | None = None) -> None:
+        self.recording = recording
+        self.latency = latency
+        self._models: dict[str | None, ReplayModel] = {}
+
+    def get_model(self, model_name: str | None) -> Model:
+        # Reuse models, so that repeated requests keep cycling through their recorded responses.
+        model = self._models.get(model_name)
+        if model is None:
+            model = self._models[model_name] = ReplayModel(self.recording, model_name, self.latency)
+        return model
@@ -2,22 +2,26 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Iterable
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
 from typing_extensions import TypeVar
 
 from ._run_impl import QueueCompleteSentinel
 from .agent import Agent
 from .agent_output import AgentOutputSchemaBase
-from .exceptions import InputGuardrailTripwireTriggered, MaxTurnsExceeded
+from .exceptions import InputGuardrailTripwireTriggered, MaxTurnsExceeded, UserError
 from .guardrail import InputGuardrailResult, OutputGuardrailResult
 from .items import ItemHelpers, ModelResponse, RunItem, TResponseInputItem
 from .logger import logger
 from .run_context import RunContextWrapper
 from .stream_events import StreamEvent
+from .stream_multicast import StreamMulticast
+from .stream_queue import StreamEventQueue
 from .tracing import Trace
+from .tracing.scope import Scope
+from .usage import Usage
 from .util._pretty_print import pretty_print_result, pretty_print_run_result_streaming
 
 if TYPE_CHECKING:
@@ -136,8 +140,8 @@ class RunResultStreaming(RunResultBase):
     """Whether the agent has finished running."""
 
     # Queues that the background run_loop writes to
-    _event_queue: asyncio.Queue[StreamEvent | QueueCompleteSentinel] = field(
-        default_factory=asyncio.Queue, repr=False
+    _event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] = field(
+        default_factory=StreamEventQueue, repr=False
     )
     _input_guardrail_queue: asyncio.Queue[InputGuardrailResult] = field(
         default_factory=asyncio.Queue, repr=False
@@ -148,6 +152,7 @@ class RunResultStreaming(RunResultBase):
     _input_guardrails_task: asyncio.Task[Any] | None = field(default=None, repr=False)
     _output_guardrails_task: asyncio.Task[Any] | None = field(default=None, repr=False)
     _stored_exception: Exception | None = field(default=None, repr=False)
+    _multicast: StreamMulticast | None = field(default=None, repr=False)
 
     @property
     def last_agent(self) -> Agent[Any]:
@@ -163,8 +168,7 @@ class RunResultStreaming(RunResultBase):
         self.is_complete = True  # Mark the run as complete to stop event streaming
 
         # Optionally, clear the event queue to prevent processing stale events
-        while not self._event_queue.empty():
-            self._event_queue.get_nowait()
+        self._event_queue.clear()
         while not self._input_guardrail_queue.empty():
             self._input_guardrail_queue.get_nowait()
 
@@ -177,35 +181,49 @@ class RunResultStreaming(RunResultBase):
         - A MaxTurnsExceeded exception if the agent exceeds the max_turns limit.
         - A GuardrailTripwireTriggered exception if a guardrail is tripped.
         """
-        while True:
-            self._check_errors()
-            if self._stored_exception:
-                logger.debug("Breaking due to stored exception")
-                self.is_complete = True
-                break
-
-            if self.is_complete and self._event_queue.empty():
-                break
-
-            try:
-                item = await self._event_queue.get()
-            except asyncio.CancelledError:
-                break
-
-            if isinstance(item, QueueCompleteSentinel):
-                self._event_queue.task_done()
-                # Check for errors, in case the queue was completed due to an exception
+        try:
+            while True:
                 self._check_errors()
-                break
-
-            yield item
-            self._event_queue.task_done()
-
-        self._cleanup_tasks()
+                if self._stored_exception:
+                    logger.debug("Breaking due to stored exception")
+                    self.is_complete = True
+                    break
+
+                if self.is_complete and self._event_queue.empty():
+                    break
+
+                try:
+                    item = await self._event_queue.get()
+                except asyncio.CancelledError:
+                    break
+
+                if isinstance(item, QueueCompleteSentinel):
+                    # Check for errors, in case the queue was completed due to an exception
+                    self._check_errors()
+                    break
+
+                yield item
+        finally:
+            # Also runs when the consumer stops iterating early, so a run that is waiting for
+            # room in a bounded queue is cancelled instead of blocking forever.
+            self._cleanup_tasks()
 
         if self._stored_exception:
             raise self._stored_exception
 
+    def multicast(self, buffer_size: int = 1024) -> StreamMulticast:
+        """Returns a `StreamMulticast` that delivers this run's events to any number of
+        subscribers, each with its own cursor. Calling it again returns the same multicast. Once a
+        multicast exists, don't call `stream_events()` yourself; subscribe instead.
+
+        Args:
+            buffer_size: How many recent events are kept for subscribers, which bounds how far
+                behind a subscriber may fall and how much a late subscriber can replay.
+        """
+        if self._multicast is None:
+            self._multicast = StreamMulticast(self, buffer_size)
+        return self._multicast
+
     def _check_errors(self):
         if self.current_turn > self.max_turns:
             self._stored_exception = MaxTurnsExceeded(f"Max turns ({self.max_turns}) exceeded")
@@ -244,3 +262,157 @@ class RunResultStreaming(RunResultBase):
 
     def __str__(self) -> str:
         return pretty_print_run_result_streaming(self)
+
+
+RunManyFailurePolicy = Literal["raise", "continue"]
+"""What `Runner.run_many` does when a run fails. "raise" cancels the remaining runs and raises the
+run's exception from `stream_results()`. "continue" yields the failure as an outcome with `error`
+set, and carries on with the other runs."""
+
+
+@dataclass
+class RunManyOutcome:
+    """The outcome of one of the runs started by `Runner.run_many`."""
+
+    index: int
+    """The position of the run's input in the inputs passed to `run_many`."""
+
+    input: str | list[TResponseInputItem]
+    """The run's input."""
+
+    result: RunResult | None = None
+    """The run's result, if it succeeded."""
+
+    error: Exception | None = None
+    """The exception the run raised, if it failed."""
+
+
+@dataclass
+class RunManyResult:
+    """The results of `Runner.run_many`. Runs are started as `stream_results()` is iterated, so
+    that only `max_concurrency` runs (and their inputs) are in flight at a time.
+    """
+
+    max_concurrency: int
+    """The maximum number of runs in flight at once."""
+
+    ordered: bool
+    """Whether outcomes are yielded in input order rather than completion order. Runs that
+    complete before an earlier one count towards `max_concurrency` until they are yielded, so a
+    slow run holds back at most that many results."""
+
+    on_error: RunManyFailurePolicy
+    """What to do when a run fails."""
+
+    max_failures: int | None
+    """With `on_error="continue"`, the number of failed runs at which the remaining runs are
+    cancelled and the last error is raised. `None` means no limit."""
+
+    trace: Trace | None = field(repr=False)
+    """The trace that all runs are part of, unless a trace was already active when `run_many` was
+    called."""
+
+    usage: Usage = field(default_factory=Usage)
+    """Usage aggregated over the runs that have completed successfully so far."""
+
+    completed: int = 0
+    """The number of runs that have completed, successfully or not."""
+
+    failures: list[RunManyOutcome] = field(default_factory=list)
+    """The runs that have failed so far."""
+
+    _inputs: Iterable[str | list[TResponseInputItem]] = field(default=(), repr=False)
+    _run_one: Callable[[str | list[TResponseInputItem]], Awaitable[RunResult]] | None = field(
+        default=None, repr=False
+    )
+    _started: bool = field(default=False, repr=False)
+
+    async def stream_results(self) -> AsyncIterator[RunManyOutcome]:
+        """Runs the inputs and yields each run's outcome as it completes (or in input order, if
+        `ordered` is set). Can only be iterated once. If iteration stops early, the runs still in
+        flight are cancelled.
+        """
+        if self._started:
+            raise UserError("RunManyResult.stream_results() can only be iterated once")
+        self._started = True
+        assert self._run_one is not None
+
+        inputs = enumerate(self._inputs)
+        pending: dict[asyncio.Task[RunResult], tuple[int, str | list[TResponseInputItem]]] = {}
+        completed_out_of_order: dict[int, RunManyOutcome] = {}
+        next_index = 0
+        exhausted = False
+
+        if self.trace:
+            self.trace.start()
+        try:
+            while True:
+                while (
+                    not exhausted
+                    and len(pending) + len(completed_out_of_order) < self.max_concurrency
+                ):
+                    try:
+                        index, input = next(inputs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.create_task(self._run_in_trace(input))] = (index, input)
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: pending[t][0]):
+                    index, input = pending.pop(task)
+                    outcome = self._record(task, index, input)
+                    if not self.ordered:
+                        yield outcome
+                        continue
+
+                    completed_out_of_order[index] = outcome
+                    while next_index in completed_out_of_order:
+                        yield completed_out_of_order.pop(next_index)
+                        next_index += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if self.trace:
+                self.trace.finish()
+
+    def _record(
+        self,
+        task: asyncio.Task[RunResult],
+        index: int,
+        input: str | list[TResponseInputItem],
+    ) -> RunManyOutcome:
+        self.completed += 1
+        exc = task.exception()
+        if exc is None:
+            result = task.result()
+            self.usage.add(result.context_wrapper.usage)
+            return RunManyOutcome(index=index, input=input, result=result)
+
+        if not isinstance(exc, Exception):
+            raise exc
+        outcome = RunManyOutcome(index=index, input=input, error=exc)
+        self.failures.append(outcome)
+        if self.on_error == "raise" or (
+            self.max_failures is not None and len(self.failures) >= self.max_failures
+        ):
+            raise exc
+        return outcome
+
+    async def _run_in_trace(self, input: str | list[TResponseInputItem]) -> RunResult:
+        assert self._run_one is not None
+        if self.trace is None:
+            return await self._run_one(input)
+
+        # Each run is a task with its own copy of the context, so the shared trace is made
+        # current inside the task rather than in the caller's context.
+        token = Scope.set_current_trace(self.trace)
+        try:
+            return await self._run_one(input)
+        finally:
+            Scope.reset_current_trace(token)
@@ -2,30 +2,41 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import dataclasses
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, cast
 
-from openai.types.responses import ResponseCompletedEvent
+from openai.types.responses import (
+    ResponseCompletedEvent,
+    ResponseFunctionToolCall,
+    ResponseOutputItemDoneEvent,
+)
 
 from ._run_impl import (
     AgentToolUseTracker,
+    InputBuffer,
     NextStepFinalOutput,
     NextStepHandoff,
     NextStepRunAgain,
     QueueCompleteSentinel,
     RunImpl,
     SingleStepResult,
+    SpeculativeToolCalls,
     TraceCtxManager,
     get_model_tracing_impl,
 )
 from .agent import Agent
 from .agent_output import AgentOutputSchema, AgentOutputSchemaBase
+from .context_window import ContextWindow
 from .exceptions import (
     AgentsException,
     InputGuardrailTripwireTriggered,
     MaxTurnsExceeded,
     ModelBehaviorError,
     OutputGuardrailTripwireTriggered,
+    UserError,
 )
 from .guardrail import InputGuardrail, InputGuardrailResult, OutputGuardrail, OutputGuardrailResult
 from .handoffs import Handoff, HandoffInputFilter, handoff
@@ -35,17 +46,22 @@ from .logger import logger
 from .model_settings import ModelSettings
 from .models.interface import Model, ModelProvider
 from .models.multi_provider import MultiProvider
-from .result import RunResult, RunResultStreaming
+from .result import RunManyFailurePolicy, RunManyResult, RunResult, RunResultStreaming
 from .run_context import RunContextWrapper, TContext
-from .stream_events import AgentUpdatedStreamEvent, RawResponsesStreamEvent
-from .tool import Tool
+from .stream_events import AgentUpdatedStreamEvent, RawResponsesStreamEvent, StreamEvent
+from .stream_queue import StreamEventQueue, StreamQueueSettings
+from .tool import FunctionTool, Tool
 from .tracing import Span, SpanError, agent_span, get_current_trace, trace
 from .tracing.span_data import AgentSpanData
 from .usage import Usage
 from .util import _coro, _error_tracing
+from .util._identity_cache import IdentityCache
 
 DEFAULT_MAX_TURNS = 10
 
+_output_schema_cache: IdentityCache[AgentOutputSchema] = IdentityCache()
+_handoffs_cache: IdentityCache[list[Handoff]] = IdentityCache()
+
 
 @dataclass
 class RunConfig:
@@ -76,6 +92,30 @@ class RunConfig:
     output_guardrails: list[OutputGuardrail[Any]] | None = None
     """A list of output guardrails to run on the final output of the run."""
 
+    tool_executor_max_workers: int | None = None
+    """The number of threads that synchronous function tools run on, so that blocking tools don't
+    stall the event loop. Threads are shared by all runs with the same setting. If not provided,
+    the event loop's default executor is used. Tools created with `executor="inline"` always run
+    directly on the event loop.
+    """
+
+    tool_process_pool_max_workers: int | None = None
+    """The number of worker processes for function tools created with `executor="process"`.
+    Processes are shared by all runs with the same setting. If not provided, defaults to the number
+    of CPUs.
+    """
+
+    context_window: ContextWindow | None = None
+    """Keeps the model input within a token budget on every turn, by compacting older history with
+    the given policy. Works with any model provider, unlike `ModelSettings.truncation`. If not
+    provided, the full history is sent on every turn.
+    """
+
+    stream_queue: StreamQueueSettings | None = None
+    """Bounds the events buffered for `Runner.run_streamed` consumers, and sets what happens when
+    a consumer falls behind. If not provided, events are buffered without limit.
+    """
+
     tracing_disabled: bool = False
     """Whether tracing is disabled for the agent run. If disabled, we will not trace the agent run.
     """
@@ -155,6 +195,7 @@ class Runner:
             run_config = RunConfig()
 
         tool_use_tracker = AgentToolUseTracker()
+        input_buffer = InputBuffer()
 
         with TraceCtxManager(
             workflow_name=run_config.workflow_name,
@@ -215,7 +256,10 @@ class Runner:
                     )
 
                     if current_turn == 1:
-                        input_guardrail_results, turn_result = await asyncio.gather(
+                        # The guardrails race the first turn. A tripwire cancels the model call
+                        # and any tool calls in flight, so a blocked run ends as soon as the
+                        # guardrail does.
+                        input_guardrail_results, turn_result = await _coro.gather_or_cancel(
                             cls._run_input_guardrails(
                                 starting_agent,
                                 starting_agent.input_guardrails
@@ -234,6 +278,7 @@ class Runner:
                                 should_run_agent_start_hooks=should_run_agent_start_hooks,
                                 tool_use_tracker=tool_use_tracker,
                                 previous_response_id=previous_response_id,
+                                input_buffer=input_buffer,
                             ),
                         )
                     else:
@@ -248,6 +293,7 @@ class Runner:
                             should_run_agent_start_hooks=should_run_agent_start_hooks,
                             tool_use_tracker=tool_use_tracker,
                             previous_response_id=previous_response_id,
+                            input_buffer=input_buffer,
                         )
                     should_run_agent_start_hooks = False
 
@@ -345,6 +391,89 @@ class Runner:
             )
         )
 
+    @classmethod
+    def run_many(
+        cls,
+        starting_agent: Agent[TContext],
+        inputs: Iterable[str | list[TResponseInputItem]],
+        *,
+        max_concurrency: int = 8,
+        ordered: bool = False,
+        on_error: RunManyFailurePolicy = "raise",
+        max_failures: int | None = None,
+        context: TContext | None = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        hooks: RunHooks[TContext] | None = None,
+        run_config: RunConfig | None = None,
+    ) -> RunManyResult:
+        """Run the same agent on many independent inputs, with at most `max_concurrency` runs in
+        flight at once. The runs start when you iterate `stream_results()` on the returned object,
+        which yields each run's outcome as it completes. Inputs are consumed lazily, so `inputs`
+        can be a generator over a large dataset.
+
+        All runs share one run config, and therefore one model provider and HTTP client. Unless a
+        trace is already active, they are grouped in a single trace named after
+        `run_config.workflow_name`. The returned object aggregates the usage of successful runs.
+
+        Args:
+            starting_agent: The starting agent for each run.
+            inputs: The inputs, one per run.
+            max_concurrency: The maximum number of runs in flight at once.
+            ordered: If True, outcomes are yielded in input order rather than completion order.
+                Completed runs are held back until all earlier ones have completed, and count
+                towards `max_concurrency` until then, so a slow run holds back at most that
+                many results.
+            on_error: What to do when a run fails. See `RunManyFailurePolicy`.
+            max_failures: With `on_error="continue"`, the number of failed runs at which the
+                remaining runs are cancelled and the last error is raised.
+            context: The context to run each agent with. It is shared by all runs.
+            max_turns: The maximum number of turns for each run.
+            hooks: An object that receives callbacks on lifecycle events of all runs.
+            run_config: Global settings shared by all runs.
+
+        Returns:
+            A result object whose `stream_results()` method runs the inputs and yields a
+            `RunManyOutcome` for each.
+        """
+        if max_concurrency < 1:
+            raise UserError("max_concurrency must be at least 1")
+        if max_failures is not None and max_failures < 1:
+            raise UserError("max_failures must be at least 1")
+        if run_config is None:
+            run_config = RunConfig()
+
+        batch_trace = (
+            trace(
+                workflow_name=run_config.workflow_name,
+                trace_id=run_config.trace_id,
+                group_id=run_config.group_id,
+                metadata=run_config.trace_metadata,
+                disabled=run_config.tracing_disabled,
+            )
+            if not get_current_trace()
+            else None
+        )
+
+        async def run_one(input: str | list[TResponseInputItem]) -> RunResult:
+            return await cls.run(
+                starting_agent,
+                input,
+                context=context,
+                max_turns=max_turns,
+                hooks=hooks,
+                run_config=run_config,
+            )
+
+        return RunManyResult(
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+            on_error=on_error,
+            max_failures=max_failures,
+            trace=batch_trace,
+            _inputs=inputs,
+            _run_one=run_one,
+        )
+
     @classmethod
     def run_streamed(
         cls,
@@ -425,6 +554,7 @@ class Runner:
             _current_agent_output_schema=output_schema,
             trace=new_trace,
             context_wrapper=context_wrapper,
+            _event_queue=StreamEventQueue(run_config.stream_queue),
         )
 
         # Kick off the actual agent loop in the background and return the streamed result object.
@@ -505,6 +635,7 @@ class Runner:
         current_turn = 0
         should_run_agent_start_hooks = True
         tool_use_tracker = AgentToolUseTracker()
+        input_buffer = InputBuffer()
 
         streamed_result._event_queue.put_nowait(AgentUpdatedStreamEvent(new_agent=current_agent))
 
@@ -569,6 +700,7 @@ class Runner:
                         tool_use_tracker,
                         all_tools,
                         previous_response_id,
+                        input_buffer,
                     )
                     should_run_agent_start_hooks = False
 
@@ -641,6 +773,7 @@ class Runner:
         tool_use_tracker: AgentToolUseTracker,
         all_tools: list[Tool],
         previous_response_id: str | None,
+        input_buffer: InputBuffer | None = None,
     ) -> SingleStepResult:
         if should_run_agent_start_hooks:
             await asyncio.gather(
@@ -666,63 +799,95 @@ class Runner:
 
         final_response: ModelResponse | None = None
 
-        input = ItemHelpers.input_to_new_input_list(streamed_result.input)
-        input.extend([item.to_input_item() for item in streamed_result.new_items])
-
-        # 1. Stream the output events
-        async for event in model.stream_response(
+        input = await cls._build_model_input(
+            input_buffer or InputBuffer(),
+            streamed_result.input,
+            streamed_result.new_items,
             system_prompt,
-            input,
-            model_settings,
-            all_tools,
-            output_schema,
-            handoffs,
-            get_model_tracing_impl(
-                run_config.tracing_disabled, run_config.trace_include_sensitive_data
-            ),
-            previous_response_id=previous_response_id,
-        ):
-            if isinstance(event, ResponseCompletedEvent):
-                usage = (
-                    Usage(
-                        requests=1,
-                        input_tokens=event.response.usage.input_tokens,
-                        output_tokens=event.response.usage.output_tokens,
-                        total_tokens=event.response.usage.total_tokens,
-                    )
-                    if event.response.usage
-                    else Usage()
-                )
-                final_response = ModelResponse(
-                    output=event.response.output,
-                    usage=usage,
-                    response_id=event.response.id,
-                )
-                context_wrapper.usage.add(usage)
+            context_wrapper,
+            run_config,
+        )
 
-            streamed_result._event_queue.put_nowait(RawResponsesStreamEvent(data=event))
+        # Tools marked speculative start as soon as their call is complete in the stream, rather
+        # than after the whole response.
+        speculative_calls = (
+            SpeculativeToolCalls()
+            if any(isinstance(tool, FunctionTool) and tool.speculative for tool in all_tools)
+            else None
+        )
+        request_started_at = time.perf_counter()
+        try:
+            # 1. Stream the output events
+            async for event in model.stream_response(
+                system_prompt,
+                input,
+                model_settings,
+                all_tools,
+                output_schema,
+                handoffs,
+                get_model_tracing_impl(
+                    run_config.tracing_disabled, run_config.trace_include_sensitive_data
+                ),
+                previous_response_id=previous_response_id,
+            ):
+                if (
+                    speculative_calls is not None
+                    and isinstance(event, ResponseOutputItemDoneEvent)
+                    and isinstance(event.item, ResponseFunctionToolCall)
+                ):
+                    RunImpl.start_speculative_tool_call(
+                        agent=agent,
+                        all_tools=all_tools,
+                        tool_call=event.item,
+                        speculative_calls=speculative_calls,
+                        hooks=hooks,
+                        context_wrapper=context_wrapper,
+                        config=run_config,
+                        event_queue=streamed_result._event_queue,
+                    )
 
-        # 2. At this point, the streaming is complete for this turn of the agent loop.
-        if not final_response:
-            raise ModelBehaviorError("Model did not produce a final response!")
+                if isinstance(event, ResponseCompletedEvent):
+                    usage = Usage.from_response_usage(event.response.usage)
+                    usage.latency = time.perf_counter() - request_started_at
+                    final_response = ModelResponse(
+                        output=event.response.output,
+                        usage=usage,
+                        response_id=event.response.id,
+                    )
+                    context_wrapper.add_usage(
+                        usage,
+                        agent_name=agent.name,
+                        model_name=cls._get_model_name(agent, run_config, model),
+                    )
 
-        # 3. Now, we can process the turn as we do in the non-streaming case
-        single_step_result = await cls._get_single_step_result_from_response(
-            agent=agent,
-            original_input=streamed_result.input,
-            pre_step_items=streamed_result.new_items,
-            new_response=final_response,
-            output_schema=output_schema,
-            all_tools=all_tools,
-            handoffs=handoffs,
-            hooks=hooks,
-            context_wrapper=context_wrapper,
-            run_config=run_config,
-            tool_use_tracker=tool_use_tracker,
-        )
+                await streamed_result._event_queue.put(RawResponsesStreamEvent(data=event))
+
+            # 2. At this point, the streaming is complete for this turn of the agent loop.
+            if not final_response:
+                raise ModelBehaviorError("Model did not produce a final response!")
+
+            # 3. Now, we can process the turn as we do in the non-streaming case
+            single_step_result = await cls._get_single_step_result_from_response(
+                agent=agent,
+                original_input=streamed_result.input,
+                pre_step_items=streamed_result.new_items,
+                new_response=final_response,
+                output_schema=output_schema,
+                all_tools=all_tools,
+                handoffs=handoffs,
+                hooks=hooks,
+                context_wrapper=context_wrapper,
+                run_config=run_config,
+                tool_use_tracker=tool_use_tracker,
+                event_queue=streamed_result._event_queue,
+                speculative_calls=speculative_calls,
+            )
 
-        RunImpl.stream_step_result_to_queue(single_step_result, streamed_result._event_queue)
-        return single_step_result
+            RunImpl.stream_step_result_to_queue(single_step_result, streamed_result._event_queue)
+            return single_step_result
+        finally:
+            if speculative_calls is not None:
+                speculative_calls.cancel_remaining()
 
     @classmethod
     async def _run_single_turn(
@@ -738,6 +903,7 @@ class Runner:
         should_run_agent_start_hooks: bool,
         tool_use_tracker: AgentToolUseTracker,
         previous_response_id: str | None,
+        input_buffer: InputBuffer | None = None,
     ) -> SingleStepResult:
         # Ensure we run the hooks before anything else
         if should_run_agent_start_hooks:
@@ -754,8 +920,14 @@ class Runner:
 
         output_schema = cls._get_output_schema(agent)
         handoffs = cls._get_handoffs(agent)
-        input = ItemHelpers.input_to_new_input_list(original_input)
-        input.extend([generated_item.to_input_item() for generated_item in generated_items])
+        input = await cls._build_model_input(
+            input_buffer or InputBuffer(),
+            original_input,
+            generated_items,
+            system_prompt,
+            context_wrapper,
+            run_config,
+        )
 
         new_response = await cls._get_new_response(
             agent,
@@ -799,6 +971,8 @@ class Runner:
         context_wrapper: RunContextWrapper[TContext],
         run_config: RunConfig,
         tool_use_tracker: AgentToolUseTracker,
+        event_queue: StreamEventQueue[StreamEvent | QueueCompleteSentinel] | None = None,
+        speculative_calls: SpeculativeToolCalls | None = None,
     ) -> SingleStepResult:
         processed_response = RunImpl.process_model_response(
             agent=agent,
@@ -820,6 +994,8 @@ class Runner:
             hooks=hooks,
             context_wrapper=context_wrapper,
             run_config=run_config,
+            event_queue=event_queue,
+            speculative_calls=speculative_calls,
         )
 
     @classmethod
@@ -916,6 +1092,7 @@ class Runner:
         model_settings = agent.model_settings.resolve(run_config.model_settings)
         model_settings = RunImpl.maybe_reset_tool_choice(agent, tool_use_tracker, model_settings)
 
+        request_started_at = time.perf_counter()
         new_response = await model.get_response(
             system_instructions=system_prompt,
             input=input,
@@ -929,7 +1106,20 @@ class Runner:
             previous_response_id=previous_response_id,
         )
 
-        context_wrapper.usage.add(new_response.usage)
+        if not new_response.usage.latency:
+            # Copied rather than set in place, since models may return shared responses, e.g.
+            # from a cache.
+            new_response = dataclasses.replace(
+                new_response,
+                usage=dataclasses.replace(
+                    new_response.usage, latency=time.perf_counter() - request_started_at
+                ),
+            )
+        context_wrapper.add_usage(
+            new_response.usage,
+            agent_name=agent.name,
+            model_name=cls._get_model_name(agent, run_config, model),
+        )
 
         return new_response
 
@@ -940,10 +1130,30 @@ class Runner:
         elif isinstance(agent.output_type, AgentOutputSchemaBase):
             return agent.output_type
 
-        return AgentOutputSchema(agent.output_type)
+        # Building the schema creates a TypeAdapter and a strict JSON schema, so it's compiled once
+        # per agent and output type.
+        output_type = agent.output_type
+        return _output_schema_cache.get_or_create(
+            agent, (output_type,), lambda: AgentOutputSchema(output_type)
+        )
 
     @classmethod
     def _get_handoffs(cls, agent: Agent[Any]) -> list[Handoff]:
+        fingerprint: list[Any] = []
+        for handoff_item in agent.handoffs:
+            fingerprint.append(handoff_item)
+            if isinstance(handoff_item, Agent):
+                # `handoff()` derives the tool name and description from the sub-agent.
+                fingerprint.extend([handoff_item.name, handoff_item.handoff_description])
+
+        return list(
+            _handoffs_cache.get_or_create(
+                agent, tuple(fingerprint), lambda: cls._build_handoffs(agent)
+            )
+        )
+
+    @classmethod
+    def _build_handoffs(cls, agent: Agent[Any]) -> list[Handoff]:
         handoffs = []
         for handoff_item in agent.handoffs:
             if isinstance(handoff_item, Handoff):
@@ -956,6 +1166,40 @@ class Runner:
     async def _get_all_tools(cls, agent: Agent[Any]) -> list[Tool]:
         return await agent.get_all_tools()
 
+    @classmethod
+    async def _build_model_input(
+        cls,
+        input_buffer: InputBuffer,
+        original_input: str | list[TResponseInputItem],
+        generated_items: list[RunItem],
+        system_prompt: str | None,
+        context_wrapper: RunContextWrapper[TContext],
+        run_config: RunConfig,
+    ) -> list[TResponseInputItem]:
+        input = input_buffer.build(original_input, generated_items)
+        if run_config.context_window is None:
+            return input
+
+        return await run_config.context_window.fit(
+            input,
+            system_prompt,
+            state=input_buffer.context_window_state,
+            model_provider=run_config.model_provider,
+            tracing=get_model_tracing_impl(
+                run_config.tracing_disabled, run_config.trace_include_sensitive_data
+            ),
+            context_wrapper=context_wrapper,
+        )
+
+    @classmethod
+    def _get_model_name(cls, agent: Agent[Any], run_config: RunConfig, model: Model) -> str:
+        if isinstance(run_config.model, str):
+            return run_config.model
+        if run_config.model is None and isinstance(agent.model, str):
+            return agent.model
+        name = getattr(model, "model", None)
+        return name if isinstance(name, str) else type(model).__name__
+
     @classmethod
     def _get_model(cls, agent: Agent[Any], run_config: RunConfig) -> Model:
         if isinstance(run_config.model, Model):
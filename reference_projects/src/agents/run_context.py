@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import Any, Generic
 
@@ -24,3 +26,19 @@ class RunContextWrapper(Generic[TContext]):
     """The usage of the agent run so far. For streamed responses, the usage will be stale until the
     last chunk of the stream is processed.
     """
+
+    usage_by_agent: dict[str, Usage] = field(default_factory=dict)
+    """The usage of the agent run so far, broken down by agent name."""
+
+    usage_by_model: dict[str, Usage] = field(default_factory=dict)
+    """The usage of the agent run so far, broken down by model name."""
+
+    def add_usage(
+        self, usage: Usage, *, agent_name: str | None = None, model_name: str | None = None
+    ) -> None:
+        """Adds the usage of a model request to the run's total and to its breakdowns."""
+        self.usage.add(usage)
+        if agent_name is not None:
+            self.usage_by_agent.setdefault(agent_name, Usage()).add(usage)
+        if model_name is not None:
+            self.usage_by_model.setdefault(model_name, Usage()).add(usage)
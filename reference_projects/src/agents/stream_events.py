@@ -34,6 +34,7 @@ class RunItemStreamEvent:
         "handoff_occured",
         "tool_called",
         "tool_output",
+        "tool_progress",
         "reasoning_item_created",
     ]
     """The name of the event."""
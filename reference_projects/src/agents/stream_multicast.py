@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from .exceptions import StreamSubscriberEvicted, UserError
+from .stream_events import StreamEvent
+
+if TYPE_CHECKING:
+    from .result import RunResultStreaming
+
+
+class StreamMulticast:
+    """Delivers the events of one streamed run to any number of subscribers. Created with
+    `RunResultStreaming.multicast()`.
+
+    Events are kept in a shared ring buffer of the last `buffer_size` events, and each subscriber
+    reads it through its own cursor. Subscribers receive the same event objects, so they must not
+    mutate them. The run is never held back for a slow subscriber: a subscriber that falls more
+    than its `max_lag` events behind is evicted, and its iterator raises `StreamSubscriberEvicted`.
+    """
+
+    def __init__(self, result: RunResultStreaming, buffer_size: int = 1024) -> None:
+        if buffer_size < 1:
+            raise UserError("buffer_size must be at least 1")
+        self.result = result
+        self.buffer_size = buffer_size
+        self._ring: list[StreamEvent | None] = [None] * buffer_size
+        self._end = 0
+        self._done = False
+        self._exception: BaseException | None = None
+        self._published = asyncio.Event()
+        self._task = asyncio.create_task(self._pump())
+
+    @property
+    def events_published(self) -> int:
+        """How many events the run has produced so far."""
+        return self._end
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the run's stream has ended."""
+        return self._done
+
+    def subscribe(self, replay: int = 0, max_lag: int | None = None) -> StreamSubscription:
+        """Returns a new subscriber.
+
+        Args:
+            replay: How many of the most recent events to deliver first, for subscribers that join
+                after the run has started. Limited to the events still in the buffer. Subscribers
+                created before the event loop has run the stream get every event.
+            max_lag: How far behind the newest event this subscriber may fall before it is
+                evicted. Defaults to, and can't exceed, `buffer_size`.
+        """
+        if replay < 0:
+            raise UserError("replay can't be negative")
+        lag = self.buffer_size if max_lag is None else min(max_lag, self.buffer_size)
+        start = max(0, self._end - min(replay, lag))
+        return StreamSubscription(self, start, lag)
+
+    async def wait_done(self) -> None:
+        """Waits until the run's stream has ended. Doesn't raise the run's exception."""
+        await asyncio.shield(self._task)
+
+    async def _pump(self) -> None:
+        try:
+            async for event in self.result.stream_events():
+                self._ring[self._end % self.buffer_size] = event
+                self._end += 1
+                self._notify()
+                # Let subscribers keep up when they can; eviction only happens to those that
+                # genuinely fall behind.
+                await asyncio.sleep(0)
+        except Exception as e:
+            self._exception = e
+        finally:
+            self._done = True
+            self._notify()
+
+    def _notify(self) -> None:
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+
+
+class StreamSubscription(AsyncIterator[StreamEvent]):
+    """One subscriber's cursor over a `StreamMulticast`. Iterate it with `async for` to get the
+    run's events in order. Once the run ends, iteration stops, or raises the run's exception.
+
+    `cursor` is the sequence number of the next event this subscriber will get, and `evicted` is
+    set if it fell too far behind.
+    """
+
+    def __init__(self, multicast: StreamMulticast, cursor: int, max_lag: int) -> None:
+        self.multicast = multicast
+        self.cursor = cursor
+        self.max_lag = max_lag
+        self.evicted = False
+        self._closed = False
+
+    @property
+    def lag(self) -> int:
+        """How many published events this subscriber hasn't read yet."""
+        return self.multicast._end - self.cursor
+
+    def close(self) -> None:
+        """Stops this subscriber. Iteration ends, and the run continues for everyone else."""
+        self._closed = True
+        self.multicast._notify()
+
+    def __aiter__(self) -> AsyncIterator[StreamEvent]:
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        multicast = self.multicast
+        while True:
+            if self._closed:
+                raise StopAsyncIteration
+            if self.lag > self.max_lag:
+                self.evicted = True
+                self._closed = True
+                raise StreamSubscriberEvicted(
+                    f"Stream subscriber fell {self.lag} events behind (max_lag={self.max_lag})"
+                )
+            if self.cursor < multicast._end:
+                event = multicast._ring[self.cursor % multicast.buffer_size]
+                self.cursor += 1
+                assert event is not None
+                return event
+            if multicast._done:
+                self._closed = True
+                if multicast._exception is not None:
+                    raise multicast._exception
+                raise StopAsyncIteration
+            await multicast._published.wait()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Generic, Literal
+
+from openai.types.responses import ResponseTextDeltaEvent
+from typing_extensions import TypeAlias, TypeVar
+
+from .stream_events import RawResponsesStreamEvent
+
+T = TypeVar("T")
+
+StreamBackpressurePolicy: TypeAlias = Literal["block", "coalesce"]
+"""What the run does when stream events are produced faster than they are consumed.
+
+- `block`: once the queue holds `max_size` events, the run waits for the consumer before it
+  reads more from the model.
+- `coalesce`: a text delta is merged into the newest queued event when that is a text delta for
+  the same content part, so a slow consumer gets fewer, larger deltas. The run only waits when the
+  queue is full and the newest event can't absorb the delta.
+"""
+
+
+@dataclass
+class StreamQueueSettings:
+    """Bounds and delivery options for the events of `Runner.run_streamed`."""
+
+    max_size: int | None = None
+    """The most raw response events to hold for the consumer. If not provided, the queue is
+    unbounded. Run item and agent updated events are few and are never held back by the bound.
+    """
+
+    backpressure: StreamBackpressurePolicy = "block"
+    """What to do when the consumer falls behind. See `StreamBackpressurePolicy`."""
+
+    flush_interval: float | None = None
+    """If set, `response.output_text.delta` events are merged and delivered at most once per
+    this many seconds, which cuts per-event overhead for consumers that fan events out. Any other
+    event flushes the merged delta first, so ordering is preserved. A merged delta counts towards
+    `max_size` like any other raw response event: if the queue is full when it is due, it is
+    delivered once the consumer makes room, and the backpressure policy applies to the run.
+    """
+
+
+class StreamEventQueue(Generic[T]):
+    """The queue between the run loop and `RunResultStreaming.stream_events()`. Raw response
+    events are added with `put()`, which applies the bound, backpressure policy and flush
+    interval; all other events are added with `put_nowait()`.
+    """
+
+    def __init__(self, settings: StreamQueueSettings | None = None) -> None:
+        self.settings = settings or StreamQueueSettings()
+        self._items: deque[T | RawResponsesStreamEvent] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._pending: list[ResponseTextDeltaEvent] = []
+        # Deltas coalesced into the newest queued event, merged once that event is sealed.
+        self._tail: list[ResponseTextDeltaEvent] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Whether the flush interval elapsed while the queue was full.
+        self._flush_due = False
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items and not self._pending
+
+    def full(self) -> bool:
+        max_size = self.settings.max_size
+        return max_size is not None and len(self._items) >= max_size
+
+    def put_nowait(self, item: T) -> None:
+        """Adds an event without waiting, regardless of the bound."""
+        self._flush_pending()
+        self._append(item)
+
+    async def put(self, item: T | RawResponsesStreamEvent) -> None:
+        """Adds a raw response event, waiting for the consumer if the queue is full."""
+        delta = _text_delta(item)
+        if delta is not None and self.settings.flush_interval is not None:
+            if self._pending and (self._flush_due or not _same_part(self._pending[-1], delta)):
+                await self._put_pending()
+            self._hold(delta)
+            return
+        await self._put_pending()
+        await self._put(item, delta)
+
+    async def _put(
+        self, item: T | RawResponsesStreamEvent, delta: ResponseTextDeltaEvent | None
+    ) -> None:
+        coalesce = self.settings.backpressure == "coalesce"
+        while True:
+            if delta is not None and coalesce and self._merge_into_newest(delta):
+                return
+            if not self.full():
+                break
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._append(item)
+
+    async def get(self) -> T | RawResponsesStreamEvent:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
+
+    def get_nowait(self) -> T | RawResponsesStreamEvent:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._pop()
+
+    def clear(self) -> None:
+        """Drops all queued events, including a held delta, and releases a waiting producer."""
+        self._items.clear()
+        self._pending.clear()
+        self._tail.clear()
+        self._cancel_flush()
+        self._not_full.set()
+
+    def _append(self, item: T | RawResponsesStreamEvent) -> None:
+        self._seal_tail()
+        self._items.append(item)
+        self._not_empty.set()
+
+    def _pop(self) -> T | RawResponsesStreamEvent:
+        if len(self._items) == 1:
+            self._seal_tail()
+        item = self._items.popleft()
+        if self._flush_due:
+            self._flush_pending()
+        if not self.full():
+            self._not_full.set()
+        return item
+
+    def _merge_into_newest(self, delta: ResponseTextDeltaEvent) -> bool:
+        # The deltas are only collected here. Merging on every call would copy the text merged so
+        # far each time, which is quadratic in the number of deltas.
+        newest = self._tail[-1] if self._tail else None
+        if newest is None and self._items:
+            newest = _text_delta(self._items[-1])
+        if newest is None or not _same_part(newest, delta):
+            return False
+        if not self._tail:
+            self._tail.append(newest)
+        self._tail.append(delta)
+        return True
+
+    def _seal_tail(self) -> None:
+        if self._tail:
+            self._items[-1] = RawResponsesStreamEvent(data=_merge(self._tail))
+            self._tail = []
+
+    def _hold(self, delta: ResponseTextDeltaEvent) -> None:
+        self._pending.append(delta)
+        if self._flush_handle is None and not self._flush_due:
+            assert self.settings.flush_interval is not None
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.settings.flush_interval, self._on_flush_interval
+            )
+
+    def _on_flush_interval(self) -> None:
+        self._flush_handle = None
+        if self.full():
+            # Delivered by the next get() or put(), whichever comes first.
+            self._flush_due = True
+        else:
+            self._flush_pending()
+
+    async def _put_pending(self) -> None:
+        self._cancel_flush()
+        if self._pending:
+            merged = _merge(self._pending)
+            self._pending = []
+            await self._put(RawResponsesStreamEvent(data=merged), merged)
+
+    def _flush_pending(self) -> None:
+        self._cancel_flush()
+        if self._pending:
+            # Used where the queue has room, and by put_nowait(): a held delta was produced before
+            # the event being added, and holding it back would reorder the stream.
+            self._append(RawResponsesStreamEvent(data=_merge(self._pending)))
+            self._pending = []
+
+    def _cancel_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._flush_due = False
+
+
+def _text_delta(item: object) -> ResponseTextDeltaEvent | None:
+    if isinstance(item, RawResponsesStreamEvent) and isinstance(item.data, ResponseTextDeltaEvent):
+        return item.data
+    return None
+
+
+def _same_part(a: ResponseTextDeltaEvent, b: ResponseTextDeltaEvent) -> bool:
+    return (
+        a.item_id == b.item_id
+        and a.output_index == b.output_index
+        and a.content_index == b.content_index
+    )
+
+
+def _merge(deltas: list[ResponseTextDeltaEvent]) -> ResponseTextDeltaEvent:
+    if len(deltas) == 1:
+        return deltas[0]
+    # Copy the newest event, so fields such as sequence numbers describe the end of the merge.
+    return deltas[-1].model_copy(update={"delta": "".join(d.delta for d in deltas)})
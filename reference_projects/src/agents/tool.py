@@ -1,25 +1,32 @@
 from __future__ import annotations
 
+import functools
+import importlib
 import inspect
 import json
-from collections.abc import Awaitable
+import logging
+import sys
+from collections.abc import AsyncIterator, Awaitable
 from dataclasses import dataclass
 from typing import Any, Callable, Literal, Union, overload
 
 from openai.types.responses.file_search_tool_param import Filters, RankingOptions
 from openai.types.responses.web_search_tool_param import UserLocation
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from typing_extensions import Concatenate, ParamSpec
 
 from . import _debug
 from .computer import AsyncComputer, Computer
-from .exceptions import ModelBehaviorError
-from .function_schema import DocstringStyle, function_schema
+from .exceptions import ModelBehaviorError, UserError
+from .function_schema import DocstringStyle, FuncSchema, function_schema
 from .items import RunItem
 from .logger import logger
 from .run_context import RunContextWrapper
-from .tracing import SpanError
+from .tool_cache import ToolCache
+from .tracing import FunctionSpanData, SpanError, get_current_span
 from .util import _error_tracing
+from .util._tool_executor import run_in_process_pool, run_in_tool_executor
+from .util._tool_progress import report_tool_progress
 from .util._types import MaybeAwaitable
 
 ToolParams = ParamSpec("ToolParams")
@@ -29,6 +36,13 @@ ToolFunctionWithContext = Callable[Concatenate[RunContextWrapper[Any], ToolParam
 
 ToolFunction = Union[ToolFunctionWithoutContext[ToolParams], ToolFunctionWithContext[ToolParams]]
 
+ToolExecutor = Literal["thread", "process", "inline"]
+"""Where a synchronous function tool runs. "thread" runs it on the run's tool executor (see
+`RunConfig.tool_executor_max_workers`), so blocking calls don't stall the event loop. "process" runs
+it in a worker process (see `RunConfig.tool_process_pool_max_workers`), so CPU-bound tools don't
+hold the GIL of the main process. "inline" runs it directly on the event loop, which is cheapest
+for tools that return immediately."""
+
 
 @dataclass
 class FunctionToolResult:
@@ -72,6 +86,12 @@ class FunctionTool:
     """Whether the JSON schema is in strict mode. We **strongly** recommend setting this to True,
     as it increases the likelihood of correct JSON input."""
 
+    speculative: bool = False
+    """Whether the tool may start while the model is still streaming the rest of its response, as
+    soon as the call's arguments are complete. Only mark tools that are safe to run before the
+    turn is processed, e.g. read-only lookups: if the turn fails, an early call may already have
+    run (or is cancelled). Only applies to streamed runs."""
+
 
 @dataclass
 class FileSearchTool:
@@ -141,6 +161,10 @@ def default_tool_error_function(ctx: RunContextWrapper[Any], error: Exception) -
 
 ToolErrorFunction = Callable[[RunContextWrapper[Any], Exception], MaybeAwaitable[str]]
 
+ToolCacheNamespaceFunction = Callable[[RunContextWrapper[Any]], str]
+"""Derives a cache namespace from the run context, e.g. a user or tenant ID, so that cached tool
+results aren't shared between callers that should see different results."""
+
 
 @overload
 def function_tool(
@@ -152,6 +176,11 @@ def function_tool(
     use_docstring_info: bool = True,
     failure_error_function: ToolErrorFunction | None = None,
     strict_mode: bool = True,
+    executor: ToolExecutor = "thread",
+    timeout: float | None = None,
+    cache: ToolCache | None = None,
+    cache_namespace: ToolCacheNamespaceFunction | None = None,
+    speculative: bool = False,
 ) -> FunctionTool:
     """Overload for usage as @function_tool (no parentheses)."""
     ...
@@ -166,6 +195,11 @@ def function_tool(
     use_docstring_info: bool = True,
     failure_error_function: ToolErrorFunction | None = None,
     strict_mode: bool = True,
+    executor: ToolExecutor = "thread",
+    timeout: float | None = None,
+    cache: ToolCache | None = None,
+    cache_namespace: ToolCacheNamespaceFunction | None = None,
+    speculative: bool = False,
 ) -> Callable[[ToolFunction[...]], FunctionTool]:
     """Overload for usage as @function_tool(...)."""
     ...
@@ -180,6 +214,11 @@ def function_tool(
     use_docstring_info: bool = True,
     failure_error_function: ToolErrorFunction | None = default_tool_error_function,
     strict_mode: bool = True,
+    executor: ToolExecutor = "thread",
+    timeout: float | None = None,
+    cache: ToolCache | None = None,
+    cache_namespace: ToolCacheNamespaceFunction | None = None,
+    speculative: bool = False,
 ) -> FunctionTool | Callable[[ToolFunction[...]], FunctionTool]:
     """
     Decorator to create a FunctionTool from a function. By default, we will:
@@ -191,6 +230,10 @@ def function_tool(
     If the function takes a `RunContextWrapper` as the first argument, it *must* match the
     context type of the agent that uses the tool.
 
+    The function can also be an async generator. Each value it yields is surfaced as a
+    `tool_progress` event in streamed runs, and the output sent to the model is the yielded
+    strings joined together (or a list of the yielded values, if they aren't all strings).
+
     Args:
         func: The function to wrap.
         name_override: If provided, use this name for the tool instead of the function's name.
@@ -208,6 +251,25 @@ def function_tool(
             If False, it allows non-strict JSON schemas. For example, if a parameter has a default
             value, it will be optional, additional properties are allowed, etc. See here for more:
             https://platform.openai.com/docs/guides/structured-outputs?api-mode=responses#supported-schemas
+        executor: Where to run the function if it is synchronous. By default, it runs on the tool
+            executor configured by `RunConfig.tool_executor_max_workers`, so that blocking I/O
+            doesn't stall the event loop. Pass "process" for CPU-bound functions, to run them in
+            a worker process; the function and its return value must be picklable, and it can't
+            take a `RunContextWrapper`. Pass "inline" to call it directly on the event loop.
+            Async functions always run on the event loop.
+        timeout: The maximum number of seconds a call may take. Only supported with
+            `executor="process"`, where the worker running a timed out call is terminated. A
+            timeout is reported as a tool error. The first calls on a new pool also include the
+            time it takes to start a worker process.
+        cache: If provided, results are stored in this cache and reused for later calls with the
+            same arguments, within and across runs. Concurrent calls with the same arguments run
+            the function once. Only use this for tools whose result depends on nothing but their
+            arguments. Errors aren't cached.
+        cache_namespace: If provided, called with the run context to get a namespace that is
+            added to cache keys, e.g. to keep cached results separate per user.
+        speculative: Whether the tool may start in streamed runs as soon as the model has finished
+            streaming its arguments, before the rest of the response. See
+            `FunctionTool.speculative`.
     """
 
     def _create_function_tool(the_func: ToolFunction[...]) -> FunctionTool:
@@ -219,53 +281,102 @@ def function_tool(
             use_docstring_info=use_docstring_info,
             strict_json_schema=strict_mode,
         )
+        process_ref: tuple[str, str] | None = None
+        if executor == "process":
+            process_ref = _register_process_tool(the_func, schema)
+        elif timeout is not None:
+            raise UserError(
+                f"Tool {schema.name}: timeout is only supported with executor='process'"
+            )
+        if cache_namespace is not None and cache is None:
+            raise UserError(f"Tool {schema.name}: cache_namespace requires a cache")
+
+        is_async = inspect.iscoroutinefunction(the_func)
+        is_async_generator = inspect.isasyncgenfunction(the_func)
 
         async def _on_invoke_tool_impl(ctx: RunContextWrapper[Any], input: str) -> Any:
-            try:
-                json_data: dict[str, Any] = json.loads(input) if input else {}
-            except Exception as e:
-                if _debug.DONT_LOG_TOOL_DATA:
-                    logger.debug(f"Invalid JSON input for tool {schema.name}")
-                else:
-                    logger.debug(f"Invalid JSON input for tool {schema.name}: {input}")
-                raise ModelBehaviorError(
-                    f"Invalid JSON input for tool {schema.name}: {input}"
-                ) from e
-
-            if _debug.DONT_LOG_TOOL_DATA:
-                logger.debug(f"Invoking tool {schema.name}")
-            else:
+            # Formatting tool arguments and results for the log can cost more than dispatching the
+            # call, so only do it when it will actually be logged.
+            log_tool_data = not _debug.DONT_LOG_TOOL_DATA and logger.isEnabledFor(logging.DEBUG)
+            if log_tool_data:
                 logger.debug(f"Invoking tool {schema.name} with input {input}")
+            else:
+                logger.debug("Invoking tool %s", schema.name)
 
             try:
-                parsed = (
-                    schema.params_pydantic_model(**json_data)
-                    if json_data
-                    else schema.params_pydantic_model()
-                )
+                parsed = schema.validate_json(input)
             except ValidationError as e:
+                if _is_invalid_json(e):
+                    if _debug.DONT_LOG_TOOL_DATA:
+                        logger.debug(f"Invalid JSON input for tool {schema.name}")
+                    else:
+                        logger.debug(f"Invalid JSON input for tool {schema.name}: {input}")
+                    raise ModelBehaviorError(
+                        f"Invalid JSON input for tool {schema.name}: {input}"
+                    ) from e
                 raise ModelBehaviorError(f"Invalid JSON input for tool {schema.name}: {e}") from e
 
+            if cache is None:
+                return await _call(ctx, parsed, log_tool_data)
+
+            namespace = cache_namespace(ctx) if cache_namespace is not None else ""
+            key = _tool_cache_key(schema.name, namespace, parsed)
+            result, hit = await cache.get_or_compute(key, lambda: _call(ctx, parsed, log_tool_data))
+            current_span = get_current_span()
+            if current_span is not None and isinstance(current_span.span_data, FunctionSpanData):
+                current_span.span_data.cache_hit = hit
+            if hit:
+                logger.debug("Tool %s result served from cache", schema.name)
+            return result
+
+        async def _call(ctx: RunContextWrapper[Any], parsed: BaseModel, log_tool_data: bool) -> Any:
+            if process_ref is not None:
+                # The params model is built dynamically and can't be pickled, so the worker gets
+                # the validated arguments as JSON and binds them with its own copy of the schema.
+                result = await run_in_process_pool(
+                    _invoke_in_process,
+                    *process_ref,
+                    parsed.model_dump_json(),
+                    timeout=timeout,
+                    name=schema.name,
+                )
+                if log_tool_data:
+                    logger.debug(f"Tool {schema.name} returned {result}")
+                else:
+                    logger.debug("Tool %s completed.", schema.name)
+                return result
+
             args, kwargs_dict = schema.to_call_args(parsed)
 
-            if not _debug.DONT_LOG_TOOL_DATA:
+            if log_tool_data:
                 logger.debug(f"Tool call args: {args}, kwargs: {kwargs_dict}")
 
-            if inspect.iscoroutinefunction(the_func):
+            if is_async_generator:
+                if schema.takes_context:
+                    partial_outputs = the_func(ctx, *args, **kwargs_dict)
+                else:
+                    partial_outputs = the_func(*args, **kwargs_dict)
+                result = await _collect_partial_outputs(partial_outputs)
+            elif is_async:
                 if schema.takes_context:
                     result = await the_func(ctx, *args, **kwargs_dict)
                 else:
                     result = await the_func(*args, **kwargs_dict)
-            else:
+            elif executor == "inline":
                 if schema.takes_context:
                     result = the_func(ctx, *args, **kwargs_dict)
                 else:
                     result = the_func(*args, **kwargs_dict)
-
-            if _debug.DONT_LOG_TOOL_DATA:
-                logger.debug(f"Tool {schema.name} completed.")
             else:
+                if schema.takes_context:
+                    result = await run_in_tool_executor(the_func, ctx, *args, **kwargs_dict)
+                else:
+                    result = await run_in_tool_executor(the_func, *args, **kwargs_dict)
+
+            if log_tool_data:
                 logger.debug(f"Tool {schema.name} returned {result}")
+            else:
+                logger.debug("Tool %s completed.", schema.name)
 
             return result
 
@@ -297,6 +408,7 @@ def function_tool(
             params_json_schema=schema.params_json_schema,
             on_invoke_tool=_on_invoke_tool,
             strict_json_schema=strict_mode,
+            speculative=speculative,
         )
 
     # If func is actually a callable, we were used as @function_tool with no parentheses
@@ -308,3 +420,76 @@ def function_tool(
         return _create_function_tool(real_func)
 
     return decorator
+
+
+def _tool_cache_key(tool_name: str, namespace: str, parsed: BaseModel) -> str:
+    # Keys are built from the validated arguments rather than the raw input, so that key order,
+    # whitespace and omitted defaults don't cause misses.
+    return json.dumps(
+        [tool_name, namespace, parsed.model_dump(mode="json")],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _is_invalid_json(error: ValidationError) -> bool:
+    """Whether the tool input wasn't JSON at all, as opposed to JSON that doesn't match the
+    parameters."""
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
+async def _collect_partial_outputs(partial_outputs: AsyncIterator[Any]) -> Any:
+    """Reports each value a streaming tool yields as progress, and aggregates them into the output
+    sent to the model: strings are concatenated, anything else is returned as a list.
+    """
+    values = []
+    async for value in partial_outputs:
+        values.append(value)
+        report_tool_progress(value)
+    if all(isinstance(value, str) for value in values):
+        return "".join(values)
+    return values
+
+
+def _register_process_tool(func: ToolFunction[...], schema: FuncSchema) -> tuple[str, str]:
+    """Checks that `func` can run in a worker process, and returns the module and attribute name
+    the worker finds it under.
+
+    Functions can't be sent to a worker by pickling them: pickle looks them up by their qualified
+    name, which `@function_tool(executor="process")` rebinds to the returned `FunctionTool`. So
+    the function is also stored under a private alias in its module. A worker imports the module,
+    which runs the decorator there too, and looks the function up under the alias.
+    """
+    if inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func):
+        raise UserError(f"Tool {schema.name}: executor='process' requires a sync function")
+    if schema.takes_context:
+        raise UserError(
+            f"Tool {schema.name}: executor='process' doesn't support a RunContextWrapper argument"
+        )
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    name = getattr(func, "__name__", "")
+    if module is None or getattr(func, "__qualname__", None) != name:
+        raise UserError(
+            f"Tool {schema.name}: executor='process' requires a module-level function, so that "
+            "worker processes can import it"
+        )
+    if getattr(module, name, None) is func:
+        # e.g. `function_tool(func, executor="process")`, which leaves the name bound to func.
+        return module.__name__, name
+    alias = f"_process_tool_{name}"
+    setattr(module, alias, func)
+    return module.__name__, alias
+
+
+@functools.lru_cache(maxsize=None)
+def _process_tool_schema(func: ToolFunction[...]) -> FuncSchema:
+    return function_schema(func, use_docstring_info=False)
+
+
+def _invoke_in_process(module_name: str, attribute: str, input: str) -> Any:
+    """Runs in a process pool worker."""
+    func = getattr(importlib.import_module(module_name), attribute)
+    schema = _process_tool_schema(func)
+    parsed = schema.validate_json(input)
+    args, kwargs = schema.to_call_args(parsed)
+    return func(*args, **kwargs)
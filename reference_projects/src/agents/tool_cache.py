@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import abc
+import asyncio
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from .logger import logger
+from .util._lru import LRUStore
+
+
+@dataclass(frozen=True)
+class CachedToolResult:
+    """A tool result found in a `ToolCache`."""
+
+    value: Any
+    """The tool's output. May be `None`, which is why lookups return this wrapper."""
+
+
+class ToolCache(abc.ABC):
+    """Stores function tool results, so that repeated calls with the same arguments don't re-run
+    the tool. Pass an instance to `function_tool(cache=...)`. One cache can be shared by several
+    tools, since keys include the tool name. Guardrails accept the same caches for their verdicts,
+    e.g. `input_guardrail(cache=...)`.
+
+    Only use a cache for tools whose result depends on nothing but their arguments (and the
+    namespace, if given), e.g. documentation search or configuration lookups.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, _InFlight] = {}
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> CachedToolResult | None:
+        """Returns the result stored under `key`, or `None` if there is none."""
+        pass
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """Stores a tool result under `key`."""
+        pass
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Returns the result stored under `key`, calling `compute` and storing its result on a
+        miss. Concurrent misses for the same key share a single `compute` call, which runs in its
+        own task until the result is stored: a caller that is cancelled doesn't affect the others,
+        and the call is only cancelled once every caller waiting for it is. Errors aren't cached.
+
+        Returns:
+            The result, and whether it came from the cache (or from a call already in flight).
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached.value, True
+
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(key)
+        joined = in_flight is not None and in_flight.task.get_loop() is loop
+        if in_flight is None or not joined:
+            in_flight = _InFlight(loop.create_task(self._compute_and_set(key, compute)))
+            self._in_flight[key] = in_flight
+
+        in_flight.waiters += 1
+        try:
+            value = await asyncio.shield(in_flight.task)
+        finally:
+            in_flight.waiters -= 1
+            if in_flight.waiters == 0 and not in_flight.task.done():
+                # Every caller was cancelled, so nobody needs the result any more.
+                in_flight.task.cancel()
+        return value, joined
+
+    async def _compute_and_set(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+            # Still in flight while the result is stored, so callers that miss in the meantime
+            # join this call instead of starting another.
+            await self.set(key, value)
+            return value
+        finally:
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None and in_flight.task is asyncio.current_task():
+                del self._in_flight[key]
+
+
+@dataclass
+class _InFlight:
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class LRUToolCache(ToolCache):
+    """An in-memory cache that keeps the `maxsize` most recently used results. If `ttl` is set,
+    results also expire that many seconds after they were stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None) -> None:
+        super().__init__()
+        self._store: LRUStore[CachedToolResult] = LRUStore(maxsize, ttl)
+
+    @property
+    def maxsize(self) -> int:
+        return self._store.maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        return self._store.ttl
+
+    async def get(self, key: str) -> CachedToolResult | None:
+        return self._store.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        self._store.set(key, CachedToolResult(value))
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+class TTLToolCache(LRUToolCache):
+    """An in-memory cache whose results expire `ttl` seconds after they were stored. At most
+    `maxsize` results are kept, evicting the least recently used.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+
+class DiskToolCache(ToolCache):
+    """A cache that pickles results to files in `directory`, so they survive restarts and can be
+    shared by processes on the same machine. If `ttl` is set, results expire that many seconds
+    after they were stored.
+
+    Results must be picklable. Only point this at a directory you trust, since loading a pickle
+    can run arbitrary code.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], ttl: float | None = None) -> None:
+        super().__init__()
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def get(self, key: str) -> CachedToolResult | None:
+        return await asyncio.to_thread(self._read, self._path(key))
+
+    async def set(self, key: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value)
+        except Exception as e:
+            logger.warning(f"Not caching unpicklable tool result for {key}: {e}")
+            return
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+
+    def _read(self, path: Path) -> CachedToolResult | None:
+        try:
+            if self.ttl is not None and path.stat().st_mtime + self.ttl <= time.time():
+                path.unlink(missing_ok=True)
+                return None
+            with path.open("rb") as f:
+                return CachedToolResult(pickle.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable tool cache entry {path}: {e}")
+            return None
+
+    def _write(self, path: Path, data: bytes) -> None:
+        # Write to a temporary file first, so readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
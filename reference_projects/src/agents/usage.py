@@ -1,4 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openai.types.responses import ResponseUsage
 
 
 @dataclass
@@ -15,8 +21,42 @@ class Usage:
     total_tokens: int = 0
     """Total tokens sent and received, across all requests."""
 
-    def add(self, other: "Usage") -> None:
+    cached_input_tokens: int = 0
+    """Input tokens served from the provider's prompt cache, across all requests. These are
+    included in `input_tokens`. Not reported by all model providers.
+    """
+
+    reasoning_tokens: int = 0
+    """Output tokens spent on reasoning, across all requests. These are included in
+    `output_tokens`. Not reported by all model providers.
+    """
+
+    latency: float = 0.0
+    """Time spent waiting for model responses, in seconds, summed across all requests. For a
+    single request, this is that request's latency.
+    """
+
+    def add(self, other: Usage) -> None:
         self.requests += other.requests if other.requests else 0
         self.input_tokens += other.input_tokens if other.input_tokens else 0
         self.output_tokens += other.output_tokens if other.output_tokens else 0
         self.total_tokens += other.total_tokens if other.total_tokens else 0
+        self.cached_input_tokens += other.cached_input_tokens if other.cached_input_tokens else 0
+        self.reasoning_tokens += other.reasoning_tokens if other.reasoning_tokens else 0
+        self.latency += other.latency if other.latency else 0.0
+
+    @classmethod
+    def from_response_usage(cls, usage: ResponseUsage | None) -> Usage:
+        """Converts the usage of a single OpenAI Responses API response."""
+        if usage is None:
+            return cls()
+        input_details = getattr(usage, "input_tokens_details", None)
+        output_details = getattr(usage, "output_tokens_details", None)
+        return cls(
+            requests=1,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            total_tokens=usage.total_tokens,
+            cached_input_tokens=(input_details.cached_tokens or 0) if input_details else 0,
+            reasoning_tokens=(output_details.reasoning_tokens or 0) if output_details else 0,
+        )
@@ -1,2 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+
+
 async def noop_coroutine() -> None:
     pass
+
+
+async def gather_or_cancel(first: Awaitable[T1], second: Awaitable[T2]) -> tuple[T1, T2]:
+    """Like `asyncio.gather`, but as soon as one of the awaitables raises, the other is cancelled
+    before the exception is raised, instead of being left running in the background.
+    """
+    first_task = asyncio.ensure_future(first)
+    second_task = asyncio.ensure_future(second)
+    tasks: list[asyncio.Future[Any]] = [first_task, second_task]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        # Retrieve every exception, so one that isn't raised (e.g. because both awaitables failed)
+        # isn't reported as never retrieved.
+        errors = [task.exception() for task in tasks if not task.cancelled()]
+    for exc in errors:
+        if exc is not None:
+            raise exc
+    return first_task.result(), second_task.result()
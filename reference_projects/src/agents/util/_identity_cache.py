@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import itertools
+import weakref
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+_cache_ids = itertools.count()
+
+
+class IdentityCache(Generic[T]):
+    """Memoizes a value derived from an object, keyed on the object's identity.
+
+    Agents, tools and handoffs are mutable dataclasses, so they can't be hashed. Instead, each
+    entry is stored on the object itself, under a private attribute, together with a fingerprint
+    of the fields the value depends on. A lookup only hits if the fingerprint still matches, so
+    mutating one of those fields invalidates the entry. Because the cache holds no strong
+    references, an entry lives exactly as long as its object: values that refer back to other
+    cached objects (e.g. handoffs between agents that hand off to each other) form ordinary cycles
+    that the garbage collector reclaims. Copies made with `Agent.clone()` are new objects and
+    therefore start with an empty entry.
+    """
+
+    def __init__(self) -> None:
+        self._attribute = f"_identity_cache_{next(_cache_ids)}"
+        # Weak references only, for `clear()` and `__len__()`.
+        self._refs: dict[int, weakref.ref[Any]] = {}
+
+    def get_or_create(self, obj: Any, fingerprint: tuple[Any, ...], factory: Callable[[], T]) -> T:
+        """Returns the cached value for `obj`, calling `factory` if there is no entry or the
+        fingerprint changed.
+
+        Fingerprint elements are compared by identity, except strings, which are compared by value.
+        """
+        attributes = getattr(obj, "__dict__", None)
+        if attributes is None:
+            # Objects without an instance dict are never cached.
+            return factory()
+
+        entry: tuple[tuple[Any, ...], T] | None = attributes.get(self._attribute)
+        if entry is not None and _fingerprints_match(entry[0], fingerprint):
+            return entry[1]
+
+        value = factory()
+        key = id(obj)
+        if key not in self._refs:
+            try:
+                self._refs[key] = weakref.ref(obj, lambda _: self._refs.pop(key, None))
+            except TypeError:
+                return value
+        # Set through the dict so that frozen dataclasses and custom `__setattr__`s are bypassed.
+        attributes[self._attribute] = (fingerprint, value)
+        return value
+
+    def clear(self) -> None:
+        for ref in self._refs.values():
+            obj = ref()
+            if obj is not None:
+                obj.__dict__.pop(self._attribute, None)
+        self._refs.clear()
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
+def _fingerprints_match(a: tuple[Any, ...], b: tuple[Any, ...]) -> bool:
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if x is y:
+            continue
+        if isinstance(x, str) and isinstance(y, str) and x == y:
+            continue
+        return False
+    return True
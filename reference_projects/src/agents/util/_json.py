@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import Literal
+import base64
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import pathlib
+import uuid
+from typing import Any, Literal
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing_extensions import TypeVar
 
-from ..exceptions import ModelBehaviorError
+from ..exceptions import ModelBehaviorError, UserError
 from ..tracing import SpanError
 from ._error_tracing import attach_error_to_current_span
 
@@ -29,3 +37,34 @@ def validate_json(json_str: str, type_adapter: TypeAdapter[T], partial: bool) ->
         raise ModelBehaviorError(
             f"Invalid JSON when parsing {json_str} for {type_adapter}; {e}"
         ) from e
+
+
+def canonical_json_default(value: Any, *, exclude_unset: bool = False) -> Any:
+    """A `default` for `json.dumps` when the encoding is hashed into a cache key, so it must be the
+    same for equal values in every process. Supports pydantic models, dataclasses, enums, sets,
+    bytes, dates and times, paths, decimals and UUIDs.
+
+    Raises:
+        UserError: For any other type. Its `repr` would usually include a memory address, so the
+            key would never match again.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_unset=exclude_unset)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            value, key=lambda item: json.dumps(item, sort_keys=True, default=canonical_json_default)
+        )
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (pathlib.PurePath, decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise UserError(
+        f"Can't build a cache key from a value of type {type(value).__qualname__}. Use JSON "
+        "types, pydantic models or dataclasses."
+    )
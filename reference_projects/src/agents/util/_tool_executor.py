@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import sys
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from ..logger import logger
+
+T = TypeVar("T")
+
+PROCESS_MAX_TASKS_PER_CHILD = 100
+"""Tool calls after which a process pool worker is replaced by a fresh one, so that leaks in
+long-running tools don't accumulate. Requires Python 3.11+."""
+
+
+@dataclass(frozen=True)
+class ToolExecutors:
+    """The executors that function tools started in the current context run on."""
+
+    thread_pool: Executor | None = None
+    """Where sync tools run. `None` means the event loop's default executor."""
+
+    process_pool_max_workers: int | None = None
+    """Size of the process pool for tools created with `executor="process"`. `None` means the
+    number of CPUs."""
+
+
+_current_executors: contextvars.ContextVar[ToolExecutors] = contextvars.ContextVar(
+    "current_tool_executors", default=ToolExecutors()
+)
+
+_thread_pools: dict[int, ThreadPoolExecutor] = {}
+_process_pools: dict[int | None, _ProcessPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_thread_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Returns the process-wide thread pool for sync tools with the given number of workers. Pools
+    are shared between runs, so concurrent runs with the same config don't each spawn threads.
+    """
+    with _pools_lock:
+        pool = _thread_pools.get(max_workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="agents-function-tool"
+            )
+            _thread_pools[max_workers] = pool
+        return pool
+
+
+@contextmanager
+def use_tool_executors(executors: ToolExecutors) -> Iterator[None]:
+    """Runs function tools started in this context on the given executors."""
+    token = _current_executors.set(executors)
+    try:
+        yield
+    finally:
+        _current_executors.reset(token)
+
+
+async def run_in_tool_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a sync function on the current tool thread pool without blocking the event loop. The
+    function runs in a copy of the current context, so it sees the current trace and span.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_current_executors.get().thread_pool, call)
+
+
+async def run_in_process_pool(
+    func: Callable[..., T], *args: Any, timeout: float | None = None, name: str = ""
+) -> T:
+    """Runs a picklable function with picklable arguments on the current tool process pool.
+
+    If the call doesn't finish within `timeout` seconds, a `TimeoutError` is raised. The pool the
+    call ran on is then retired: new calls go to a fresh pool, and the old pool's workers, including
+    the one stuck on the timed out call, are terminated once its other calls have finished.
+    """
+    max_workers = _current_executors.get().process_pool_max_workers
+    with _pools_lock:
+        pool = _process_pools.get(max_workers)
+        if pool is None:
+            pool = _ProcessPool(max_workers)
+            _process_pools[max_workers] = pool
+        future = pool.submit(func, *args)
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except asyncio.TimeoutError:
+        with _pools_lock:
+            if _process_pools.get(max_workers) is pool:
+                del _process_pools[max_workers]
+        logger.warning(f"Tool {name} timed out after {timeout}s, recycling its process pool")
+        pool.retire(future)
+        raise TimeoutError(f"Tool {name} timed out after {timeout} seconds") from None
+
+
+class _ProcessPool:
+    def __init__(self, max_workers: int | None) -> None:
+        kwargs: dict[str, Any] = {}
+        if sys.version_info >= (3, 11):
+            kwargs["max_tasks_per_child"] = PROCESS_MAX_TASKS_PER_CHILD
+        # Forking a process that runs an event loop and worker threads isn't safe, so workers are
+        # always spawned.
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"), **kwargs
+        )
+        self._lock = threading.Lock()
+        self._pending: set[Future[Any]] = set()
+        self._stuck: set[Future[Any]] = set()
+        self._retired = False
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+
+    def submit(self, func: Callable[..., T], *args: Any) -> Future[T]:
+        future = self._executor.submit(func, *args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def retire(self, stuck: Future[Any]) -> None:
+        """Stops accepting calls and terminates the workers once only stuck calls are left."""
+        # ProcessPoolExecutor has no public API to kill a busy worker before Python 3.14, and
+        # shutdown() drops its references to the workers, so take them first.
+        self._workers = list((getattr(self._executor, "_processes", None) or {}).values())
+        with self._lock:
+            self._retired = True
+            self._stuck.add(stuck)
+        self._executor.shutdown(wait=False)
+        self._terminate_if_idle()
+
+    def _on_done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+            self._stuck.discard(future)
+        self._terminate_if_idle()
+
+    def _terminate_if_idle(self) -> None:
+        with self._lock:
+            if not self._retired or self._pending - self._stuck:
+                return
+        for process in self._workers:
+            if process.is_alive():
+                process.terminate()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Callable
+
+ToolProgressCallback = Callable[[Any], None]
+
+_current_callback: contextvars.ContextVar[ToolProgressCallback | None] = contextvars.ContextVar(
+    "current_tool_progress_callback", default=None
+)
+
+
+@contextmanager
+def reporting_tool_progress(callback: ToolProgressCallback) -> Iterator[None]:
+    """Sends partial outputs of the function tool called in this context to `callback`."""
+    token = _current_callback.set(callback)
+    try:
+        yield
+    finally:
+        _current_callback.reset(token)
+
+
+def report_tool_progress(partial_output: Any) -> None:
+    """Reports a partial output of the current tool call. Does nothing if nobody is listening,
+    e.g. in a non-streamed run.
+    """
+    callback = _current_callback.get()
+    if callback is not None:
+        callback(partial_output)
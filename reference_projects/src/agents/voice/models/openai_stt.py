@@ -328,6 +328,9 @@ class OpenAISTTTranscriptionSession(StreamedTranscriptionSession):
 
     async def transcribe_turns(self) -> AsyncIterator[str]:
         self._connection_task = asyncio.create_task(self._process_websocket_connection())
+        # The task reports its error through the output queue first, and may only finish raising
+        # it after _check_errors() has run, so retrieve it here to avoid an unretrieved exception.
+        self._connection_task.add_done_callback(_retrieve_exception)
 
         while True:
             try:
@@ -362,6 +365,11 @@ class OpenAISTTTranscriptionSession(StreamedTranscriptionSession):
         self._cleanup_tasks()
 
 
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
 class OpenAISTTModel(STTModel):
     """A speech-to-text model for OpenAI."""
 
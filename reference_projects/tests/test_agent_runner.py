@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import gc
 import json
+import time
 from typing import Any
 
 import pytest
@@ -536,6 +539,71 @@ async def test_input_guardrail_tripwire_triggered_causes_exception():
         await Runner.run(agent, input="user_message")
 
 
+class SlowModel(FakeModel):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = False
+
+    async def get_response(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return await super().get_response(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_input_guardrail_tripwire_cancels_the_model_call():
+    async def guardrail_function(
+        context: RunContextWrapper[Any], agent: Agent[Any], input: Any
+    ) -> GuardrailFunctionOutput:
+        await asyncio.sleep(0.01)
+        return GuardrailFunctionOutput(output_info=None, tripwire_triggered=True)
+
+    model = SlowModel()
+    model.set_next_output([get_text_message("user_message")])
+    agent = Agent(
+        name="test",
+        model=model,
+        input_guardrails=[InputGuardrail(guardrail_function=guardrail_function)],
+    )
+
+    started = time.perf_counter()
+    with pytest.raises(InputGuardrailTripwireTriggered):
+        await Runner.run(agent, input="user_message")
+
+    assert time.perf_counter() - started < 5
+    assert model.cancelled
+
+
+@pytest.mark.asyncio
+async def test_input_guardrail_tripwire_retrieves_a_failed_model_call():
+    def guardrail_function(
+        context: RunContextWrapper[Any], agent: Agent[Any], input: Any
+    ) -> GuardrailFunctionOutput:
+        return GuardrailFunctionOutput(output_info=None, tripwire_triggered=True)
+
+    model = FakeModel()
+    model.set_next_output(ValueError("model error"))
+    agent = Agent(
+        name="test",
+        model=model,
+        input_guardrails=[InputGuardrail(guardrail_function=guardrail_function)],
+    )
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict[str, Any]] = []
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    try:
+        with pytest.raises(InputGuardrailTripwireTriggered):
+            await Runner.run(agent, input="user_message")
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unhandled == []
+
+
 @pytest.mark.asyncio
 async def test_output_guardrail_tripwire_triggered_causes_exception():
     def guardrail_function(
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+from pydantic import BaseModel
+
+from agents import Agent, Handoff, Runner, handoff
+from agents.models.chatcmpl_converter import Converter
+from agents.models.openai_responses import Converter as ResponsesConverter
+from agents.util._identity_cache import IdentityCache
+
+from .test_responses import get_function_tool
+
+
+class Foo(BaseModel):
+    bar: str
+
+
+class Baz(BaseModel):
+    qux: int
+
+
+def test_output_schema_is_compiled_once_per_agent():
+    agent = Agent(name="test", output_type=Foo)
+
+    schema = Runner._get_output_schema(agent)
+    assert Runner._get_output_schema(agent) is schema
+
+    agent.output_type = Baz
+    new_schema = Runner._get_output_schema(agent)
+    assert new_schema is not schema
+    assert new_schema is not None
+    assert new_schema.name() == "Baz"
+
+
+def test_clone_gets_its_own_compiled_artifacts():
+    sub_agent = Agent(name="sub")
+    agent = Agent(name="test", output_type=Foo, handoffs=[sub_agent])
+
+    schema = Runner._get_output_schema(agent)
+    handoffs = Runner._get_handoffs(agent)
+
+    clone = agent.clone(output_type=Baz)
+    clone_schema = Runner._get_output_schema(clone)
+    assert clone_schema is not None and clone_schema.name() == "Baz"
+    assert Runner._get_output_schema(agent) is schema
+    assert Runner._get_handoffs(clone)[0] is not handoffs[0]
+
+
+def test_handoffs_are_reused_until_handoffs_change():
+    sub_agent = Agent(name="sub", handoff_description="first")
+    custom = handoff(Agent(name="custom"))
+    agent = Agent(name="test", handoffs=[sub_agent])
+
+    first = Runner._get_handoffs(agent)
+    assert Runner._get_handoffs(agent)[0] is first[0]
+
+    sub_agent.handoff_description = "second"
+    second = Runner._get_handoffs(agent)
+    assert second[0] is not first[0]
+    assert second[0].tool_description.endswith("second")
+
+    agent.handoffs.append(custom)
+    third = Runner._get_handoffs(agent)
+    assert len(third) == 2
+    assert third[0].tool_description == second[0].tool_description
+    assert isinstance(third[1], Handoff) and third[1] is custom
+
+
+def test_tool_params_are_converted_once():
+    tool = get_function_tool("foo", "result")
+
+    first = Converter.tool_to_openai(tool)
+    assert Converter.tool_to_openai(tool) is first
+    responses_params = ResponsesConverter.convert_tools([tool], []).tools[0]
+    assert ResponsesConverter.convert_tools([tool], []).tools[0] is responses_params
+
+    tool.description = "new description"
+    assert Converter.tool_to_openai(tool)["function"].get("description") == "new description"
+
+
+def test_identity_cache_drops_collected_objects():
+    cache: IdentityCache[str] = IdentityCache()
+    agent = Agent(name="test")
+    cache.get_or_create(agent, ("a",), lambda: "value")
+    assert len(cache) == 1
+
+    del agent
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_agents_that_hand_off_to_each_other_are_collected():
+    first = Agent(name="first")
+    second = Agent(name="second", handoffs=[first])
+    first.handoffs.append(second)
+    Runner._get_handoffs(first)
+    Runner._get_handoffs(second)
+    refs = [weakref.ref(first), weakref.ref(second)]
+
+    del first, second
+    gc.collect()
+    assert all(ref() is None for ref in refs)
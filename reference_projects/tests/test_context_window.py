@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from agents import (
+    Agent,
+    ContextWindow,
+    DropOldToolOutputs,
+    KeepLastTurns,
+    RunConfig,
+    Runner,
+    SummarizeOldTurns,
+    Usage,
+    estimate_tokens,
+    function_tool,
+)
+from agents.context_window import split_turns
+from agents.items import ModelResponse, TResponseInputItem
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+TURNS = 12
+
+
+class InputRecordingModel(FakeModel):
+    """Records the input of every turn, not just the last one."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inputs: list[list[TResponseInputItem]] = []
+
+    async def get_response(
+        self, system_instructions: str | None, input: Any, *args: Any, **kwargs: Any
+    ) -> ModelResponse:
+        self.inputs.append(list(input))
+        return await super().get_response(system_instructions, input, *args, **kwargs)
+
+
+@function_tool
+def read_file(path: str) -> str:
+    return f"contents of {path}: " + "x" * 2000
+
+
+def tool_calling_turns(turns: int) -> list[list[Any]]:
+    outputs: list[list[Any]] = []
+    for i in range(turns):
+        call = get_function_tool_call("read_file", json.dumps({"path": f"file{i}"}))
+        call.call_id = f"call_{i}"
+        outputs.append([get_text_message(f"reading {i}"), call])
+    outputs.append([get_text_message("done")])
+    return outputs
+
+
+def assert_no_orphans(items: list[TResponseInputItem]) -> None:
+    calls = {item["call_id"] for item in items if item.get("type") == "function_call"}
+    outputs = {item["call_id"] for item in items if item.get("type") == "function_call_output"}
+    assert calls == outputs
+
+
+async def run_long(config: RunConfig) -> InputRecordingModel:
+    model = InputRecordingModel()
+    model.add_multiple_turn_outputs(tool_calling_turns(TURNS))
+    agent = Agent(name="test", model=model, tools=[read_file])
+    result = await Runner.run(agent, input="read all files", run_config=config, max_turns=50)
+    assert result.final_output == "done"
+    return model
+
+
+def tokens(items: list[TResponseInputItem]) -> int:
+    return sum(estimate_tokens(item) for item in items)
+
+
+def test_split_turns_keeps_calls_with_outputs():
+    items: list[Any] = [
+        {"role": "user", "content": "hi"},
+        {"type": "message", "role": "assistant", "content": []},
+        {"type": "function_call", "call_id": "1", "name": "a", "arguments": "{}"},
+        {"type": "function_call", "call_id": "2", "name": "a", "arguments": "{}"},
+        {"type": "function_call_output", "call_id": "1", "output": "x"},
+        {"type": "function_call_output", "call_id": "2", "output": "y"},
+        {"type": "function_call", "call_id": "3", "name": "a", "arguments": "{}"},
+        {"type": "function_call_output", "call_id": "3", "output": "z"},
+        {"role": "user", "content": "more"},
+        {"type": "message", "role": "assistant", "content": []},
+    ]
+
+    leading, turns = split_turns(items)
+
+    assert leading == items[:1]
+    assert turns == [items[1:6], items[6:8], items[8:9], items[9:]]
+
+
+@pytest.mark.asyncio
+async def test_input_under_budget_is_unchanged():
+    model = await run_long(RunConfig(context_window=ContextWindow(max_tokens=1_000_000)))
+    assert len(model.inputs[-1]) == 1 + 3 * TURNS
+
+
+@pytest.mark.asyncio
+async def test_drop_old_tool_outputs_bounds_prompt_tokens():
+    budget = 2000
+    window = ContextWindow(max_tokens=budget, policy=DropOldToolOutputs(keep_last_turns=1))
+    model = await run_long(RunConfig(context_window=window))
+
+    assert all(tokens(input) <= budget for input in model.inputs)
+    final = model.inputs[-1]
+    assert_no_orphans(final)
+    # Every call is still there, and the most recent output is intact.
+    assert len(final) == 1 + 3 * TURNS
+    assert final[-1]["output"].startswith(f"contents of file{TURNS - 1}")
+    assert "removed" in final[1 + 2]["output"]
+
+
+@pytest.mark.asyncio
+async def test_keep_last_turns():
+    config = RunConfig(context_window=ContextWindow(max_tokens=2000, policy=KeepLastTurns(2)))
+    model = await run_long(config)
+
+    final = model.inputs[-1]
+    assert final[0] == {"content": "read all files", "role": "user"}
+    assert len(final) == 1 + 3 * 2
+    assert_no_orphans(final)
+    assert all(tokens(input) <= 2000 for input in model.inputs)
+
+
+@pytest.mark.asyncio
+async def test_summarize_old_turns_reuses_the_summary():
+    summarizer = FakeModel()
+    summarizer.set_hardcoded_usage(
+        Usage(requests=1, input_tokens=10, output_tokens=5, total_tokens=15)
+    )
+    summarizer.add_multiple_turn_outputs([[get_text_message(f"summary {i}")] for i in range(TURNS)])
+    policy = SummarizeOldTurns(summarizer, keep_last_turns=2)
+    config = RunConfig(context_window=ContextWindow(max_tokens=3000, policy=policy))
+
+    model = await run_long(config)
+
+    final = model.inputs[-1]
+    assert final[0] == {"content": "read all files", "role": "user"}
+    assert final[1]["role"] == "user"
+    assert str(final[1]["content"]).startswith("Summary of the earlier conversation:\nsummary")
+    assert_no_orphans(final[2:])
+    assert all(tokens(input) <= 3000 for input in model.inputs)
+    # The summary is extended only when the input no longer fits, not on every turn.
+    summary_calls = TURNS - len(summarizer.turn_outputs)
+    assert 0 < summary_calls < TURNS // 2
@@ -439,3 +439,38 @@ def test_schema_with_mapping_raises_strict_mode_error():
 
     with pytest.raises(UserError):
         function_schema(func_with_mapping)
+
+
+def test_validate_json_matches_python_validation():
+    func_schema = function_schema(complex_args_function)
+    raw = '{"model": {"inner": {"a": 1, "b": "x"}, "foo": {"a": 2, "b": "y"}}}'
+
+    parsed = func_schema.validate_json(raw)
+    assert parsed == func_schema.params_pydantic_model.model_validate_json(raw)
+    args, kwargs_dict = func_schema.to_call_args(parsed)
+    assert complex_args_function(*args, **kwargs_dict) == "1, x, 2, y"
+
+    assert function_schema(no_args_function).validate_json("") is not None
+    with pytest.raises(ValidationError):
+        func_schema.validate_json('{"model": {}}')
+    with pytest.raises(ValidationError):
+        func_schema.validate_json("{not json")
+
+
+def keyword_after_varargs_function(ctx: RunContextWrapper[None], a: int, *rest: int, b: int = 0):
+    return a, rest, b
+
+
+def test_to_call_args_passes_parameters_after_varargs_by_keyword():
+    func_schema = function_schema(keyword_after_varargs_function)
+
+    parsed = func_schema.validate_json('{"a": 1, "rest": [2, 3], "b": 4}')
+    args, kwargs_dict = func_schema.to_call_args(parsed)
+
+    assert args == [1, 2, 3]
+    assert kwargs_dict == {"b": 4}
+    assert keyword_after_varargs_function(RunContextWrapper(None), *args, **kwargs_dict) == (
+        1,
+        (2, 3),
+        4,
+    )
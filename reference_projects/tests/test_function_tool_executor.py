@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents import Agent, RunConfig, RunContextWrapper, Runner, function_tool
+from agents.tracing import get_current_span
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+
+def current_thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_runs_off_the_event_loop():
+    tool = function_tool(current_thread_name)
+
+    result = await tool.on_invoke_tool(RunContextWrapper(None), "")
+    assert result != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_inline_sync_tool_runs_on_the_event_loop():
+    tool = function_tool(current_thread_name, executor="inline")
+
+    result = await tool.on_invoke_tool(RunContextWrapper(None), "")
+    assert result == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_blocking_sync_tool_does_not_stall_the_loop():
+    @function_tool
+    def blocking_tool() -> str:
+        time.sleep(0.2)
+        return "done"
+
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    result = await blocking_tool.on_invoke_tool(RunContextWrapper(None), "")
+    ticker_task.cancel()
+
+    assert result == "done"
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_parallel_sync_tools_run_on_configured_pool():
+    thread_names: list[str] = []
+    spans = []
+
+    @function_tool
+    def slow_tool() -> str:
+        thread_names.append(threading.current_thread().name)
+        spans.append(get_current_span())
+        time.sleep(0.2)
+        return "slow"
+
+    model = FakeModel()
+    agent = Agent(name="test", model=model, tools=[slow_tool])
+    model.add_multiple_turn_outputs(
+        [
+            [get_function_tool_call("slow_tool", "{}"), get_function_tool_call("slow_tool", "{}")],
+            [get_text_message("done")],
+        ]
+    )
+
+    start = time.monotonic()
+    result = await Runner.run(
+        agent, input="start", run_config=RunConfig(tool_executor_max_workers=2)
+    )
+
+    assert result.final_output == "done"
+    assert time.monotonic() - start < 0.35
+    assert all(name.startswith("agents-function-tool") for name in thread_names)
+    assert all(span is not None and span.span_data.type == "function" for span in spans)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from agents import Agent, RunConfig, RunContextWrapper, Runner, UserError, function_tool
+from agents.util import _tool_executor
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+def add_points(a: Point, b: Point) -> dict[str, int]:
+    return {"x": a.x + b.x, "y": a.y + b.y, "pid": os.getpid()}
+
+
+def sleep_for(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+def uses_context(ctx: RunContextWrapper[None], value: int) -> int:
+    return value
+
+
+@function_tool(executor="process")
+def decorated_add(a: int, b: int) -> dict[str, int]:
+    return {"sum": a + b, "pid": os.getpid()}
+
+
+@pytest.mark.asyncio
+async def test_process_tool_runs_in_a_worker_process():
+    tool = function_tool(add_points, executor="process")
+
+    result = await tool.on_invoke_tool(
+        RunContextWrapper(None), '{"a": {"x": 1, "y": 2}, "b": {"x": 3, "y": 4}}'
+    )
+
+    assert result["x"] == 4 and result["y"] == 6
+    assert result["pid"] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_decorated_process_tool_runs_in_a_worker_process():
+    result = await decorated_add.on_invoke_tool(RunContextWrapper(None), '{"a": 2, "b": 3}')
+
+    assert result["sum"] == 5
+    assert result["pid"] != os.getpid()
+
+
+def test_process_tool_is_checked_at_decoration_time():
+    def local_tool() -> str:
+        return "local"
+
+    async def async_tool() -> str:
+        return "async"
+
+    with pytest.raises(UserError, match="module-level"):
+        function_tool(local_tool, executor="process")
+    with pytest.raises(UserError, match="sync function"):
+        function_tool(async_tool, executor="process")
+    with pytest.raises(UserError, match="RunContextWrapper"):
+        function_tool(uses_context, executor="process")
+    with pytest.raises(UserError, match="timeout"):
+        function_tool(sleep_for, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_timed_out_process_tool_recycles_the_pool():
+    tool = function_tool(sleep_for, executor="process", timeout=2, failure_error_function=None)
+
+    # Warm up the pool so the timeout covers the call rather than spawning the worker.
+    warm_up = function_tool(sleep_for, executor="process")
+    assert await warm_up.on_invoke_tool(RunContextWrapper(None), '{"seconds": 0}') == "done"
+    stuck_pool = _tool_executor._process_pools[None]
+
+    with pytest.raises(TimeoutError, match="sleep_for"):
+        await tool.on_invoke_tool(RunContextWrapper(None), '{"seconds": 30}')
+
+    assert _tool_executor._process_pools.get(None) is not stuck_pool
+    assert await tool.on_invoke_tool(RunContextWrapper(None), '{"seconds": 0}') == "done"
+
+
+@pytest.mark.asyncio
+async def test_process_tool_output_flows_back_into_the_run():
+    model = FakeModel()
+    agent = Agent(name="test", model=model, tools=[function_tool(add_points, executor="process")])
+    model.add_multiple_turn_outputs(
+        [
+            [
+                get_function_tool_call(
+                    "add_points", '{"a": {"x": 1, "y": 1}, "b": {"x": 2, "y": 2}}'
+                )
+            ],
+            [get_text_message("done")],
+        ]
+    )
+
+    result = await Runner.run(
+        agent, input="start", run_config=RunConfig(tool_process_pool_max_workers=1)
+    )
+
+    assert result.final_output == "done"
+    tool_output = result.new_items[1]
+    assert tool_output.type == "tool_call_output_item"
+    assert tool_output.output["x"] == 3 and tool_output.output["y"] == 3
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from agents import (
+    Agent,
+    RunContextWrapper,
+    Runner,
+    RunItemStreamEvent,
+    ToolCallOutputItem,
+    ToolCallProgressItem,
+    function_tool,
+)
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+
+@function_tool
+async def build(target: str) -> AsyncIterator[str]:
+    for step in ("compiling ", "linking ", target):
+        yield step
+
+
+@function_tool
+async def search(query: str) -> AsyncIterator[dict[str, str]]:
+    for i in range(2):
+        yield {"title": f"{query} {i}"}
+
+
+@pytest.mark.asyncio
+async def test_streaming_tool_output_is_aggregated():
+    ctx = RunContextWrapper(None)
+    assert await build.on_invoke_tool(ctx, '{"target": "app"}') == "compiling linking app"
+    assert await search.on_invoke_tool(ctx, '{"query": "q"}') == [
+        {"title": "q 0"},
+        {"title": "q 1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_partial_outputs_are_streamed_before_the_tool_output():
+    model = FakeModel()
+    agent = Agent(name="test", model=model, tools=[build])
+    model.add_multiple_turn_outputs(
+        [
+            [get_function_tool_call("build", json.dumps({"target": "app"}))],
+            [get_text_message("done")],
+        ]
+    )
+
+    result = Runner.run_streamed(agent, input="start")
+    events = [
+        event
+        for event in [e async for e in result.stream_events()]
+        if isinstance(event, RunItemStreamEvent) and event.name in ("tool_progress", "tool_output")
+    ]
+
+    assert [event.name for event in events] == ["tool_progress"] * 3 + ["tool_output"]
+    progress = [event.item for event in events[:3]]
+    assert all(isinstance(item, ToolCallProgressItem) for item in progress)
+    assert [item.output for item in progress] == ["compiling ", "linking ", "app"]
+    assert isinstance(events[3].item, ToolCallOutputItem)
+    assert events[3].item.output == "compiling linking app"
+
+    # Only the aggregate is part of the run's items and sent back to the model.
+    assert not any(isinstance(item, ToolCallProgressItem) for item in result.new_items)
+    tool_outputs = [
+        item for item in model.last_turn_args["input"] if item.get("type") == "function_call_output"
+    ]
+    assert [item["output"] for item in tool_outputs] == ["compiling linking app"]
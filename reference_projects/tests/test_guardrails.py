@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -8,12 +9,18 @@ from agents import (
     Agent,
     GuardrailFunctionOutput,
     InputGuardrail,
+    LRUToolCache,
     OutputGuardrail,
     RunContextWrapper,
     TResponseInputItem,
     UserError,
 )
-from agents.guardrail import input_guardrail, output_guardrail
+from agents.guardrail import (
+    input_guardrail,
+    input_guardrail_cascade,
+    output_guardrail,
+    output_guardrail_cascade,
+)
 
 
 def get_sync_guardrail(triggers: bool, output_info: Any | None = None):
@@ -260,3 +267,134 @@ async def test_output_guardrail_decorators():
     assert not result.output.tripwire_triggered
     assert result.output.output_info == "test_4"
     assert guardrail.get_name() == "Custom name"
+
+
+class CountingGuardrail:
+    """An expensive guardrail stage that records how often it runs."""
+
+    def __init__(self, triggers: bool) -> None:
+        self.triggers = triggers
+        self.calls = 0
+        self.__name__ = "llm_check"
+
+    async def __call__(
+        self, context: RunContextWrapper[Any], agent: Agent[Any], value: Any
+    ) -> GuardrailFunctionOutput:
+        self.calls += 1
+        return GuardrailFunctionOutput(output_info="llm", tripwire_triggered=self.triggers)
+
+
+def keyword_check(
+    context: RunContextWrapper[Any], agent: Agent[Any], value: Any
+) -> GuardrailFunctionOutput | None:
+    if "password" in str(value):
+        return GuardrailFunctionOutput(output_info="keyword", tripwire_triggered=True)
+    if str(value) == "hello":
+        return GuardrailFunctionOutput(output_info="keyword", tripwire_triggered=False)
+    return None
+
+
+@pytest.mark.asyncio
+async def test_input_guardrail_cache_reuses_verdicts():
+    llm_check = CountingGuardrail(triggers=True)
+    guardrail = InputGuardrail(guardrail_function=llm_check, cache=LRUToolCache())
+    context = RunContextWrapper(context=None)
+    agent = Agent(name="test")
+
+    for _ in range(3):
+        result = await guardrail.run(agent=agent, input="same input", context=context)
+        assert result.output.tripwire_triggered
+    await guardrail.run(agent=agent, input=[{"role": "user", "content": "other"}], context=context)
+
+    assert llm_check.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_does_not_fail_a_coalesced_run():
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_check(
+        context: RunContextWrapper[Any], agent: Agent[Any], input: Any
+    ) -> GuardrailFunctionOutput:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return GuardrailFunctionOutput(output_info="slow", tripwire_triggered=False)
+
+    guardrail = InputGuardrail(guardrail_function=slow_check, cache=LRUToolCache())
+    context = RunContextWrapper(context=None)
+    agent = Agent(name="test")
+
+    first = asyncio.create_task(guardrail.run(agent=agent, input="same input", context=context))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(guardrail.run(agent=agent, input="same input", context=context))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    assert (await second).output.output_info == "slow"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_guardrail_cache_rejects_values_without_a_stable_digest():
+    guardrail = OutputGuardrail(
+        guardrail_function=CountingGuardrail(triggers=False), cache=LRUToolCache()
+    )
+    context = RunContextWrapper(context=None)
+    agent = Agent(name="test")
+
+    await guardrail.run(agent=agent, agent_output={"tags": {"b", "a"}}, context=context)
+    with pytest.raises(UserError):
+        await guardrail.run(agent=agent, agent_output=object(), context=context)
+
+
+@pytest.mark.asyncio
+async def test_output_guardrail_cache_keys_include_the_name():
+    llm_check = CountingGuardrail(triggers=False)
+    cache = LRUToolCache()
+    first = output_guardrail(name="first", cache=cache)(llm_check)
+    second = output_guardrail(name="second", cache=cache)(llm_check)
+    context = RunContextWrapper(context=None)
+    agent = Agent(name="test")
+
+    for guardrail in (first, second, first, second):
+        await guardrail.run(agent=agent, agent_output={"answer": 42}, context=context)
+
+    assert llm_check.calls == 2
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_input_guardrail_cascade_only_escalates_when_unsure():
+    llm_check = CountingGuardrail(triggers=True)
+    guardrail = input_guardrail_cascade(keyword_check, InputGuardrail(llm_check))
+    context = RunContextWrapper(context=None)
+    agent = Agent(name="test")
+
+    blocked = await guardrail.run(agent=agent, input="my password is 1234", context=context)
+    allowed = await guardrail.run(agent=agent, input="hello", context=context)
+    assert llm_check.calls == 0
+    assert blocked.output.tripwire_triggered and blocked.output.output_info == "keyword"
+    assert not allowed.output.tripwire_triggered
+
+    escalated = await guardrail.run(agent=agent, input="something subtle", context=context)
+    assert llm_check.calls == 1
+    assert escalated.output.output_info == "llm"
+    assert guardrail.get_name() == "keyword_check > llm_check"
+
+
+@pytest.mark.asyncio
+async def test_output_guardrail_cascade_when_every_stage_is_unsure():
+    guardrail = output_guardrail_cascade(keyword_check, name="checks")
+    result = await guardrail.run(
+        agent=Agent(name="test"), agent_output="unclear", context=RunContextWrapper(context=None)
+    )
+    assert not result.output.tripwire_triggered
+    assert result.guardrail.get_name() == "checks"
+
+    with pytest.raises(UserError):
+        output_guardrail_cascade()
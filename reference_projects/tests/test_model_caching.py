@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from openai.types.responses import ResponseOutputItemDoneEvent, ResponseTextDeltaEvent
+
+from agents import (
+    Agent,
+    CachingModel,
+    CachingModelProvider,
+    LRUResponseCache,
+    Model,
+    ModelProvider,
+    ModelSettings,
+    RawResponsesStreamEvent,
+    RunConfig,
+    Runner,
+    SQLiteResponseCache,
+    TTLResponseCache,
+    Usage,
+    UserError,
+    function_tool,
+)
+from agents.items import ModelResponse
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+
+@function_tool
+def lookup(query: str) -> str:
+    return f"result for {query}"
+
+
+def make_model(cache=None) -> tuple[FakeModel, CachingModel]:
+    model = FakeModel()
+    model.set_hardcoded_usage(Usage(requests=1, input_tokens=1, output_tokens=1, total_tokens=2))
+    return model, CachingModel(model, cache or LRUResponseCache(), model_name="fake")
+
+
+@pytest.mark.asyncio
+async def test_identical_runs_are_served_from_cache():
+    model, caching_model = make_model()
+    agent = Agent(name="test", model=caching_model, tools=[lookup])
+    model.add_multiple_turn_outputs(
+        [
+            [get_function_tool_call("lookup", json.dumps({"query": "a"}))],
+            [get_text_message("done")],
+            [get_text_message("not cached")],
+        ]
+    )
+
+    first = await Runner.run(agent, input="start")
+    second = await Runner.run(agent, input="start")
+
+    assert first.final_output == second.final_output == "done"
+    assert first.context_wrapper.usage.requests == 2
+    assert second.context_wrapper.usage.requests == 0
+    # A different input goes to the model.
+    assert (await Runner.run(agent, input="other")).final_output == "not cached"
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_replayed_as_stream():
+    model, caching_model = make_model()
+    agent = Agent(name="test", model=caching_model)
+    model.set_next_output([get_text_message("hello")])
+    await Runner.run(agent, input="hi")
+
+    result = Runner.run_streamed(agent, input="hi")
+    events = [
+        e.data async for e in result.stream_events() if isinstance(e, RawResponsesStreamEvent)
+    ]
+
+    assert result.final_output == "hello"
+    assert [e.type for e in events] == [
+        "response.created",
+        "response.output_item.added",
+        "response.content_part.added",
+        "response.output_text.delta",
+        "response.content_part.done",
+        "response.output_item.done",
+        "response.completed",
+    ]
+    assert isinstance(events[3], ResponseTextDeltaEvent) and events[3].delta == "hello"
+    assert isinstance(events[5], ResponseOutputItemDoneEvent)
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_are_cached():
+    model, caching_model = make_model()
+    agent = Agent(name="test", model=caching_model)
+    model.set_next_output([get_text_message("hello")])
+
+    result = Runner.run_streamed(agent, input="hi")
+    async for _ in result.stream_events():
+        pass
+
+    assert (await Runner.run(agent, input="hi")).final_output == "hello"
+
+
+@pytest.mark.asyncio
+async def test_cache_key_covers_the_whole_request():
+    _, caching_model = make_model()
+
+    def key(**overrides):
+        request = {
+            "system_instructions": "be brief",
+            "input": [{"role": "user", "content": "hi"}],
+            "model_settings": ModelSettings(),
+            "tools": [lookup],
+            "output_schema": None,
+            "handoffs": [],
+            "previous_response_id": None,
+        }
+        request.update(overrides)
+        return caching_model.cache_key(**request)
+
+    assert key() == key()
+    assert key() != key(system_instructions="be verbose")
+    assert key() != key(input=[{"role": "user", "content": "hello"}])
+    assert key() != key(model_settings=ModelSettings(temperature=0.5))
+    assert key() != key(tools=[])
+    assert key() != key(previous_response_id="resp_1")
+    assert key() != CachingModel(FakeModel(), LRUResponseCache(), "other").cache_key(
+        "be brief",
+        [{"role": "user", "content": "hi"}],
+        ModelSettings(),
+        [lookup],
+        None,
+        [],
+        previous_response_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_key_is_stable_or_rejected():
+    _, caching_model = make_model()
+
+    def key(content: object) -> str:
+        return caching_model.cache_key(
+            None,
+            [{"role": "user", "content": content}],  # type: ignore[list-item, typeddict-item]
+            ModelSettings(),
+            [],
+            None,
+            [],
+            previous_response_id=None,
+        )
+
+    assert key({"b", "a"}) == key({"a", "b"})
+    with pytest.raises(UserError):
+        # Its repr includes a memory address, so the key could never match again.
+        key(object())
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "responses.db"
+    response = ModelResponse(
+        output=[get_text_message("hello"), get_function_tool_call("lookup", "{}")],
+        usage=Usage(requests=1, input_tokens=3, output_tokens=4, total_tokens=7),
+        response_id="resp_1",
+    )
+    cache = SQLiteResponseCache(path)
+    await cache.set("key", response)
+    cache.close()
+
+    reopened = SQLiteResponseCache(path)
+    assert await reopened.get("key") == response
+    assert await reopened.get("missing") is None
+    reopened.close()
+
+    expired = SQLiteResponseCache(path, ttl=0)
+    assert await expired.get("key") is None
+    expired.close()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_caches_evict():
+    response = ModelResponse(output=[], usage=Usage(), response_id=None)
+    lru = LRUResponseCache(maxsize=1)
+    await lru.set("a", response)
+    await lru.set("b", response)
+    assert await lru.get("a") is None and await lru.get("b") is response
+
+    ttl = TTLResponseCache(ttl=0)
+    await ttl.set("a", response)
+    assert await ttl.get("a") is None
+
+
+class SingleModelProvider(ModelProvider):
+    def __init__(self, model: Model) -> None:
+        self.model = model
+
+    def get_model(self, model_name: str | None) -> Model:
+        return self.model
+
+
+@pytest.mark.asyncio
+async def test_caching_model_provider():
+    model = FakeModel()
+    provider = CachingModelProvider(SingleModelProvider(model), LRUResponseCache())
+    agent = Agent(name="test", model="fake-model")
+    model.add_multiple_turn_outputs([[get_text_message("first")], [get_text_message("second")]])
+
+    config = RunConfig(model_provider=provider)
+    assert (await Runner.run(agent, input="hi", run_config=config)).final_output == "first"
+    assert (await Runner.run(agent, input="hi", run_config=config)).final_output == "first"
+    assert isinstance(provider.get_model("fake-model"), CachingModel)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from agents import Agent, Model, ModelProvider, RunConfig, Runner, UserError, function_tool
+from agents.models.replay import (
+    ModelRecording,
+    RecordedResponse,
+    RecordingModelProvider,
+    ReplayModelProvider,
+    constant_latency,
+    lognormal_latency,
+    recorded_latency,
+)
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+
+class SingleModelProvider(ModelProvider):
+    def __init__(self, model: Model) -> None:
+        self.model = model
+
+    def get_model(self, model_name: str | None) -> Model:
+        return self.model
+
+
+@function_tool
+def lookup(query: str) -> str:
+    return f"result for {query}"
+
+
+async def record(agent: Agent, inputs: list[str]) -> ModelRecording:
+    model = FakeModel()
+    for text in inputs:
+        model.add_multiple_turn_outputs(
+            [
+                [get_function_tool_call("lookup", json.dumps({"query": text}))],
+                [get_text_message(f"answer to {text}")],
+            ]
+        )
+    recording = ModelRecording()
+    config = RunConfig(model_provider=RecordingModelProvider(SingleModelProvider(model), recording))
+    for text in inputs:
+        await Runner.run(agent, input=text, run_config=config)
+    return recording
+
+
+@pytest.mark.asyncio
+async def test_recorded_runs_replay_concurrently(tmp_path):
+    agent = Agent(name="test", tools=[lookup])
+    inputs = ["a", "b", "c"]
+    recording = await record(agent, inputs)
+    assert len(recording) == 6
+
+    path = tmp_path / "recording.json"
+    recording.save(path)
+    config = RunConfig(model_provider=ReplayModelProvider(ModelRecording.load(path)))
+
+    results = await asyncio.gather(
+        *(Runner.run(agent, input=text, run_config=config) for text in inputs * 2)
+    )
+    assert [r.final_output for r in results] == [f"answer to {text}" for text in inputs * 2]
+
+    streamed = Runner.run_streamed(agent, input="b", run_config=config)
+    async for _ in streamed.stream_events():
+        pass
+    assert streamed.final_output == "answer to b"
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_request_raises():
+    agent = Agent(name="test", tools=[lookup])
+    config = RunConfig(model_provider=ReplayModelProvider(await record(agent, ["a"])))
+
+    with pytest.raises(UserError):
+        await Runner.run(agent, input="not recorded", run_config=config)
+
+
+@pytest.mark.asyncio
+async def test_replay_latency():
+    agent = Agent(name="test", tools=[lookup])
+    recording = await record(agent, ["a"])
+    config = RunConfig(model_provider=ReplayModelProvider(recording, constant_latency(0.05)))
+
+    start = time.monotonic()
+    await Runner.run(agent, input="a", run_config=config)
+    assert time.monotonic() - start >= 0.1
+
+    recorded = RecordedResponse(response=next(iter(recording.responses.values()))[0], latency=2)
+    assert recorded_latency(scale=0.5)(recorded) == 1
+    sample = lognormal_latency(median=0.1, seed=0)
+    assert all(delay > 0 for delay in (sample(recorded) for _ in range(10)))
@@ -15,9 +15,12 @@ from openai.types.responses import (
     ResponseOutputMessage,
     ResponseOutputRefusal,
     ResponseOutputText,
+    ResponseTextDeltaEvent,
 )
 
 from agents.model_settings import ModelSettings
+from agents.models.chatcmpl_stream_handler import ChatCmplStreamHandler
+from agents.models.fake_id import FAKE_RESPONSES_ID
 from agents.models.interface import ModelTracing
 from agents.models.openai_chatcompletions import OpenAIChatCompletionsModel
 from agents.models.openai_provider import OpenAIProvider
@@ -284,3 +287,85 @@ async def test_stream_response_yields_events_for_tool_call(monkeypatch) -> None:
     assert output_events[2].delta == "arg1arg2"
     assert output_events[3].type == "response.output_item.done"
     assert output_events[4].type == "response.completed"
+
+
+def _chunk(delta: ChoiceDelta) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chunk-id",
+        created=1,
+        model="fake",
+        object="chat.completion.chunk",
+        choices=[Choice(index=0, delta=delta)],
+    )
+
+
+def _response() -> Response:
+    return Response(
+        id="resp-id",
+        created_at=0,
+        model="fake-model",
+        object="response",
+        output=[],
+        tool_choice="none",
+        tools=[],
+        parallel_tool_calls=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_stream_builds_valid_events_for_many_chunks() -> None:
+    words = [f"w{i} " for i in range(1000)]
+    args = ['{"a": ', '"b"', "}"]
+    chunks = [_chunk(ChoiceDelta(content=word)) for word in words] + [
+        _chunk(
+            ChoiceDelta(
+                tool_calls=[
+                    ChoiceDeltaToolCall(
+                        index=0,
+                        id="call-id" if i == 0 else None,
+                        function=ChoiceDeltaToolCallFunction(
+                            name="tool" if i == 0 else None, arguments=arg
+                        ),
+                    )
+                ]
+            )
+        )
+        for i, arg in enumerate(args)
+    ]
+
+    async def fake_stream() -> AsyncIterator[ChatCompletionChunk]:
+        for c in chunks:
+            yield c
+
+    stream = ChatCmplStreamHandler.handle_stream(_response(), fake_stream())  # type: ignore[arg-type]
+    events = [event async for event in stream]
+
+    deltas = [event for event in events if event.type == "response.output_text.delta"]
+    assert [delta.delta for delta in deltas] == words
+    # Delta events are built from a template, but are indistinguishable from validated ones.
+    assert deltas[1] == ResponseTextDeltaEvent.model_validate(deltas[1].model_dump())
+    assert deltas[0] is not deltas[1]
+    assert deltas[1].model_fields_set == deltas[1].model_copy().model_fields_set
+    # Events share nothing mutable, so changing one never changes another.
+    deltas[0].model_fields_set.add("marker")
+    assert "marker" not in deltas[1].model_fields_set
+    completed = events[-1].response
+    assert completed.output[0].content[0].text == "".join(words)
+    assert completed.output[1] == ResponseFunctionToolCall(
+        id=FAKE_RESPONSES_ID,
+        call_id="call-id",
+        arguments='{"a": "b"}',
+        name="tool",
+        type="function_call",
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_text_yields_only_text() -> None:
+    async def fake_stream() -> AsyncIterator[ChatCompletionChunk]:
+        yield _chunk(ChoiceDelta(content="He"))
+        yield _chunk(ChoiceDelta(refusal="no"))
+        yield _chunk(ChoiceDelta(content="llo"))
+
+    text = [t async for t in ChatCmplStreamHandler.stream_text(fake_stream())]  # type: ignore[arg-type]
+    assert text == ["He", "llo"]
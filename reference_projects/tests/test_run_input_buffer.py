@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from agents import Agent, Runner
+from agents._run_impl import InputBuffer
+from agents.items import MessageOutputItem, RunItemBase, TResponseInputItem
+
+from .fake_model import FakeModel
+from .test_responses import (
+    get_function_tool,
+    get_function_tool_call,
+    get_text_input_item,
+    get_text_message,
+)
+
+
+def _message_item(agent: Agent[Any], content: str) -> MessageOutputItem:
+    return MessageOutputItem(agent=agent, raw_item=get_text_message(content))  # type: ignore[arg-type]
+
+
+def test_input_buffer_converts_each_item_once(monkeypatch: pytest.MonkeyPatch):
+    agent = Agent(name="test")
+    conversions = []
+    original_to_input_item = RunItemBase.to_input_item
+
+    def counting_to_input_item(self: RunItemBase[Any]) -> TResponseInputItem:
+        conversions.append(self)
+        return original_to_input_item(self)
+
+    monkeypatch.setattr(RunItemBase, "to_input_item", counting_to_input_item)
+
+    buffer = InputBuffer()
+    original_input = [get_text_input_item("hello")]
+    first, second = _message_item(agent, "1"), _message_item(agent, "2")
+
+    assert len(buffer.build(original_input, [first])) == 2
+    result = buffer.build(original_input, [first, second])
+
+    assert [item.get("role") for item in result] == ["user", "assistant", "assistant"]
+    assert conversions == [first, second]
+
+
+def test_input_buffer_protects_original_input():
+    buffer = InputBuffer()
+    original_input = [get_text_input_item("hello")]
+
+    result = buffer.build(original_input, [])
+    result[0]["content"] = "mutated"  # type: ignore[typeddict-item]
+    result.append(get_text_input_item("appended"))
+
+    assert original_input == [get_text_input_item("hello")]
+    assert len(buffer.build(original_input, [])) == 1
+    assert buffer.build(original_input, [])[0]["content"] == "hello"
+
+
+def test_input_buffer_rebuilds_when_history_is_rewritten():
+    agent = Agent(name="test")
+    buffer = InputBuffer()
+    original_input = [get_text_input_item("hello")]
+    first, second = _message_item(agent, "1"), _message_item(agent, "2")
+    buffer.build(original_input, [first, second])
+
+    # e.g. a handoff input filter that drops items or replaces the original input
+    assert len(buffer.build(original_input, [second])) == 2
+    assert buffer.build("new input", []) == [{"content": "new input", "role": "user"}]
+
+
+@pytest.mark.asyncio
+async def test_runner_input_grows_across_turns():
+    model = FakeModel()
+    agent = Agent(name="test", model=model, tools=[get_function_tool("foo", "tool_result")])
+    model.add_multiple_turn_outputs(
+        [
+            [get_text_message("a"), get_function_tool_call("foo", json.dumps({}))],
+            [get_function_tool_call("foo", json.dumps({}))],
+            [get_text_message("done")],
+        ]
+    )
+
+    result = await Runner.run(agent, input="start")
+
+    assert result.final_output == "done"
+    assert model.last_turn_args["input"] == result.to_input_list()[:-1]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agents import Agent, Runner, RunResult, UserError, Usage, trace
+from agents.items import ModelResponse
+
+from .fake_model import FakeModel
+from .test_responses import get_text_message
+from .testing_processor import fetch_ordered_spans, fetch_traces
+
+
+class EchoModel(FakeModel):
+    """Replies with the input text. Inputs of the form "<delay>:<text>" finish after that many
+    seconds, and an input starting with "fail" raises."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_response(
+        self, system_instructions: str | None, input: Any, *args: Any, **kwargs: Any
+    ) -> ModelResponse:
+        text = input if isinstance(input, str) else input[-1]["content"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay, _, text = text.partition(":")
+            await asyncio.sleep(float(delay))
+        finally:
+            self.in_flight -= 1
+        if text.startswith("fail"):
+            raise ValueError(text)
+        return ModelResponse(
+            output=[get_text_message(text)],
+            usage=Usage(requests=1, input_tokens=2, output_tokens=3, total_tokens=5),
+            response_id=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_many_yields_in_completion_order_with_bounded_concurrency():
+    model = EchoModel()
+    agent = Agent(name="test", model=model)
+    # b finishes first and frees a slot for c, then c frees one for d, all before a finishes.
+    inputs = ["0.2:a", "0.01:b", "0.03:c", "0:d"]
+
+    batch = Runner.run_many(agent, inputs, max_concurrency=2)
+    outcomes = [outcome async for outcome in batch.stream_results()]
+
+    assert [outcome.index for outcome in outcomes] == [1, 2, 3, 0]
+    assert [cast_result(o.result).final_output for o in outcomes] == ["b", "c", "d", "a"]
+    assert model.max_in_flight == 2
+    assert batch.completed == 4
+    assert batch.usage.requests == 4 and batch.usage.total_tokens == 20
+
+
+@pytest.mark.asyncio
+async def test_run_many_ordered_yields_in_input_order():
+    agent = Agent(name="test", model=EchoModel())
+
+    batch = Runner.run_many(agent, ["0.03:a", "0:b", "0.01:c"], max_concurrency=3, ordered=True)
+
+    assert [o.result.final_output async for o in batch.stream_results() if o.result] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_many_failure_policies():
+    agent = Agent(name="test", model=EchoModel())
+
+    batch = Runner.run_many(agent, ["0:a", "0:fail", "0.01:b"], on_error="continue")
+    outcomes = [outcome async for outcome in batch.stream_results()]
+    assert len(outcomes) == 3
+    assert [o.index for o in batch.failures] == [1]
+    assert isinstance(batch.failures[0].error, ValueError)
+
+    batch = Runner.run_many(agent, ["0:fail", "1:slow"], max_concurrency=2)
+    with pytest.raises(ValueError):
+        async for _ in batch.stream_results():
+            pass
+    assert batch.completed == 1
+
+    batch = Runner.run_many(
+        agent, ["0:fail1", "0.01:fail2", "1:slow"], on_error="continue", max_failures=2
+    )
+    with pytest.raises(ValueError, match="fail2"):
+        async for _ in batch.stream_results():
+            pass
+
+    with pytest.raises(UserError):
+        Runner.run_many(agent, ["a"], max_concurrency=0)
+    with pytest.raises(UserError):
+        Runner.run_many(agent, ["a"], on_error="continue", max_failures=0)
+
+
+@pytest.mark.asyncio
+async def test_run_many_max_failures_boundary():
+    agent = Agent(name="test", model=EchoModel())
+
+    batch = Runner.run_many(
+        agent, ["0:fail1", "0.01:a", "0.02:b"], on_error="continue", max_failures=2
+    )
+    outcomes = [outcome async for outcome in batch.stream_results()]
+    assert len(outcomes) == 3 and len(batch.failures) == 1
+
+    batch = Runner.run_many(
+        agent, ["0:fail1", "0.01:a", "1:slow"], on_error="continue", max_failures=1
+    )
+    with pytest.raises(ValueError, match="fail1"):
+        async for _ in batch.stream_results():
+            pass
+    assert batch.completed == 1
+
+
+@pytest.mark.asyncio
+async def test_run_many_ordered_holds_back_at_most_max_concurrency_results():
+    model = EchoModel()
+    agent = Agent(name="test", model=model)
+    inputs = ["0.1:slow", *(f"0:{i}" for i in range(10))]
+
+    batch = Runner.run_many(agent, inputs, max_concurrency=3, ordered=True)
+    outputs = []
+    async for outcome in batch.stream_results():
+        if outcome.index == 0:
+            # Only two results fit behind the slow run before the batch waits for it.
+            assert batch.completed == 3
+        outputs.append(cast_result(outcome.result).final_output)
+
+    assert outputs == ["slow", *(str(i) for i in range(10))]
+
+
+@pytest.mark.asyncio
+async def test_run_many_shares_one_trace():
+    agent = Agent(name="test", model=EchoModel())
+
+    batch = Runner.run_many(agent, (f"0:{i}" for i in range(3)))
+    async for _ in batch.stream_results():
+        pass
+
+    assert len(fetch_traces()) == 1
+    agent_spans = [s for s in fetch_ordered_spans() if s.span_data.type == "agent"]
+    assert len(agent_spans) == 3
+    assert {s.trace_id for s in agent_spans} == {fetch_traces()[0].trace_id}
+
+
+@pytest.mark.asyncio
+async def test_run_many_uses_the_active_trace():
+    agent = Agent(name="test", model=EchoModel())
+
+    with trace("outer") as outer:
+        batch = Runner.run_many(agent, ["0:a", "0:b"])
+        async for _ in batch.stream_results():
+            pass
+
+    assert batch.trace is None
+    assert [t.trace_id for t in fetch_traces()] == [outer.trace_id]
+
+
+def cast_result(result: RunResult | None) -> RunResult:
+    assert result is not None
+    return result
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from openai.types.responses import ResponseFunctionToolCall, ResponseOutputItemDoneEvent
+
+from agents import Agent, Runner, function_tool
+from agents.items import TResponseStreamEvent
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+
+RESPONSE_TAIL_SECONDS = 0.3
+
+
+class SlowTailModel(FakeModel):
+    """Streams each function call as soon as it's complete, then takes a while to finish the rest
+    of the response, like a model that writes trailing text after its tool calls."""
+
+    def __init__(self, fail_after_tool_calls: bool = False) -> None:
+        super().__init__()
+        self.fail_after_tool_calls = fail_after_tool_calls
+        self.response_ended_at: list[float] = []
+
+    async def stream_response(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[TResponseStreamEvent]:
+        output = self.turn_outputs[0] if self.turn_outputs else []
+        if not isinstance(output, Exception):
+            for index, item in enumerate(output):
+                if isinstance(item, ResponseFunctionToolCall):
+                    yield ResponseOutputItemDoneEvent(
+                        item=item, output_index=index, type="response.output_item.done"
+                    )
+            if any(isinstance(item, ResponseFunctionToolCall) for item in output):
+                await asyncio.sleep(RESPONSE_TAIL_SECONDS)
+                if self.fail_after_tool_calls:
+                    raise RuntimeError("stream failed")
+        async for event in super().stream_response(*args, **kwargs):
+            self.response_ended_at.append(time.monotonic())
+            yield event
+
+
+def make_tool(speculative: bool, started_at: list[float], finished: list[str]):
+    @function_tool(speculative=speculative)
+    async def lookup(query: str) -> str:
+        started_at.append(time.monotonic())
+        await asyncio.sleep(RESPONSE_TAIL_SECONDS)
+        finished.append(query)
+        return f"result for {query}"
+
+    return lookup
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("speculative", [True, False])
+async def test_speculative_tool_starts_before_response_ends(speculative: bool):
+    started_at: list[float] = []
+    finished: list[str] = []
+    model = SlowTailModel()
+    agent = Agent(name="test", model=model, tools=[make_tool(speculative, started_at, finished)])
+    model.add_multiple_turn_outputs(
+        [
+            [get_function_tool_call("lookup", json.dumps({"query": "a"}))],
+            [get_text_message("done")],
+        ]
+    )
+
+    result = Runner.run_streamed(agent, input="start")
+    async for _ in result.stream_events():
+        pass
+
+    assert result.final_output == "done"
+    assert finished == ["a"]
+    assert (started_at[0] < model.response_ended_at[0]) is speculative
+    tool_outputs = [
+        item for item in model.last_turn_args["input"] if item.get("type") == "function_call_output"
+    ]
+    assert [item["output"] for item in tool_outputs] == ["result for a"]
+
+
+@pytest.mark.asyncio
+async def test_speculative_tool_is_cancelled_when_the_turn_fails():
+    started_at: list[float] = []
+    finished: list[str] = []
+    model = SlowTailModel(fail_after_tool_calls=True)
+    agent = Agent(name="test", model=model, tools=[make_tool(True, started_at, finished)])
+    model.add_multiple_turn_outputs(
+        [[get_function_tool_call("lookup", json.dumps({"query": "a"}))]]
+    )
+
+    result = Runner.run_streamed(agent, input="start")
+    with pytest.raises(RuntimeError):
+        async for _ in result.stream_events():
+            pass
+    await asyncio.sleep(RESPONSE_TAIL_SECONDS * 1.5)
+
+    assert len(started_at) == 1
+    assert finished == []
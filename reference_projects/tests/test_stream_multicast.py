@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from agents import (
+    Agent,
+    MaxTurnsExceeded,
+    Runner,
+    StreamEvent,
+    StreamSubscriberEvicted,
+    StreamSubscription,
+)
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool, get_function_tool_call, get_text_message
+from .test_stream_queue import DeltaModel
+
+
+def tool_agent() -> Agent[None]:
+    model = FakeModel()
+    model.add_multiple_turn_outputs(
+        [
+            [get_text_message("a"), get_function_tool_call("foo", json.dumps({"a": "b"}))],
+            [get_text_message("done")],
+        ]
+    )
+    return Agent(name="test", model=model, tools=[get_function_tool("foo", "result")])
+
+
+async def collect(subscription: StreamSubscription) -> list[StreamEvent]:
+    return [event async for event in subscription]
+
+
+@pytest.mark.asyncio
+async def test_every_subscriber_gets_the_same_events():
+    result = Runner.run_streamed(tool_agent(), input="hi")
+    multicast = result.multicast()
+    ui, audit, metrics = (multicast.subscribe() for _ in range(3))
+
+    received = await asyncio.gather(collect(ui), collect(audit), collect(metrics))
+
+    assert result.final_output == "done"
+    assert len(received[0]) == multicast.events_published > 0
+    # No copies: every subscriber sees the same event objects.
+    assert all(a is b is c for a, b, c in zip(*received))
+    assert result.multicast() is multicast
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_replays_recent_events():
+    result = Runner.run_streamed(tool_agent(), input="hi")
+    multicast = result.multicast()
+    everything = await collect(multicast.subscribe())
+    await multicast.wait_done()
+
+    assert await collect(multicast.subscribe(replay=3)) == everything[-3:]
+    assert await collect(multicast.subscribe()) == []
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_evicted():
+    model = DeltaModel()
+    result = Runner.run_streamed(Agent(name="test", model=model), input="hi")
+    multicast = result.multicast(buffer_size=64)
+    fast = multicast.subscribe()
+    slow = multicast.subscribe(max_lag=8)
+
+    async def read_slowly() -> None:
+        async for _ in slow:
+            await asyncio.sleep(0.01)
+
+    fast_events, slow_outcome = await asyncio.gather(
+        collect(fast), read_slowly(), return_exceptions=True
+    )
+
+    assert isinstance(slow_outcome, StreamSubscriberEvicted)
+    assert slow.evicted
+    assert not fast.evicted
+    assert len(fast_events) == multicast.events_published
+    assert result.final_output == "".join(model.words)
+
+
+@pytest.mark.asyncio
+async def test_run_errors_reach_every_subscriber():
+    result = Runner.run_streamed(tool_agent(), input="hi", max_turns=1)
+    multicast = result.multicast()
+    first, second = multicast.subscribe(), multicast.subscribe()
+
+    outcomes = await asyncio.gather(collect(first), collect(second), return_exceptions=True)
+
+    assert all(isinstance(outcome, MaxTurnsExceeded) for outcome in outcomes)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from openai.types.responses import ResponseTextDeltaEvent
+
+from agents import Agent, RawResponsesStreamEvent, RunConfig, Runner, StreamQueueSettings
+from agents.items import TResponseStreamEvent
+from agents.stream_queue import StreamEventQueue, _merge
+
+from .fake_model import FakeModel
+from .test_responses import get_text_message
+
+DELTAS = 200
+
+
+class DeltaModel(FakeModel):
+    """Streams the final text as one small delta per word before the completed response."""
+
+    def __init__(self, words: int = DELTAS) -> None:
+        super().__init__()
+        self.words = [f"w{i} " for i in range(words)]
+        self.yielded = 0
+        self.set_next_output([get_text_message("".join(self.words))])
+
+    async def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        for word in self.words:
+            self.yielded += 1
+            yield ResponseTextDeltaEvent(
+                type="response.output_text.delta",
+                item_id="msg",
+                output_index=0,
+                content_index=0,
+                delta=word,
+            )
+        async for event in super().stream_response(*args, **kwargs):
+            yield event
+
+
+def text_deltas(events: list[TResponseStreamEvent]) -> list[str]:
+    return [event.delta for event in events if isinstance(event, ResponseTextDeltaEvent)]
+
+
+async def consume(
+    settings: StreamQueueSettings, pause: float = 0.0
+) -> tuple[DeltaModel, list[TResponseStreamEvent]]:
+    model = DeltaModel()
+    result = Runner.run_streamed(
+        Agent(name="test", model=model), input="hi", run_config=RunConfig(stream_queue=settings)
+    )
+    events: list[TResponseStreamEvent] = []
+    async for event in result.stream_events():
+        if isinstance(event, RawResponsesStreamEvent):
+            events.append(event.data)
+            if len(events) == 1 and pause:
+                # A slow consumer: the run keeps producing while we're away.
+                await asyncio.sleep(pause)
+    assert result.final_output == "".join(model.words)
+    return model, events
+
+
+@pytest.mark.asyncio
+async def test_unbounded_queue_delivers_every_delta():
+    model, events = await consume(StreamQueueSettings(), pause=0.01)
+    assert text_deltas(events) == model.words
+
+
+@pytest.mark.asyncio
+async def test_block_policy_bounds_the_queue():
+    model = DeltaModel()
+    settings = StreamQueueSettings(max_size=8, backpressure="block")
+    result = Runner.run_streamed(
+        Agent(name="test", model=model), input="hi", run_config=RunConfig(stream_queue=settings)
+    )
+    deltas: list[str] = []
+    async for event in result.stream_events():
+        if isinstance(event, RawResponsesStreamEvent) and isinstance(
+            event.data, ResponseTextDeltaEvent
+        ):
+            deltas.append(event.data.delta)
+            if len(deltas) == 1:
+                await asyncio.sleep(0.01)
+                # The run waited for us instead of reading the whole response.
+                assert model.yielded <= 1 + 8 + 1
+                assert result._event_queue.qsize() <= 8
+
+    assert deltas == model.words
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_deltas_for_a_slow_consumer():
+    model, events = await consume(StreamQueueSettings(backpressure="coalesce"), pause=0.01)
+
+    deltas = text_deltas(events)
+    assert "".join(deltas) == "".join(model.words)
+    assert len(deltas) < len(model.words)
+    assert events[-1].type == "response.completed"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_with_bound():
+    settings = StreamQueueSettings(max_size=2, backpressure="coalesce")
+    model, events = await consume(settings, pause=0.01)
+    assert "".join(text_deltas(events)) == "".join(model.words)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_deltas_are_merged_once(monkeypatch: pytest.MonkeyPatch):
+    merges: list[int] = []
+
+    def counting_merge(deltas: list[ResponseTextDeltaEvent]) -> ResponseTextDeltaEvent:
+        merges.append(len(deltas))
+        return _merge(deltas)
+
+    monkeypatch.setattr("agents.stream_queue._merge", counting_merge)
+    queue: StreamEventQueue[Any] = StreamEventQueue(StreamQueueSettings(backpressure="coalesce"))
+    words = [f"w{i} " for i in range(DELTAS)]
+    for word in words:
+        await queue.put(
+            RawResponsesStreamEvent(
+                data=ResponseTextDeltaEvent(
+                    type="response.output_text.delta",
+                    item_id="msg",
+                    output_index=0,
+                    content_index=0,
+                    delta=word,
+                )
+            )
+        )
+
+    assert queue.qsize() == 1
+    event = queue.get_nowait()
+    assert isinstance(event, RawResponsesStreamEvent)
+    assert isinstance(event.data, ResponseTextDeltaEvent)
+    assert event.data.delta == "".join(words)
+    assert merges == [DELTAS]
+
+
+@pytest.mark.asyncio
+async def test_flush_interval_delivers_merged_deltas():
+    model, events = await consume(StreamQueueSettings(flush_interval=0.05))
+
+    deltas = text_deltas(events)
+    assert "".join(deltas) == "".join(model.words)
+    # The model streams without pausing, so the text arrives in very few events.
+    assert len(deltas) <= 2
+    assert events[-1].type == "response.completed"
+
+
+@pytest.mark.asyncio
+async def test_flush_interval_respects_the_bound(monkeypatch: pytest.MonkeyPatch):
+    sizes: list[int] = []
+    append = StreamEventQueue._append
+
+    def recording_append(self: StreamEventQueue[Any], item: Any) -> None:
+        append(self, item)
+        if isinstance(item, RawResponsesStreamEvent):
+            sizes.append(self.qsize())
+
+    monkeypatch.setattr(StreamEventQueue, "_append", recording_append)
+
+    class SlowDeltaModel(DeltaModel):
+        async def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+            async for event in super().stream_response(*args, **kwargs):
+                await asyncio.sleep(0.001)
+                yield event
+
+    model = SlowDeltaModel()
+    settings = StreamQueueSettings(max_size=2, flush_interval=0.005)
+    result = Runner.run_streamed(
+        Agent(name="test", model=model), input="hi", run_config=RunConfig(stream_queue=settings)
+    )
+    deltas: list[str] = []
+    async for event in result.stream_events():
+        if isinstance(event, RawResponsesStreamEvent) and isinstance(
+            event.data, ResponseTextDeltaEvent
+        ):
+            deltas.append(event.data.delta)
+            # A slow consumer: merged deltas fall due while the queue is full.
+            await asyncio.sleep(0.02)
+
+    assert "".join(deltas) == "".join(model.words)
+    assert len(sizes) > 2
+    assert max(sizes) <= 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_releases_a_blocked_run():
+    model = DeltaModel()
+    settings = StreamQueueSettings(max_size=1)
+    result = Runner.run_streamed(
+        Agent(name="test", model=model), input="hi", run_config=RunConfig(stream_queue=settings)
+    )
+    async for _ in result.stream_events():
+        await asyncio.sleep(0)
+        result.cancel()
+
+    assert result._event_queue.empty()
+    assert model.yielded < DELTAS
+
+
+@pytest.mark.asyncio
+async def test_consumer_that_stops_early_releases_a_blocked_run():
+    model = DeltaModel()
+    settings = StreamQueueSettings(max_size=1)
+    result = Runner.run_streamed(
+        Agent(name="test", model=model), input="hi", run_config=RunConfig(stream_queue=settings)
+    )
+    async for _ in result.stream_events():
+        break
+
+    assert result._run_impl_task is not None
+    await asyncio.wait([result._run_impl_task], timeout=1)
+    assert result._run_impl_task.done()
+    assert model.yielded < DELTAS
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agents import (
+    Agent,
+    DiskToolCache,
+    FunctionSpanData,
+    LRUToolCache,
+    RunContextWrapper,
+    Runner,
+    TTLToolCache,
+    UserError,
+    function_tool,
+)
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool_call, get_text_message
+from .testing_processor import fetch_ordered_spans
+
+
+def make_counting_tool(**kwargs: Any):
+    calls: list[tuple[str, int]] = []
+
+    @function_tool(**kwargs)
+    async def lookup(query: str, limit: int = 3) -> str:
+        calls.append((query, limit))
+        return f"{query}:{limit}:{len(calls)}"
+
+    return lookup, calls
+
+
+@pytest.mark.asyncio
+async def test_repeated_calls_are_served_from_cache():
+    tool, calls = make_counting_tool(cache=LRUToolCache())
+    ctx = RunContextWrapper(None)
+
+    first = await tool.on_invoke_tool(ctx, '{"query": "a", "limit": 3}')
+    # Key order, whitespace and omitted defaults don't change the key.
+    assert await tool.on_invoke_tool(ctx, '{ "limit": 3,  "query": "a" }') == first
+    assert await tool.on_invoke_tool(ctx, '{"query": "a"}') == first
+    assert await tool.on_invoke_tool(ctx, '{"query": "b"}') != first
+
+    assert calls == [("a", 3), ("b", 3)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_coalesced():
+    release = asyncio.Event()
+    calls = 0
+
+    @function_tool(cache=LRUToolCache())
+    async def slow_lookup(query: str) -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return query.upper()
+
+    ctx = RunContextWrapper(None)
+    tasks = [
+        asyncio.create_task(slow_lookup.on_invoke_tool(ctx, '{"query": "a"}')) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["A"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_coalesced_callers():
+    cache = LRUToolCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert await follower == ("value", True)
+    assert calls == 1
+    cached = await cache.get("key")
+    assert cached is not None and cached.value == "value"
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_once_every_caller_is():
+    cache = LRUToolCache()
+    cancelled = asyncio.Event()
+
+    async def compute() -> str:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "unreachable"
+
+    callers = [asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_misses_while_the_result_is_stored_join_the_call():
+    stored = asyncio.Event()
+
+    class SlowCache(LRUToolCache):
+        async def set(self, key: str, value: Any) -> None:
+            await stored.wait()
+            await super().set(key, value)
+
+    cache = SlowCache()
+    calls = 0
+
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    first = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    stored.set()
+
+    assert await asyncio.gather(first, second) == [(1, False), (1, True)]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    attempts = 0
+
+    @function_tool(cache=LRUToolCache(), failure_error_function=None)
+    def flaky(query: str) -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ValueError("first call fails")
+        return "ok"
+
+    ctx = RunContextWrapper(None)
+    with pytest.raises(ValueError):
+        await flaky.on_invoke_tool(ctx, '{"query": "a"}')
+    assert await flaky.on_invoke_tool(ctx, '{"query": "a"}') == "ok"
+    assert await flaky.on_invoke_tool(ctx, '{"query": "a"}') == "ok"
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_namespace_separates_cached_results():
+    tool, calls = make_counting_tool(
+        cache=LRUToolCache(), cache_namespace=lambda ctx: ctx.context["user"]
+    )
+
+    await tool.on_invoke_tool(RunContextWrapper({"user": "alice"}), '{"query": "a"}')
+    await tool.on_invoke_tool(RunContextWrapper({"user": "bob"}), '{"query": "a"}')
+    await tool.on_invoke_tool(RunContextWrapper({"user": "alice"}), '{"query": "a"}')
+
+    assert len(calls) == 2
+    with pytest.raises(UserError):
+        make_counting_tool(cache_namespace=lambda ctx: "")
+
+
+@pytest.mark.asyncio
+async def test_lru_and_ttl_eviction():
+    lru = LRUToolCache(maxsize=2)
+    await lru.set("a", 1)
+    await lru.set("b", 2)
+    assert await lru.get("a") is not None
+    await lru.set("c", 3)
+    assert await lru.get("b") is None
+    assert len(lru) == 2
+
+    ttl = TTLToolCache(ttl=0.05)
+    await ttl.set("a", None)
+    cached = await ttl.get("a")
+    assert cached is not None and cached.value is None
+    await asyncio.sleep(0.06)
+    assert await ttl.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_persists_across_instances(tmp_path):
+    tool, calls = make_counting_tool(cache=DiskToolCache(tmp_path))
+    first = await tool.on_invoke_tool(RunContextWrapper(None), '{"query": "a"}')
+
+    other_tool, other_calls = make_counting_tool(cache=DiskToolCache(tmp_path))
+    assert await other_tool.on_invoke_tool(RunContextWrapper(None), '{"query": "a"}') == first
+    assert len(calls) == 1 and other_calls == []
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_recorded_on_function_span():
+    tool, calls = make_counting_tool(cache=LRUToolCache())
+    model = FakeModel()
+    agent = Agent(name="test", model=model, tools=[tool])
+    model.add_multiple_turn_outputs(
+        [
+            [get_function_tool_call("lookup", '{"query": "a"}')],
+            [get_function_tool_call("lookup", '{"query": "a"}')],
+            [get_text_message("done")],
+        ]
+    )
+
+    await Runner.run(agent, input="start")
+
+    spans = [s.span_data for s in fetch_ordered_spans()]
+    function_spans = [d for d in spans if isinstance(d, FunctionSpanData)]
+    assert [d.cache_hit for d in function_spans] == [False, True]
+    assert function_spans[1].export()["cache_hit"] is True
+    assert len(calls) == 1
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+from openai.types.responses import ResponseUsage
+from openai.types.responses.response_usage import InputTokensDetails, OutputTokensDetails
+
+from agents import Agent, RunConfig, Runner, Usage, handoff
+
+from .fake_model import FakeModel
+from .test_responses import get_handoff_tool_call, get_text_message
+
+
+def test_usage_add_and_from_response_usage():
+    usage = Usage.from_response_usage(
+        ResponseUsage(
+            input_tokens=10,
+            output_tokens=6,
+            total_tokens=16,
+            input_tokens_details=InputTokensDetails(cached_tokens=8),
+            output_tokens_details=OutputTokensDetails(reasoning_tokens=4),
+        )
+    )
+    assert usage == Usage(
+        requests=1,
+        input_tokens=10,
+        output_tokens=6,
+        total_tokens=16,
+        cached_input_tokens=8,
+        reasoning_tokens=4,
+    )
+    assert Usage.from_response_usage(None) == Usage()
+
+    usage.latency = 0.5
+    total = Usage()
+    total.add(usage)
+    total.add(usage)
+    assert (total.requests, total.cached_input_tokens, total.reasoning_tokens) == (2, 16, 8)
+    assert total.latency == 1.0
+
+
+def make_agents() -> tuple[Agent, FakeModel, FakeModel]:
+    triage_model = FakeModel()
+    triage_model.set_hardcoded_usage(
+        Usage(requests=1, input_tokens=10, output_tokens=2, total_tokens=12)
+    )
+    specialist_model = FakeModel()
+    specialist_model.set_hardcoded_usage(
+        Usage(requests=1, input_tokens=20, output_tokens=5, total_tokens=25)
+    )
+    specialist = Agent(name="specialist", model=specialist_model)
+    triage = Agent(name="triage", model=triage_model, handoffs=[handoff(specialist)])
+    triage_model.set_next_output([get_handoff_tool_call(specialist)])
+    specialist_model.set_next_output([get_text_message("done")])
+    return triage, triage_model, specialist_model
+
+
+@pytest.mark.asyncio
+async def test_usage_is_broken_down_by_agent():
+    triage, _, _ = make_agents()
+
+    result = await Runner.run(triage, input="hi")
+
+    ctx = result.context_wrapper
+    assert ctx.usage.requests == 2 and ctx.usage.total_tokens == 37
+    assert ctx.usage_by_agent["triage"].total_tokens == 12
+    assert ctx.usage_by_agent["specialist"].total_tokens == 25
+    assert ctx.usage_by_model == {"FakeModel": ctx.usage}
+    assert ctx.usage_by_agent["triage"].latency > 0
+    assert ctx.usage.latency == pytest.approx(
+        ctx.usage_by_agent["triage"].latency + ctx.usage_by_agent["specialist"].latency
+    )
+
+
+@pytest.mark.asyncio
+async def test_streamed_usage_is_broken_down_by_agent():
+    triage, _, _ = make_agents()
+
+    result = Runner.run_streamed(triage, input="hi")
+    async for _ in result.stream_events():
+        pass
+
+    ctx = result.context_wrapper
+    assert ctx.usage_by_agent["triage"].requests == 1
+    assert ctx.usage_by_agent["specialist"].input_tokens == 20
+    assert ctx.usage_by_agent["specialist"].latency > 0
+
+
+@pytest.mark.asyncio
+async def test_usage_is_broken_down_by_model_name():
+    model = FakeModel()
+    agent = Agent(name="test", model="my-model")
+    model.set_next_output([get_text_message("done")])
+
+    class Provider:
+        def get_model(self, model_name):
+            return model
+
+    result = await Runner.run(agent, input="hi", run_config=RunConfig(model_provider=Provider()))  # type: ignore[arg-type]
+
+    assert list(result.context_wrapper.usage_by_model) == ["my-model"]
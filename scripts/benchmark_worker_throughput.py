@@ -0,0 +1,100 @@
+"""
+Benchmark ticket execution throughput against the number of queue workers.
+
+Each worker runs in its own process and executes tickets from a shared SQLite ticket
+queue with a simulated, fixed execution latency. Throughput should grow close to
+linearly with the worker count until the queue itself becomes the bottleneck.
+
+Usage:
+    PYTHONPATH=src python scripts/benchmark_worker_throughput.py --tickets 400 --workers 1 2 4 8
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+from backend.app.core.data_models import DevinTicket, ExecutionResult
+from backend.app.tools.ticket_queue import TicketQueue
+from backend.app.tools.ticket_worker import TicketWorker
+
+
+def simulated_execute(work_seconds: float, ticket: DevinTicket) -> ExecutionResult:
+    time.sleep(work_seconds)
+    return ExecutionResult(
+        ticket_id=ticket.ticket_id,
+        status="completed",
+        output="Simulated output",
+        execution_time=f"{work_seconds}s",
+    )
+
+
+def run_worker(queue_path: str, work_seconds: float, batch_size: int) -> None:
+    queue = TicketQueue(queue_path)
+    worker = TicketWorker(
+        queue,
+        execute=partial(simulated_execute, work_seconds),
+        batch_size=batch_size,
+        poll_interval=0.01,
+    )
+    worker.run(exit_when_empty=True)
+    queue.close()
+
+
+def measure(worker_count: int, tickets: int, work_seconds: float, batch_size: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        queue_path = str(Path(directory) / "queue.sqlite3")
+        queue = TicketQueue(queue_path)
+        queue.enqueue(
+            DevinTicket(
+                ticket_id=f"ticket-{i}",
+                epic_id="epic-benchmark",
+                title=f"Benchmark ticket {i}",
+                description="Simulated ticket",
+                input_files=[],
+                output_expectation="Simulated output",
+                acceptance_criteria=[],
+                priority=1,
+                status="ready",
+            )
+            for i in range(tickets)
+        )
+
+        start = time.perf_counter()
+        processes = [
+            multiprocessing.Process(target=run_worker, args=(queue_path, work_seconds, batch_size))
+            for _ in range(worker_count)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        done = queue.counts()["done"]
+        queue.close()
+        if done != tickets:
+            raise RuntimeError(f"Only {done} of {tickets} tickets completed")
+        return tickets / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickets", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--work-ms", type=float, default=20.0)
+    parser.add_argument("--batch-size", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'tickets/s':>12} {'speedup':>8}")
+    baseline = None
+    for worker_count in args.workers:
+        throughput = measure(worker_count, args.tickets, args.work_ms / 1000, args.batch_size)
+        baseline = baseline or throughput
+        print(f"{worker_count:>8} {throughput:>12.1f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,23 @@ This module defines the Execution Coordinator Agent, which is responsible for
 managing the execution of tasks by Devin, tracking progress, and collecting results.
 """
 
+import asyncio
+import dataclasses
+
 from backend.app.core.data_models import DevinTicket, ExecutionResult
 from backend.app.tools.devin_session_manager import DevinSessionManager
+from backend.app.tools.session_completion import (
+    SessionCompletionRegistry,
+    get_session_completion_registry,
+)
 from backend.app.utils.logger import get_logger
 
 __all__ = ["ExecutionCoordinatorAgent"]
 
 logger = get_logger(__name__)
 
+PENDING_STATUSES = frozenset({"pending", "running"})
+
 
 class ExecutionCoordinatorAgent:
     """
@@ -22,10 +31,17 @@ class ExecutionCoordinatorAgent:
     tracking progress and collecting results.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Execution Coordinator Agent."""
+    def __init__(self, session_registry: SessionCompletionRegistry | None = None) -> None:
+        """
+        Initialize the Execution Coordinator Agent.
+
+        Args:
+            session_registry: Registry receiving session completion webhooks; defaults to
+                the process-wide registry used by the webhook endpoint
+        """
         logger.info("Initializing Execution Coordinator Agent")
         self.devin_session_manager = DevinSessionManager()
+        self.session_registry = session_registry or get_session_completion_registry()
 
     def execute_ticket(self, ticket: DevinTicket) -> ExecutionResult:
         """
@@ -44,3 +60,66 @@ class ExecutionCoordinatorAgent:
             output="Placeholder output for ticket execution",
             execution_time="10 minutes",
         )
+
+    async def execute_ticket_async(
+        self, ticket: DevinTicket, poll_interval: float = 60.0, timeout: float | None = None
+    ) -> ExecutionResult:
+        """
+        Execute a ticket in a Devin session and await its completion webhook.
+
+        Args:
+            ticket: The ticket to execute
+            poll_interval: Seconds without a webhook after which the session is polled
+            timeout: Optional number of seconds after which to stop waiting
+
+        Returns:
+            The result of the execution
+        """
+        logger.info(f"Executing ticket in Devin session: {ticket.title}")
+        session_id = self.devin_session_manager.create_session(ticket)
+        result = await self.await_session_result(session_id, poll_interval, timeout)
+        return dataclasses.replace(result, ticket_id=ticket.ticket_id)
+
+    async def await_session_result(
+        self, session_id: str, poll_interval: float = 60.0, timeout: float | None = None
+    ) -> ExecutionResult:
+        """
+        Await the result of a Devin session.
+
+        The result normally arrives through the completion webhook. If no webhook arrives
+        within a poll interval, the session is polled once as a fallback for missed
+        webhooks before waiting again.
+
+        Args:
+            session_id: The ID of the session to await
+            poll_interval: Seconds without a webhook after which the session is polled
+            timeout: Optional number of seconds after which to stop waiting
+
+        Returns:
+            The result of the session
+
+        Raises:
+            TimeoutError: If the session did not complete within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            wait = poll_interval
+            if deadline is not None:
+                wait = max(0.0, min(wait, deadline - loop.time()))
+
+            result = await self.session_registry.wait(session_id, wait)
+            if result is None:
+                polled = await asyncio.to_thread(
+                    self.devin_session_manager.get_session_result, session_id
+                )
+                if polled.status not in PENDING_STATUSES:
+                    logger.warning(f"No webhook for session {session_id}, using polled result")
+                    self.session_registry.record(session_id, polled)
+                    result = self.session_registry.get(session_id)
+
+            if result is not None:
+                self.session_registry.forget(session_id)
+                return result
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(f"Session {session_id} did not complete in {timeout}s")
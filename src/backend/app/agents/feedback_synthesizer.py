@@ -5,6 +5,10 @@ This module defines the Feedback Synthesizer Agent, which is responsible for syn
 feedback from multiple sources into learning proposals for future improvement.
 """
 
+from collections.abc import Iterable
+from pathlib import Path
+
+from backend.app.agents.incremental_synthesizer import IncrementalFeedbackSynthesizer
 from backend.app.core.data_models import (
     FeedbackContent,
     LearningProposal,
@@ -25,9 +29,42 @@ class FeedbackSynthesizerAgent:
     learning proposals for future improvement.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Feedback Synthesizer Agent."""
+    def __init__(
+        self, state_path: str | Path | None = None, synthesizer_id: str | None = None
+    ) -> None:
+        """
+        Initialize the Feedback Synthesizer Agent.
+
+        Args:
+            state_path: Optional JSON file persisting the incremental feedback aggregates
+            synthesizer_id: Optional ID included in the IDs of incremental proposals, such as
+                the project ID
+        """
         logger.info("Initializing Feedback Synthesizer Agent")
+        self.incremental = IncrementalFeedbackSynthesizer(state_path, synthesizer_id)
+
+    def record_feedback(
+        self,
+        reports: Iterable[StructuredAnalysisReport] = (),
+        feedback: Iterable[FeedbackContent] = (),
+    ) -> None:
+        """
+        Fold new reports and feedback into the running aggregates and persist them.
+
+        Args:
+            reports: Structured analysis reports not recorded before
+            feedback: Feedback content not recorded before
+        """
+        self.incremental.record(reports, feedback)
+
+    def current_proposal(self) -> LearningProposal:
+        """
+        Get a learning proposal reflecting all feedback recorded so far.
+
+        Returns:
+            A learning proposal built from the running aggregates
+        """
+        return self.incremental.proposal()
 
     def synthesize_feedback(
         self, reports: list[StructuredAnalysisReport], feedback: list[FeedbackContent]
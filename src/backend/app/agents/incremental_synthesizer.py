@@ -0,0 +1,272 @@
+"""
+Incremental Feedback Synthesizer for the AI Project Manager.
+
+This module defines the Incremental Feedback Synthesizer, which maintains running
+aggregates of analysis reports and feedback so that an up-to-date learning proposal
+can be produced at any point of a long execution batch.
+"""
+
+import json
+import os
+import uuid
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from backend.app.core.data_models import (
+    FeedbackContent,
+    LearningProposal,
+    StructuredAnalysisReport,
+)
+from backend.app.utils.logger import get_logger
+
+__all__ = ["IncrementalFeedbackSynthesizer"]
+
+logger = get_logger(__name__)
+
+DEFAULT_IMPACT_AREA = "Process Improvement"
+IMPACT_AREA_KEYWORDS = {
+    "Testing": ("test", "coverage", "assert"),
+    "Documentation": ("doc", "readme", "comment"),
+    "Tool Integration": ("tool", "integration", "api", "webhook"),
+    "Performance": ("performance", "slow", "latency", "timeout"),
+}
+TOP_K = 3
+COMPACT_EVERY = 1000
+
+
+class _TopK:
+    """Most frequent keys of a counter whose counts only ever increase."""
+
+    def __init__(self, counts: Counter[str], k: int) -> None:
+        self.counts = counts
+        self.k = k
+        self.keys = [key for key, _ in counts.most_common(k)]
+
+    def bump(self, key: str) -> None:
+        if key not in self.keys:
+            if len(self.keys) < self.k:
+                self.keys.append(key)
+            elif self.counts[key] > self.counts[self.keys[-1]]:
+                self.keys[-1] = key
+            else:
+                return
+        # Counts only grow, so the bumped key can only move towards the front.
+        index = self.keys.index(key)
+        while index > 0 and self.counts[self.keys[index - 1]] < self.counts[key]:
+            self.keys[index - 1], self.keys[index] = key, self.keys[index - 1]
+            index -= 1
+
+
+class IncrementalFeedbackSynthesizer:
+    """
+    Online synthesizer of learning proposals.
+
+    Every report and feedback item updates running counts of success factors and
+    improvement suggestions, sentiment tallies and impact area scores in constant time,
+    and the most frequent factors and suggestions are tracked as they change. A proposal
+    is built from these aggregates in constant time without revisiting earlier inputs.
+
+    The aggregates can be persisted to a JSON snapshot file. Inputs recorded with
+    record() are appended to a journal next to the snapshot, and the journal is folded
+    into the snapshot every compact_every entries. Both are reloaded on start-up.
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        synthesizer_id: str | None = None,
+        compact_every: int = COMPACT_EVERY,
+    ) -> None:
+        """
+        Initialize the Incremental Feedback Synthesizer.
+
+        Args:
+            state_path: Optional JSON file to load the aggregates from and save them to
+            synthesizer_id: ID included in proposal IDs, e.g. the project ID; defaults to the
+                persisted ID, or a random one
+            compact_every: Number of journal entries after which the journal is compacted
+        """
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.journal_path = (
+            self.state_path.with_suffix(self.state_path.suffix + ".journal")
+            if self.state_path is not None
+            else None
+        )
+        self.compact_every = compact_every
+        state: dict[str, Any] = {}
+        if self.state_path is not None and self.state_path.exists():
+            state = json.loads(self.state_path.read_text())
+            logger.info(f"Loaded feedback aggregates from {self.state_path}")
+
+        self.synthesizer_id: str = (
+            synthesizer_id or state.get("synthesizer_id") or uuid.uuid4().hex[:8]
+        )
+        self.report_count: int = state.get("report_count", 0)
+        self.feedback_count: int = state.get("feedback_count", 0)
+        self.success_factors: Counter[str] = Counter(state.get("success_factors", {}))
+        self.suggestions: Counter[str] = Counter(state.get("suggestions", {}))
+        self.sentiments: Counter[str] = Counter(state.get("sentiments", {}))
+        self.impact_scores: Counter[str] = Counter(state.get("impact_scores", {}))
+        self._top_factors = _TopK(self.success_factors, TOP_K)
+        self._top_suggestions = _TopK(self.suggestions, TOP_K)
+        self._journal_entries = self._replay_journal()
+
+    @property
+    def version(self) -> int:
+        """Number of reports and feedback items aggregated so far."""
+        return self.report_count + self.feedback_count
+
+    def add_report(self, report: StructuredAnalysisReport) -> None:
+        """
+        Fold an analysis report into the aggregates.
+
+        Args:
+            report: The analysis report to add
+        """
+        self.report_count += 1
+        for factor in report.success_factors:
+            self.success_factors[factor] += 1
+            self._top_factors.bump(factor)
+        for suggestion in report.improvement_suggestions:
+            self.suggestions[suggestion] += 1
+            self._top_suggestions.bump(suggestion)
+            self.impact_scores[_impact_area(suggestion, report.metadata)] += 1
+        for factor in report.failure_factors or []:
+            self.impact_scores[_impact_area(factor, report.metadata)] += 1
+
+    def add_feedback(self, item: FeedbackContent) -> None:
+        """
+        Fold a feedback item into the aggregates.
+
+        Args:
+            item: The feedback item to add
+        """
+        self.feedback_count += 1
+        sentiment = item.sentiment.lower()
+        self.sentiments[sentiment] += 1
+        if sentiment == "negative":
+            self.impact_scores[_impact_area(item.content, item.metadata)] += 1
+
+    def proposal(self) -> LearningProposal:
+        """
+        Build a learning proposal from the current aggregates.
+
+        Returns:
+            A learning proposal reflecting every report and feedback item added so far
+        """
+        areas = sorted(self.impact_scores, key=lambda area: (-self.impact_scores[area], area))
+        return LearningProposal(
+            proposal_id=f"proposal-{self.synthesizer_id}-{self.version}",
+            title="Learning Proposal from Feedback",
+            description=(
+                f"Learning proposal based on {self.report_count} reports and "
+                f"{self.feedback_count} feedback items"
+            ),
+            impact_areas=areas or [DEFAULT_IMPACT_AREA],
+            implementation_steps=[
+                f"Address: {suggestion}" for suggestion in self._top_suggestions.keys
+            ],
+            metadata={
+                "top_success_factors": list(self._top_factors.keys),
+                "sentiments": dict(self.sentiments),
+                "impact_scores": dict(self.impact_scores),
+            },
+        )
+
+    def record(
+        self,
+        reports: Iterable[StructuredAnalysisReport] = (),
+        feedback: Iterable[FeedbackContent] = (),
+    ) -> None:
+        """
+        Fold new reports and feedback into the aggregates and append them to the journal.
+
+        Args:
+            reports: Analysis reports not recorded before
+            feedback: Feedback items not recorded before
+        """
+        lines = []
+        for report in reports:
+            self.add_report(report)
+            lines.append(self._journal_line("report", asdict(report)))
+        for item in feedback:
+            self.add_feedback(item)
+            lines.append(self._journal_line("feedback", asdict(item)))
+        if self.journal_path is None or not lines:
+            return
+
+        if self.state_path is not None and not self.state_path.exists():
+            # The snapshot holds the synthesizer ID, so write it before the first entry.
+            self.save()
+            return
+        with self.journal_path.open("a") as journal:
+            journal.writelines(lines)
+        self._journal_entries += len(lines)
+        if self._journal_entries >= self.compact_every:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Atomically write the aggregates to the state file and clear the journal, if a state
+        file is configured.
+        """
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        temporary.write_text(
+            json.dumps(
+                {
+                    "synthesizer_id": self.synthesizer_id,
+                    "report_count": self.report_count,
+                    "feedback_count": self.feedback_count,
+                    "success_factors": self.success_factors,
+                    "suggestions": self.suggestions,
+                    "sentiments": self.sentiments,
+                    "impact_scores": self.impact_scores,
+                }
+            )
+        )
+        os.replace(temporary, self.state_path)
+        # Entries are numbered by version, so a journal left behind by a crash right here is
+        # skipped on replay rather than counted twice.
+        if self.journal_path is not None:
+            self.journal_path.unlink(missing_ok=True)
+        self._journal_entries = 0
+
+    def _journal_line(self, kind: str, data: dict[str, Any]) -> str:
+        return json.dumps({"version": self.version, "kind": kind, "data": data}, default=str) + "\n"
+
+    def _replay_journal(self) -> int:
+        if self.journal_path is None or not self.journal_path.exists():
+            return 0
+        entries = 0
+        for line in self.journal_path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash while it was being appended.
+                logger.warning(f"Skipping a truncated entry of {self.journal_path}")
+                continue
+            entries += 1
+            if entry["version"] <= self.version:
+                continue
+            if entry["kind"] == "report":
+                self.add_report(StructuredAnalysisReport(**entry["data"]))
+            else:
+                self.add_feedback(FeedbackContent(**entry["data"]))
+        logger.info(f"Replayed {entries} journal entries from {self.journal_path}")
+        return entries
+
+
+def _impact_area(text: str, metadata: dict[str, Any] | None) -> str:
+    if metadata and isinstance(metadata.get("impact_area"), str):
+        return str(metadata["impact_area"])
+    lowered = text.lower()
+    for area, keywords in IMPACT_AREA_KEYWORDS.items():
+        if any(keyword in lowered for keyword in keywords):
+            return area
+    return DEFAULT_IMPACT_AREA
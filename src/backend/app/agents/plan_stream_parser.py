@@ -0,0 +1,126 @@
+"""
+Plan Stream Parser for the AI Project Manager.
+
+This module defines the Plan Stream Parser, which incrementally parses a decomposition
+plan streamed as JSON text and emits each work package as soon as it is complete.
+"""
+
+import dataclasses
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Generic, TypeVar
+
+from backend.app.utils.logger import get_logger
+
+__all__ = ["PlanStreamParser"]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PlanStreamParser(Generic[T]):
+    """
+    Incremental parser for streamed decomposition plans.
+
+    The parser scans text deltas of a JSON object such as
+    ``{"title": ..., "work_packages": [{...}, {...}]}`` one character at a time, so every
+    delta is processed exactly once. Each element of the top-level ``work_packages`` array
+    is decoded and returned as soon as its closing brace arrives, while the rest of the
+    plan is still being generated.
+    """
+
+    def __init__(self, plan_id: str, work_package_type: Callable[..., T]) -> None:
+        """
+        Initialize the Plan Stream Parser.
+
+        Args:
+            plan_id: Plan ID assigned to work packages that do not specify one
+            work_package_type: The work package dataclass to build from each decoded element
+        """
+        self.plan_id = plan_id
+        self.work_package_type = work_package_type
+        self._field_names = {
+            field.name
+            for field in dataclasses.fields(work_package_type)  # type: ignore[arg-type]
+        }
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: list[str] | None = None
+        self._last_key: str | None = None
+        self._in_work_packages = False
+        self._element: list[str] | None = None
+
+    def feed(self, chunk: str) -> list[T]:
+        """
+        Consume the next chunk of streamed plan text.
+
+        Args:
+            chunk: The next text delta of the plan
+
+        Returns:
+            The work packages completed by this chunk, in plan order
+        """
+        completed = []
+
+        for char in chunk:
+            if self._element is not None:
+                self._element.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key is not None:
+                        self._last_key = "".join(self._key)
+                        self._key = None
+                    continue
+                if self._key is not None:
+                    self._key.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._key = []
+            elif char in "{[":
+                if char == "[" and self._depth == 1 and self._last_key == "work_packages":
+                    self._in_work_packages = True
+                elif char == "{" and self._depth == 2 and self._in_work_packages:
+                    self._element = [char]
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._element is not None:
+                    completed.append(self._build("".join(self._element)))
+                    self._element = None
+                elif self._depth == 1 and self._in_work_packages:
+                    self._in_work_packages = False
+
+        return completed
+
+    def parse(self, chunks: Iterable[str]) -> Iterator[T]:
+        """
+        Parse a stream of plan text deltas.
+
+        Args:
+            chunks: The text deltas of the plan, in order
+
+        Returns:
+            An iterator over work packages, yielding each one as soon as it is complete
+        """
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+    def _build(self, element: str) -> T:
+        data: dict[str, Any] = json.loads(element)
+        data.setdefault("plan_id", self.plan_id)
+        work_package = self.work_package_type(
+            **{key: value for key, value in data.items() if key in self._field_names}
+        )
+        logger.info(f"Parsed streamed work package: {data.get('title')}")
+        return work_package
@@ -5,6 +5,9 @@ This module defines the Planner Tool, which is responsible for providing
 planning functionality as a tool.
 """
 
+from collections.abc import Iterable, Iterator
+
+from backend.app.agents.plan_stream_parser import PlanStreamParser
 from backend.app.core.data_models import (
     DecompositionPlan,
     HighLevelGoal,
@@ -64,18 +67,7 @@ class PlannerTool:
         """
         logger.info(f"Planning initiative: {initiative_goal.title}")
 
-        work_packages = [
-            WorkPackage(
-                package_id=f"wp-{hash(initiative_goal.id + str(i)) % 10000}",
-                plan_id=f"plan-{hash(initiative_goal.id) % 10000}",
-                title=f"Work Package {i + 1}",
-                description=f"Work package for {initiative_goal.title}",
-                tasks=[f"Task {j + 1} for Work Package {i + 1}" for j in range(2)],
-                estimated_complexity=2,
-                estimated_time="2 days",
-            )
-            for i in range(2)  # Create 2 work packages as a placeholder
-        ]
+        work_packages = list(self.iter_work_packages(initiative_goal))
 
         return DecompositionPlan(
             goal_id=initiative_goal.id,
@@ -86,3 +78,41 @@ class PlannerTool:
             estimated_complexity=4,
             estimated_time="1 week",
         )
+
+    def iter_work_packages(
+        self, initiative_goal: InitiativeGoal, plan_chunks: Iterable[str] | None = None
+    ) -> Iterator[WorkPackage]:
+        """
+        Yield the work packages of an initiative's decomposition plan as they are planned.
+
+        Each work package is yielded as soon as it is complete, so callers can start
+        detailing it while the rest of the plan is still being produced.
+
+        The Planner Tool does not call a model yet, so without plan_chunks the placeholder
+        plan is returned. plan_chunks is the entry point for a streaming planner: pass the
+        text deltas of its structured output as they arrive.
+
+        Args:
+            initiative_goal: The initiative goal to plan for
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan, such as
+                the structured output of an LLM planner
+
+        Returns:
+            An iterator over the work packages of the plan, in plan order
+        """
+        plan_id = f"plan-{hash(initiative_goal.id) % 10000}"
+
+        if plan_chunks is not None:
+            yield from PlanStreamParser(plan_id, WorkPackage).parse(plan_chunks)
+            return
+
+        for i in range(2):  # Create 2 work packages as a placeholder
+            yield WorkPackage(
+                package_id=f"wp-{hash(initiative_goal.id + str(i)) % 10000}",
+                plan_id=plan_id,
+                title=f"Work Package {i + 1}",
+                description=f"Work package for {initiative_goal.title}",
+                tasks=[f"Task {j + 1} for Work Package {i + 1}" for j in range(2)],
+                estimated_complexity=2,
+                estimated_time="2 days",
+            )
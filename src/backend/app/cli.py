@@ -8,7 +8,10 @@ import typer
 from rich import print
 
 from backend.app.core.data_models import HighLevelGoal, InitiativeGoal, LearningProposal
+from backend.app.core.orchestration.checkpoint_store import CheckpointStore
 from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
+from backend.app.tools.ticket_queue import DEFAULT_QUEUE_PATH, TicketQueue
+from backend.app.tools.ticket_worker import TicketWorker
 from backend.app.utils.logger import get_logger
 
 app = typer.Typer(add_completion=False, help="🧠 Devin template CLI")
@@ -173,6 +176,21 @@ def aipm_process_initiative(
         "--pretty/--compact",
         help="Format JSON output with indentation for readability",
     ),
+    checkpoint: bool = typer.Option(
+        False,
+        "--checkpoint",
+        help="Checkpoint the run to .aipm/checkpoints.sqlite3 so that it can be resumed",
+    ),
+    resume: str = typer.Option(
+        None,
+        "--resume",
+        help="Resume an interrupted run by ID, replaying its completed planning and detailing",
+    ),
+    queue_path: str = typer.Option(
+        None,
+        "--queue",
+        help="Also enqueue the tickets to this Ticket Queue database for aipm-worker processes",
+    ),
 ) -> None:
     """Process an initiative goal through the AI Project Manager V0 pipeline.
 
@@ -183,6 +201,9 @@ def aipm_process_initiative(
     --------
     uv run python -m backend.app.cli aipm-process-initiative "Build a web application for task management"
     uv run python -m backend.app.cli aipm-process-initiative "Create a mobile app for inventory tracking" --compact
+    uv run python -m backend.app.cli aipm-process-initiative "Build a web application for task management" --checkpoint
+    uv run python -m backend.app.cli aipm-process-initiative "Build a web application for task management" --resume run-1a2b3c4d5e6f
+    uv run python -m backend.app.cli aipm-process-initiative "Build a web application for task management" --queue .aipm/ticket_queue.sqlite3
     """
     logger.info(f"Processing initiative goal: {initiative_goal_description}")
 
@@ -199,9 +220,22 @@ def aipm_process_initiative(
             description=initiative_goal_description,
         )
 
-        orchestrator = ProjectOrchestrator()
-
-        tickets = orchestrator.process_initiative(initiative_goal)
+        run_id = None
+        checkpoint_store = None
+        if checkpoint or resume:
+            checkpoint_store = CheckpointStore()
+            run_id = resume or checkpoint_store.new_run_id()
+            logger.info(f"Initiative run ID: {run_id} (resume with --resume {run_id})")
+        orchestrator = ProjectOrchestrator(checkpoint_store=checkpoint_store)
+
+        if queue_path:
+            queue = TicketQueue(queue_path)
+            try:
+                tickets = orchestrator.enqueue_initiative(initiative_goal, queue, run_id=run_id)
+            finally:
+                queue.close()
+        else:
+            tickets = orchestrator.process_initiative(initiative_goal, run_id=run_id)
 
         ticket_dicts = [dataclasses.asdict(ticket) for ticket in tickets]
 
@@ -216,6 +250,47 @@ def aipm_process_initiative(
         raise typer.Exit(code=1) from e
 
 
+@app.command("aipm-worker")
+def aipm_worker(
+    queue_path: str = typer.Option(
+        str(DEFAULT_QUEUE_PATH), "--queue", help="Path of the Ticket Queue database"
+    ),
+    worker_id: str = typer.Option(None, "--worker-id", help="Unique worker ID"),
+    batch_size: int = typer.Option(1, "--batch-size", help="Tickets leased at a time"),
+    poll_interval: float = typer.Option(
+        1.0, "--poll-interval", help="Seconds to wait before polling an empty queue again"
+    ),
+    visibility_timeout: float = typer.Option(
+        300.0, "--visibility-timeout", help="Lease duration in seconds"
+    ),
+    exit_when_empty: bool = typer.Option(
+        False, "--exit-when-empty", help="Stop once the queue is drained"
+    ),
+) -> None:
+    """Execute tickets from a Ticket Queue until stopped.
+
+    Any number of workers, on one or more hosts sharing the database file, can run
+    against the same queue.
+
+    Examples
+    --------
+    uv run python -m backend.app.cli aipm-worker
+    uv run python -m backend.app.cli aipm-worker --queue /shared/ticket_queue.sqlite3 --batch-size 4
+    """
+    queue = TicketQueue(queue_path, visibility_timeout=visibility_timeout)
+    try:
+        worker = TicketWorker(
+            queue,
+            worker_id=worker_id,
+            batch_size=batch_size,
+            poll_interval=poll_interval,
+        )
+        processed = worker.run(exit_when_empty=exit_when_empty)
+    finally:
+        queue.close()
+    print(f"[bold green]Executed {processed} tickets[/]")
+
+
 # ------------------------------------------------------------------ #
 #  Python ‑m entry shim
 # ------------------------------------------------------------------ #
@@ -1,5 +1,6 @@
 """Orchestration module for the AI Project Manager."""
 
+from backend.app.core.orchestration.checkpoint_store import CheckpointStore
 from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
 
-__all__: list[str] = ["ProjectOrchestrator"]
+__all__: list[str] = ["CheckpointStore", "ProjectOrchestrator"]
@@ -0,0 +1,220 @@
+"""
+Checkpoint Store for the AI Project Manager.
+
+This module defines the Checkpoint Store, which persists the output of each pipeline
+stage and work package to a local SQLite database so that an interrupted initiative run
+can be resumed without repeating completed planning and detailing calls.
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from backend.app.core.data_models import DevinTicket
+from backend.app.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+__all__ = ["CheckpointStore", "RunCheckpoint"]
+
+logger = get_logger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = Path(".aipm") / "checkpoints.sqlite3"
+
+T = TypeVar("T", bound="DataclassInstance")
+
+
+class CheckpointStore:
+    """
+    Durable store for pipeline checkpoints.
+
+    Each checkpoint is a JSON payload identified by a run ID and a unit name, such as
+    ``plan`` or ``tickets:0``. Writes are committed immediately, so every checkpoint that
+    was saved survives a crash of the process.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CHECKPOINT_PATH) -> None:
+        """
+        Initialize the Checkpoint Store.
+
+        The database file is created on first use.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = Path(path)
+
+    def new_run_id(self) -> str:
+        """
+        Generate a new run ID.
+
+        Returns:
+            A unique run ID
+        """
+        return f"run-{uuid.uuid4().hex[:12]}"
+
+    def save(self, run_id: str, unit: str, payload: Any) -> None:
+        """
+        Save the checkpoint of a completed unit, replacing any previous one.
+
+        Args:
+            run_id: The ID of the run
+            unit: The name of the completed unit
+            payload: The JSON-serializable output of the unit
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (run_id, unit, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (run_id, unit, json.dumps(payload), time.time()),
+            )
+        logger.info(f"Saved checkpoint {unit} for run {run_id}")
+
+    def load(self, run_id: str, unit: str) -> Any:
+        """
+        Load the checkpoint of a unit.
+
+        Args:
+            run_id: The ID of the run
+            unit: The name of the unit
+
+        Returns:
+            The saved payload, or None if the unit has not been checkpointed
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT payload FROM checkpoints WHERE run_id = ? AND unit = ?",
+                (run_id, unit),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def units(self, run_id: str) -> list[str]:
+        """
+        List the checkpointed units of a run.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            The names of the checkpointed units, in the order they were saved
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT unit FROM checkpoints WHERE run_id = ? ORDER BY created_at, rowid",
+                (run_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "run_id TEXT NOT NULL, unit TEXT NOT NULL, payload TEXT NOT NULL, "
+            "created_at REAL NOT NULL, PRIMARY KEY (run_id, unit))"
+        )
+        return connection
+
+
+class RunCheckpoint:
+    """
+    Checkpointing view of a single initiative run.
+
+    Work packages are checkpointed as the planner produces them and each work package's
+    tickets are checkpointed once it has been detailed. When a run is resumed, completed
+    units are replayed from the store instead of being produced again.
+
+    A run is keyed on a hash of its initiative description, so that resuming a run ID
+    with a different initiative is refused instead of replaying the other initiative's
+    plan and tickets.
+    """
+
+    def __init__(self, store: CheckpointStore, run_id: str, initiative: str) -> None:
+        """
+        Initialize the Run Checkpoint.
+
+        Args:
+            store: The store to persist checkpoints to
+            run_id: The ID of the run
+            initiative: The description of the run's initiative goal
+
+        Raises:
+            ValueError: If the run was started for a different initiative
+        """
+        self.store = store
+        self.run_id = run_id
+
+        initiative_hash = hashlib.sha256(initiative.encode("utf-8")).hexdigest()
+        stored_hash = store.load(run_id, "initiative")
+        if stored_hash is None:
+            store.save(run_id, "initiative", initiative_hash)
+        elif stored_hash != initiative_hash:
+            raise ValueError(
+                f"Run {run_id} was started for a different initiative and cannot be resumed "
+                "with this one"
+            )
+
+    def work_packages(
+        self, plan: Callable[[], Iterable[T]], work_package_type: Callable[..., T]
+    ) -> Iterator[T]:
+        """
+        Yield the work packages of the run's plan, replaying checkpointed ones.
+
+        If planning completed in an earlier attempt, the cached plan is replayed without
+        calling the planner. Otherwise the planner is run again and cached work packages
+        take the place of their re-planned counterparts, so detailing checkpoints stay
+        consistent with the work packages they were created from.
+
+        Args:
+            plan: Callable that starts the planner and returns its work packages in order
+            work_package_type: The work package dataclass to rebuild cached packages with
+
+        Returns:
+            An iterator over the work packages of the plan, in plan order
+        """
+        package_count = self.store.load(self.run_id, "plan")
+        if package_count is not None:
+            logger.info(f"Replaying {package_count} planned work packages for run {self.run_id}")
+            for index in range(package_count):
+                yield work_package_type(**self.store.load(self.run_id, f"work_package:{index}"))
+            return
+
+        index = -1
+        for index, work_package in enumerate(plan()):
+            cached = self.store.load(self.run_id, f"work_package:{index}")
+            if cached is not None:
+                yield work_package_type(**cached)
+                continue
+            self.store.save(self.run_id, f"work_package:{index}", dataclasses.asdict(work_package))
+            yield work_package
+        self.store.save(self.run_id, "plan", index + 1)
+
+    def tickets(self, index: int, detail: Callable[[], list[DevinTicket]]) -> list[DevinTicket]:
+        """
+        Get the tickets of a work package, replaying them if they were checkpointed.
+
+        Args:
+            index: The position of the work package in the plan
+            detail: Callable that details the work package
+
+        Returns:
+            The tickets of the work package
+        """
+        cached = self.store.load(self.run_id, f"tickets:{index}")
+        if cached is not None:
+            logger.info(f"Replaying tickets of work package {index} for run {self.run_id}")
+            return [DevinTicket(**ticket) for ticket in cached]
+
+        tickets = detail()
+        self.store.save(
+            self.run_id, f"tickets:{index}", [dataclasses.asdict(ticket) for ticket in tickets]
+        )
+        return tickets
@@ -5,12 +5,19 @@ This module defines the Project Orchestrator, which is responsible for orchestra
 the flow of data between the different agents in the AI Project Manager.
 """
 
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import Literal
+
 from backend.app.core.data_models import (
     DevinTicket,
     HighLevelGoal,
     InitiativeGoal,
     LearningProposal,
+    WorkPackage,
 )
+from backend.app.core.orchestration.checkpoint_store import CheckpointStore, RunCheckpoint
+from backend.app.tools.ticket_queue import TicketQueue
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,8 +31,19 @@ class ProjectOrchestrator:
     the different agents in the AI Project Manager.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Project Orchestrator."""
+    def __init__(
+        self,
+        dedup_policy: Literal["link", "merge"] = "link",
+        checkpoint_store: CheckpointStore | None = None,
+    ) -> None:
+        """
+        Initialize the Project Orchestrator.
+
+        Args:
+            dedup_policy: Whether near-duplicate tickets are linked to or merged into the
+                first equivalent ticket before dispatch
+            checkpoint_store: Optional store that initiative runs are checkpointed to
+        """
         logger.info("Initializing Project Orchestrator")
         from backend.app.agents.execution_coordinator import (
             ExecutionCoordinatorAgent,
@@ -38,6 +56,7 @@ class ProjectOrchestrator:
         from backend.app.agents.prioritizer import PrioritizerAgent
         from backend.app.agents.task_definer import TaskDefinerAgent
         from backend.app.tools.devin_session_manager import DevinSessionManager
+        from backend.app.tools.ticket_dedup_index import TicketDedupIndex
 
         self.planner = PlannerAgent()
         self.task_definer = TaskDefinerAgent()
@@ -46,6 +65,9 @@ class ProjectOrchestrator:
         self.feedback_analyzer = FeedbackAnalyzerAgent()
         self.feedback_synthesizer = FeedbackSynthesizerAgent()
         self.devin_session_manager = DevinSessionManager()
+        self.ticket_dedup_index = TicketDedupIndex()
+        self.dedup_policy = dedup_policy
+        self.checkpoint_store = checkpoint_store
 
     def run_placeholder_pipeline(self, goal: HighLevelGoal) -> LearningProposal:
         """
@@ -74,7 +96,12 @@ class ProjectOrchestrator:
             ],
         )
 
-    def process_initiative(self, initiative_goal: InitiativeGoal) -> list[DevinTicket]:
+    def process_initiative(
+        self,
+        initiative_goal: InitiativeGoal,
+        plan_chunks: Iterable[str] | None = None,
+        run_id: str | None = None,
+    ) -> list[DevinTicket]:
         """
         Process an initiative goal through the AIPM pipeline.
 
@@ -83,13 +110,46 @@ class ProjectOrchestrator:
         2. Using the TaskDefiner to create detailed tickets for each work package in the plan
         3. Using the Prioritizer to prioritize the tickets
         4. Aggregating all tickets and returning them
+        5. Linking or merging near-duplicates of previously seen tickets before returning
 
         Args:
             initiative_goal: The initiative goal to process
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan
+            run_id: Optional ID of the run to checkpoint to, or to resume if it was
+                interrupted; only used when the orchestrator has a checkpoint store
 
         Returns:
             A list of Devin tickets generated from the initiative goal
         """
+        return list(self.iter_initiative_tickets(initiative_goal, plan_chunks, run_id))
+
+    def iter_initiative_tickets(
+        self,
+        initiative_goal: InitiativeGoal,
+        plan_chunks: Iterable[str] | None = None,
+        run_id: str | None = None,
+    ) -> Iterator[DevinTicket]:
+        """
+        Yield the tickets for an initiative goal as each work package is detailed.
+
+        Each work package is detailed as soon as the planner completes it rather than after
+        the whole decomposition plan is available, so the first tickets are ready after
+        roughly one work package's worth of planning and detailing. Planning and detailing
+        take turns in the calling thread: the next plan chunk is only read once the
+        previous work package has been detailed and its tickets consumed.
+
+        When the orchestrator has a checkpoint store, each planned work package and each
+        work package's tickets are checkpointed under the run ID, and units completed by an
+        earlier attempt of the same run are replayed instead of being produced again.
+
+        Args:
+            initiative_goal: The initiative goal to process
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan
+            run_id: Optional ID of the run to checkpoint to or resume
+
+        Returns:
+            An iterator over the Devin tickets generated from the initiative goal
+        """
         logger.info(f"Processing initiative: {initiative_goal.title}")
 
         from backend.app.agents.detailer_tool import DetailerTool
@@ -97,12 +157,56 @@ class ProjectOrchestrator:
 
         planner_tool = PlannerTool()
         detailer_tool = DetailerTool()
+        checkpoint = self._run_checkpoint(run_id, initiative_goal)
 
-        plan = planner_tool.plan_initiative(initiative_goal)
+        def plan() -> Iterator[WorkPackage]:
+            return planner_tool.iter_work_packages(initiative_goal, plan_chunks)
 
-        tickets = []
-        for work_package in plan.work_packages:
-            work_package_tickets = detailer_tool.detail_work_package(work_package)
-            tickets.extend(work_package_tickets)
+        work_packages = (
+            plan() if checkpoint is None else checkpoint.work_packages(plan, WorkPackage)
+        )
+        for index, work_package in enumerate(work_packages):
+            detail = partial(detailer_tool.detail_work_package, work_package)
+            work_package_tickets = (
+                detail() if checkpoint is None else checkpoint.tickets(index, detail)
+            )
+            yield from self.ticket_dedup_index.deduplicate(work_package_tickets, self.dedup_policy)
+
+    def enqueue_initiative(
+        self,
+        initiative_goal: InitiativeGoal,
+        queue: TicketQueue,
+        plan_chunks: Iterable[str] | None = None,
+        run_id: str | None = None,
+    ) -> list[DevinTicket]:
+        """
+        Process an initiative goal and enqueue its tickets for Ticket Workers.
+
+        Each ticket is enqueued as soon as it is yielded, so workers can start executing the
+        first tickets while later work packages are still being planned and detailed.
+        Tickets replayed from a checkpoint are already in the queue and are not added again.
+
+        Args:
+            initiative_goal: The initiative goal to process
+            queue: The queue to enqueue the tickets to
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan
+            run_id: Optional ID of the run to checkpoint to or resume
 
+        Returns:
+            The tickets generated from the initiative goal
+        """
+        tickets = []
+        for ticket in self.iter_initiative_tickets(initiative_goal, plan_chunks, run_id):
+            queue.enqueue([ticket])
+            tickets.append(ticket)
         return tickets
+
+    def _run_checkpoint(
+        self, run_id: str | None, initiative_goal: InitiativeGoal
+    ) -> RunCheckpoint | None:
+        if self.checkpoint_store is None:
+            return None
+        if run_id is None:
+            run_id = self.checkpoint_store.new_run_id()
+        logger.info(f"Checkpointing initiative run {run_id}")
+        return RunCheckpoint(self.checkpoint_store, run_id, initiative_goal.description)
@@ -5,6 +5,9 @@ This module defines the Planner Tool Agent, which is responsible for providing
 planning functionality as a tool.
 """
 
+from collections.abc import Iterable, Iterator
+
+from backend.app.agents.plan_stream_parser import PlanStreamParser
 from backend.app.custom_agents.ai_project_manager.core.data_models import (
     DecompositionPlan,
     InitiativeGoal,
@@ -41,26 +44,7 @@ class PlannerTool:
         """
         logger.info(f"Creating plan for initiative: {initiative_goal.title}")
 
-        work_packages = [
-            WorkPackage(
-                package_id=f"wp-1-{hash(initiative_goal.id) % 10000}",
-                plan_id=f"plan-{hash(initiative_goal.id) % 10000}",
-                title="Work Package 1: Setup",
-                description="Initial setup and configuration",
-                tasks=["Task 1: Setup environment", "Task 2: Configure dependencies"],
-                estimated_complexity=2,
-                estimated_time="1 day",
-            ),
-            WorkPackage(
-                package_id=f"wp-2-{hash(initiative_goal.id) % 10000}",
-                plan_id=f"plan-{hash(initiative_goal.id) % 10000}",
-                title="Work Package 2: Implementation",
-                description="Core implementation tasks",
-                tasks=["Task 1: Implement core functionality", "Task 2: Add tests"],
-                estimated_complexity=4,
-                estimated_time="2 days",
-            ),
-        ]
+        work_packages = list(self.iter_work_packages(initiative_goal))
 
         return DecompositionPlan(
             goal_id=initiative_goal.id,
@@ -71,3 +55,45 @@ class PlannerTool:
             estimated_complexity=3,
             estimated_time="3 days",
         )
+
+    def iter_work_packages(
+        self, initiative_goal: InitiativeGoal, plan_chunks: Iterable[str] | None = None
+    ) -> Iterator[WorkPackage]:
+        """
+        Yield the work packages of an initiative's decomposition plan as they are planned.
+
+        Each work package is yielded as soon as it is complete, so callers can start
+        detailing it while the rest of the plan is still being produced.
+
+        Args:
+            initiative_goal: The initiative goal to plan for
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan, such as
+                the structured output of an LLM planner
+
+        Returns:
+            An iterator over the work packages of the plan, in plan order
+        """
+        plan_id = f"plan-{hash(initiative_goal.id) % 10000}"
+
+        if plan_chunks is not None:
+            yield from PlanStreamParser(plan_id, WorkPackage).parse(plan_chunks)
+            return
+
+        yield WorkPackage(
+            package_id=f"wp-1-{hash(initiative_goal.id) % 10000}",
+            plan_id=plan_id,
+            title="Work Package 1: Setup",
+            description="Initial setup and configuration",
+            tasks=["Task 1: Setup environment", "Task 2: Configure dependencies"],
+            estimated_complexity=2,
+            estimated_time="1 day",
+        )
+        yield WorkPackage(
+            package_id=f"wp-2-{hash(initiative_goal.id) % 10000}",
+            plan_id=plan_id,
+            title="Work Package 2: Implementation",
+            description="Core implementation tasks",
+            tasks=["Task 1: Implement core functionality", "Task 2: Add tests"],
+            estimated_complexity=4,
+            estimated_time="2 days",
+        )
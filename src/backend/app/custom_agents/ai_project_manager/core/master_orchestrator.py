@@ -5,11 +5,19 @@ This module defines the Master Orchestrator Agent, which is responsible for
 orchestrating the AI Project Manager pipeline.
 """
 
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import Literal
 
 from backend.app.core.data_models import DevinTicket
+from backend.app.core.orchestration.checkpoint_store import CheckpointStore, RunCheckpoint
 from backend.app.custom_agents.ai_project_manager.agents.detailer_tool import DetailerTool
 from backend.app.custom_agents.ai_project_manager.agents.planner_tool import PlannerTool
-from backend.app.custom_agents.ai_project_manager.core.data_models import InitiativeGoal
+from backend.app.custom_agents.ai_project_manager.core.data_models import (
+    InitiativeGoal,
+    WorkPackage,
+)
+from backend.app.tools.ticket_dedup_index import TicketDedupIndex
 from backend.app.utils.logger import get_logger
 
 __all__ = ["MasterOrchestratorAgent"]
@@ -26,13 +34,32 @@ class MasterOrchestratorAgent:
     generate Devin tickets.
     """
 
-    def __init__(self) -> None:
-        """Initialize the Master Orchestrator Agent."""
+    def __init__(
+        self,
+        dedup_policy: Literal["link", "merge"] = "link",
+        checkpoint_store: CheckpointStore | None = None,
+    ) -> None:
+        """
+        Initialize the Master Orchestrator Agent.
+
+        Args:
+            dedup_policy: Whether near-duplicate tickets are linked to or merged into the
+                first equivalent ticket before dispatch
+            checkpoint_store: Optional store that initiative runs are checkpointed to
+        """
         logger.info("Initializing Master Orchestrator Agent")
         self.planner_tool = PlannerTool()
         self.detailer_tool = DetailerTool()
-
-    def process_initiative(self, initiative_goal: InitiativeGoal) -> list[DevinTicket]:
+        self.ticket_dedup_index = TicketDedupIndex()
+        self.dedup_policy = dedup_policy
+        self.checkpoint_store = checkpoint_store
+
+    def process_initiative(
+        self,
+        initiative_goal: InitiativeGoal,
+        plan_chunks: Iterable[str] | None = None,
+        run_id: str | None = None,
+    ) -> list[DevinTicket]:
         """
         Process an initiative goal through the AIPM pipeline.
 
@@ -40,27 +67,75 @@ class MasterOrchestratorAgent:
         1. Using the PlannerTool to create a decomposition plan from the initiative goal
         2. Using the DetailerTool to create detailed tickets for each work package in the plan
         3. Aggregating all tickets and returning them
+        4. Linking or merging near-duplicates of previously seen tickets before returning
 
         Args:
             initiative_goal: The initiative goal to process
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan
+            run_id: Optional ID of the run to checkpoint to, or to resume if it was
+                interrupted; only used when the agent has a checkpoint store
 
         Returns:
             A list of Devin tickets generated from the initiative goal
         """
+        all_tickets = list(self.iter_initiative_tickets(initiative_goal, plan_chunks, run_id))
+        logger.info(f"Generated {len(all_tickets)} tickets for initiative: {initiative_goal.title}")
+        return all_tickets
+
+    def iter_initiative_tickets(
+        self,
+        initiative_goal: InitiativeGoal,
+        plan_chunks: Iterable[str] | None = None,
+        run_id: str | None = None,
+    ) -> Iterator[DevinTicket]:
+        """
+        Yield the tickets for an initiative goal as each work package is detailed.
+
+        Each work package is detailed as soon as the PlannerTool completes it rather than
+        after the whole decomposition plan is available, so the first tickets are ready after
+        roughly one work package's worth of planning and detailing. Planning and detailing
+        take turns in the calling thread: the next plan chunk is only read once the
+        previous work package has been detailed and its tickets consumed.
+
+        When the agent has a checkpoint store, each planned work package and each work
+        package's tickets are checkpointed under the run ID, and units completed by an
+        earlier attempt of the same run are replayed instead of being produced again.
+
+        Args:
+            initiative_goal: The initiative goal to process
+            plan_chunks: Optional text deltas of a streamed JSON decomposition plan
+            run_id: Optional ID of the run to checkpoint to or resume
+
+        Returns:
+            An iterator over the Devin tickets generated from the initiative goal
+        """
         logger.info(f"Processing initiative: {initiative_goal.title}")
 
-        plan = self.planner_tool.plan_initiative(initiative_goal)
-        logger.info(f"Received plan: {plan.title} with {len(plan.work_packages)} work packages")
+        checkpoint = self._run_checkpoint(run_id, initiative_goal)
 
-        all_tickets = []
+        def plan() -> Iterator[WorkPackage]:
+            return self.planner_tool.iter_work_packages(initiative_goal, plan_chunks)
 
-        for work_package_index, work_package in enumerate(plan.work_packages):
+        work_packages = (
+            plan() if checkpoint is None else checkpoint.work_packages(plan, WorkPackage)
+        )
+        for work_package_index, work_package in enumerate(work_packages):
             logger.info(f"Processing work package {work_package_index + 1}: {work_package.title}")
 
-            tickets = self.detailer_tool.detail_work_package(work_package)
+            detail = partial(self.detailer_tool.detail_work_package, work_package)
+            tickets = (
+                detail() if checkpoint is None else checkpoint.tickets(work_package_index, detail)
+            )
             logger.info(f"Created {len(tickets)} tickets for work package: {work_package.title}")
 
-            all_tickets.extend(tickets)
-
-        logger.info(f"Generated {len(all_tickets)} tickets for initiative: {initiative_goal.title}")
-        return all_tickets
+            yield from self.ticket_dedup_index.deduplicate(tickets, self.dedup_policy)
+
+    def _run_checkpoint(
+        self, run_id: str | None, initiative_goal: InitiativeGoal
+    ) -> RunCheckpoint | None:
+        if self.checkpoint_store is None:
+            return None
+        if run_id is None:
+            run_id = self.checkpoint_store.new_run_id()
+        logger.info(f"Checkpointing initiative run {run_id}")
+        return RunCheckpoint(self.checkpoint_store, run_id, initiative_goal.description)
@@ -4,10 +4,19 @@ Main application for the Agents Project.
 This module provides the FastAPI application for the Agents Project.
 """
 
+import hmac
+import os
+from typing import Any
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
 from pydantic import BaseModel
 
+from backend.app.core.data_models import ExecutionResult
+from backend.app.tools.session_completion import (
+    SESSION_COMPLETED_PATH,
+    get_session_completion_registry,
+)
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,12 +30,46 @@ class TaskRequest(BaseModel):
     task_description: str
 
 
+class SessionCompletion(BaseModel):
+    """Payload of the Devin session completion webhook."""
+
+    session_id: str
+    ticket_id: str
+    status: str
+    output: str
+    execution_time: str
+    logs: str | None = None
+    artifacts: list[str] | None = None
+    metadata: dict[str, Any] | None = None
+
+
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "ok"}
 
 
+@app.post(SESSION_COMPLETED_PATH)
+async def session_completed(
+    completion: SessionCompletion,
+    x_webhook_secret: str | None = Header(default=None),
+) -> dict[str, str]:
+    """
+    Record the result of a completed Devin session.
+
+    If the DEVIN_WEBHOOK_SECRET environment variable is set, the request must carry the
+    same value in its X-Webhook-Secret header. Redelivered webhooks are acknowledged
+    without being recorded again.
+    """
+    secret = os.getenv("DEVIN_WEBHOOK_SECRET")
+    if secret and not hmac.compare_digest(x_webhook_secret or "", secret):
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+
+    result = ExecutionResult(**completion.model_dump(exclude={"session_id"}))
+    recorded = get_session_completion_registry().record(completion.session_id, result)
+    return {"status": "recorded" if recorded else "duplicate"}
+
+
 def run_app() -> None:
     """Run the FastAPI application."""
     uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,233 @@
+"""
+Session Completion Registry for the AI Project Manager.
+
+This module defines the Session Completion Registry, which records Devin session results
+delivered by the completion webhook and wakes up the coroutines awaiting them, and the
+Local Webhook Sender, a stand-in for Devin that delivers completion webhooks locally.
+"""
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+
+import httpx
+
+from backend.app.core.data_models import ExecutionResult
+from backend.app.utils.logger import get_logger
+
+__all__ = [
+    "LocalWebhookSender",
+    "SessionCompletionRegistry",
+    "get_session_completion_registry",
+]
+
+logger = get_logger(__name__)
+
+DEFAULT_RESULT_TTL = 3600.0
+DEFAULT_MAX_SESSIONS = 10_000
+
+SESSION_COMPLETED_PATH = "/webhooks/devin/session-completed"
+WEBHOOK_SECRET_HEADER = "X-Webhook-Secret"
+
+
+class SessionCompletionRegistry:
+    """
+    Registry of completed Devin sessions.
+
+    Results can be recorded before or after a coroutine starts waiting for them, so a
+    webhook that arrives before the waiter registers is not lost. Recording is safe from
+    any thread and wakes waiters on their own event loops.
+
+    Results nobody collects are dropped after ttl seconds, or oldest first once more than
+    max_sessions are held. Forgotten sessions are remembered for as long, so a webhook
+    redelivered after the result was consumed is treated as a duplicate.
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_RESULT_TTL, max_sessions: int = DEFAULT_MAX_SESSIONS
+    ) -> None:
+        """
+        Initialize the Session Completion Registry.
+
+        Args:
+            ttl: Seconds to keep an uncollected result or a forgotten session ID
+            max_sessions: Maximum number of results, and of forgotten session IDs, to keep
+        """
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._results: OrderedDict[str, tuple[float, ExecutionResult]] = OrderedDict()
+        self._forgotten: OrderedDict[str, float] = OrderedDict()
+        self._waiters: dict[
+            str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future[ExecutionResult]]]
+        ] = {}
+
+    def record(self, session_id: str, result: ExecutionResult) -> bool:
+        """
+        Record the result of a completed session and notify its waiters.
+
+        Args:
+            session_id: The ID of the completed session
+            result: The result of the session
+
+        Returns:
+            True if the result was recorded, False if the session was already completed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if session_id in self._results or session_id in self._forgotten:
+                return False
+            self._results[session_id] = (now, result)
+            self._prune(now)
+            waiters = self._waiters.pop(session_id, [])
+
+        logger.info(f"Session {session_id} completed with status {result.status}")
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future, result)
+        return True
+
+    def get(self, session_id: str) -> ExecutionResult | None:
+        """
+        Get the recorded result of a session.
+
+        Args:
+            session_id: The ID of the session
+
+        Returns:
+            The result of the session, or None if it has not completed yet
+        """
+        with self._lock:
+            return self._result(session_id)
+
+    async def wait(self, session_id: str, timeout: float | None = None) -> ExecutionResult | None:
+        """
+        Wait until a session completes.
+
+        Args:
+            session_id: The ID of the session to wait for
+            timeout: Optional number of seconds after which to stop waiting
+
+        Returns:
+            The result of the session, or None if it did not complete within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            result = self._result(session_id)
+            if result is not None:
+                return result
+            future: asyncio.Future[ExecutionResult] = loop.create_future()
+            self._waiters.setdefault(session_id, []).append((loop, future))
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(session_id, [])
+                if (loop, future) in waiters:
+                    waiters.remove((loop, future))
+                if not waiters:
+                    self._waiters.pop(session_id, None)
+
+    def forget(self, session_id: str) -> None:
+        """
+        Drop the recorded result of a session once it has been consumed.
+
+        Later deliveries of the same session's webhook are ignored.
+
+        Args:
+            session_id: The ID of the session
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._results.pop(session_id, None)
+            self._forgotten[session_id] = now
+            self._forgotten.move_to_end(session_id)
+            self._prune(now)
+
+    def _result(self, session_id: str) -> ExecutionResult | None:
+        entry = self._results.get(session_id)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def _prune(self, now: float) -> None:
+        while self._results:
+            session_id, (recorded_at, _) = next(iter(self._results.items()))
+            if now - recorded_at <= self.ttl and len(self._results) <= self.max_sessions:
+                break
+            logger.warning(f"Dropping uncollected result of session {session_id}")
+            self._results.popitem(last=False)
+        while self._forgotten:
+            forgotten_at = next(iter(self._forgotten.values()))
+            if now - forgotten_at <= self.ttl and len(self._forgotten) <= self.max_sessions:
+                break
+            self._forgotten.popitem(last=False)
+
+
+def _resolve(future: "asyncio.Future[ExecutionResult]", result: ExecutionResult) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+_registry = SessionCompletionRegistry()
+
+
+def get_session_completion_registry() -> SessionCompletionRegistry:
+    """
+    Get the process-wide Session Completion Registry shared with the webhook endpoint.
+
+    Returns:
+        The process-wide registry
+    """
+    return _registry
+
+
+class LocalWebhookSender:
+    """
+    Stand-in for Devin that delivers session completion webhooks.
+
+    The sender posts the same payload as the real completion webhook, either to a running
+    server or, through an ASGI transport, directly to the FastAPI app in tests.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        transport: httpx.AsyncBaseTransport | None = None,
+        secret: str | None = None,
+    ) -> None:
+        """
+        Initialize the Local Webhook Sender.
+
+        Args:
+            base_url: The base URL of the app receiving the webhooks
+            transport: Optional transport, such as httpx.ASGITransport(app=app)
+            secret: Optional shared secret expected by the webhook endpoint
+        """
+        self.base_url = base_url
+        self.transport = transport
+        self.secret = secret
+
+    async def send(self, session_id: str, result: ExecutionResult) -> httpx.Response:
+        """
+        Deliver a session completion webhook.
+
+        Args:
+            session_id: The ID of the completed session
+            result: The result of the session
+
+        Returns:
+            The response of the webhook endpoint
+        """
+        headers = {WEBHOOK_SECRET_HEADER: self.secret} if self.secret else {}
+        async with httpx.AsyncClient(base_url=self.base_url, transport=self.transport) as client:
+            return await client.post(
+                SESSION_COMPLETED_PATH,
+                json={"session_id": session_id, **dataclasses.asdict(result)},
+                headers=headers,
+            )
@@ -0,0 +1,341 @@
+"""
+Ticket Dedup Index for the AI Project Manager.
+
+This module defines the Ticket Dedup Index, which detects near-duplicate Devin tickets
+using MinHash signatures and locality-sensitive hashing (LSH) so that they can be merged
+or linked before they are dispatched as separate sessions.
+"""
+
+import hashlib
+import itertools
+import random
+import re
+from typing import Literal
+
+from backend.app.core.data_models import DevinTicket
+from backend.app.utils.logger import get_logger
+
+__all__ = ["TicketDedupIndex"]
+
+logger = get_logger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class TicketDedupIndex:
+    """
+    Incremental near-duplicate index over Devin tickets.
+
+    Each ticket's title, description and acceptance criteria are shingled into word
+    n-grams and summarised as a MinHash signature. Signatures are split into bands that
+    are hashed into buckets, so candidate duplicates are found by bucket lookups instead
+    of comparing against every indexed ticket. Candidates are confirmed by the estimated
+    Jaccard similarity of their signatures.
+
+    The index holds at most max_entries tickets. When it is full, the oldest cluster is
+    evicted, so a long-lived index only deduplicates against recent tickets.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 16,
+        threshold: float = 0.8,
+        shingle_size: int = 3,
+        seed: int = 1,
+        max_entries: int = 10_000,
+    ) -> None:
+        """
+        Initialize the Ticket Dedup Index.
+
+        Args:
+            num_perm: Number of hash permutations in each MinHash signature
+            bands: Number of LSH bands; must divide num_perm evenly
+            threshold: Minimum estimated Jaccard similarity for two tickets to be duplicates
+            shingle_size: Number of consecutive words in each shingle
+            seed: Seed for the permutation coefficients, so signatures are reproducible
+            max_entries: Maximum number of indexed tickets before the oldest are evicted
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        if max_entries < 1:
+            raise ValueError(f"max_entries ({max_entries}) must be positive")
+
+        logger.info("Initializing Ticket Dedup Index")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+        # Entries are keyed by an entry key rather than the ticket ID, because ticket IDs are
+        # short hashes that can collide: a different ticket reusing an ID gets its own entry.
+        self._buckets: list[dict[tuple[int, ...], list[str]]] = [{} for _ in range(bands)]
+        self._signatures: dict[str, tuple[int, ...]] = {}
+        self._canonical: dict[str, str] = {}
+        self._ticket_ids: dict[str, str] = {}
+        self._entry_keys: dict[str, list[str]] = {}
+        self._entry_sequence = itertools.count(1)
+        # Entry keys of each cluster, keyed by its canonical entry, for eviction.
+        self._members: dict[str, list[str]] = {}
+        # Acceptance criteria of the canonical tickets returned by deduplicate(), as returned.
+        self._returned_criteria: dict[str, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return ticket_id in self._entry_keys
+
+    def signature(self, ticket: DevinTicket) -> tuple[int, ...]:
+        """
+        Compute the MinHash signature of a ticket.
+
+        Args:
+            ticket: The ticket to compute the signature for
+
+        Returns:
+            A tuple of num_perm minimum hash values
+        """
+        shingle_hashes = [_stable_hash(shingle) for shingle in self._shingles(ticket)]
+        if not shingle_hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in shingle_hashes)
+            for a, b in self._permutations
+        )
+
+    def query(self, ticket: DevinTicket) -> list[str]:
+        """
+        Find indexed tickets that are near-duplicates of a ticket.
+
+        Args:
+            ticket: The ticket to look up; it does not need to be indexed
+
+        Returns:
+            The IDs of matching indexed tickets, most similar first
+        """
+        signature = self.signature(ticket)
+        entry_key = self._find_entry(ticket.ticket_id, signature)
+        return [self._ticket_ids[key] for key, _ in self._matches(entry_key, signature)]
+
+    def add(self, ticket: DevinTicket) -> str | None:
+        """
+        Add a ticket to the index.
+
+        Args:
+            ticket: The ticket to index
+
+        Returns:
+            The ID of the canonical ticket of the cluster the ticket joined, or None if
+            the ticket has no near-duplicates and is now canonical itself
+        """
+        entry_key, canonical_key = self._add(ticket)
+        return None if canonical_key == entry_key else self._ticket_ids[canonical_key]
+
+    def _add(self, ticket: DevinTicket) -> tuple[str, str]:
+        signature = self.signature(ticket)
+        existing_key = self._find_entry(ticket.ticket_id, signature)
+        if existing_key is not None:
+            return existing_key, self._canonical[existing_key]
+
+        while len(self._signatures) >= self.max_entries:
+            self._evict_oldest_cluster()
+
+        entry_keys = self._entry_keys.setdefault(ticket.ticket_id, [])
+        if entry_keys:
+            logger.warning(
+                f"Ticket ID {ticket.ticket_id} is already indexed for a different ticket; "
+                "indexing it separately"
+            )
+        entry_key = (
+            ticket.ticket_id
+            if not entry_keys
+            else f"{ticket.ticket_id}#{next(self._entry_sequence)}"
+        )
+        matches = self._matches(entry_key, signature)
+
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(entry_key)
+        self._signatures[entry_key] = signature
+        self._ticket_ids[entry_key] = ticket.ticket_id
+        entry_keys.append(entry_key)
+
+        if not matches:
+            self._canonical[entry_key] = entry_key
+            self._members[entry_key] = [entry_key]
+            return entry_key, entry_key
+
+        canonical_key = self._canonical[matches[0][0]]
+        self._canonical[entry_key] = canonical_key
+        self._members[canonical_key].append(entry_key)
+        logger.info(
+            f"Ticket {ticket.ticket_id} is a near-duplicate of {self._ticket_ids[canonical_key]} "
+            f"(similarity {matches[0][1]:.2f})"
+        )
+        return entry_key, canonical_key
+
+    def canonical_id(self, ticket_id: str) -> str:
+        """
+        Get the canonical ticket ID of the cluster an indexed ticket belongs to.
+
+        Args:
+            ticket_id: The ID of an indexed ticket
+
+        Returns:
+            The ID of the first indexed ticket of the cluster
+        """
+        return self._ticket_ids[self._canonical[self._entry_keys[ticket_id][0]]]
+
+    def clusters(self) -> dict[str, list[str]]:
+        """
+        Group indexed tickets by the canonical ticket of their cluster.
+
+        Returns:
+            A mapping of canonical ticket ID to the IDs of all tickets in its cluster,
+            including only clusters with more than one ticket
+        """
+        clusters: dict[str, list[str]] = {}
+        for entry_key, canonical_key in self._canonical.items():
+            clusters.setdefault(self._ticket_ids[canonical_key], []).append(
+                self._ticket_ids[entry_key]
+            )
+        return {key: members for key, members in clusters.items() if len(members) > 1}
+
+    def deduplicate(
+        self, tickets: list[DevinTicket], policy: Literal["link", "merge"] = "link"
+    ) -> list[DevinTicket]:
+        """
+        Index a batch of tickets and resolve the near-duplicates among them.
+
+        With the "link" policy every ticket is kept and each duplicate records the ID of its
+        canonical ticket under metadata["duplicate_of"]. With the "merge" policy duplicates
+        of a ticket in the same batch are dropped; their acceptance criteria are folded into
+        the canonical ticket, and their IDs are listed under metadata["merged_tickets"].
+
+        Tickets returned by an earlier call may already have been dispatched, so they are
+        never changed. Under the "merge" policy, a duplicate of such a ticket is dropped if
+        the ticket already had all of its acceptance criteria, and linked otherwise.
+
+        Args:
+            tickets: The tickets to index, in dispatch order
+            policy: Whether to link or merge near-duplicates
+
+        Returns:
+            The tickets to dispatch
+        """
+        deduplicated = []
+        # Canonical tickets returned by this call, which can still be merged into.
+        batch: dict[str, DevinTicket] = {}
+
+        for ticket in tickets:
+            entry_key, canonical_key = self._add(ticket)
+            if canonical_key == entry_key:
+                batch[entry_key] = ticket
+                deduplicated.append(ticket)
+                continue
+
+            canonical_id = self._ticket_ids[canonical_key]
+            canonical = batch.get(canonical_key)
+            if policy == "merge" and canonical is None:
+                returned_criteria = self._returned_criteria.get(canonical_key)
+                if returned_criteria is not None and returned_criteria.issuperset(
+                    ticket.acceptance_criteria
+                ):
+                    logger.info(
+                        f"Dropped ticket {ticket.ticket_id} as a duplicate of {canonical_id}"
+                    )
+                    continue
+            if policy == "link" or canonical is None:
+                ticket.metadata = {**(ticket.metadata or {}), "duplicate_of": canonical_id}
+                deduplicated.append(ticket)
+                continue
+
+            for criterion in ticket.acceptance_criteria:
+                if criterion not in canonical.acceptance_criteria:
+                    canonical.acceptance_criteria.append(criterion)
+            merged = (canonical.metadata or {}).get("merged_tickets", [])
+            canonical.metadata = {
+                **(canonical.metadata or {}),
+                "merged_tickets": [*merged, ticket.ticket_id],
+            }
+
+        for canonical_key, canonical in batch.items():
+            if canonical_key in self._signatures:
+                self._returned_criteria[canonical_key] = frozenset(canonical.acceptance_criteria)
+
+        logger.info(f"Deduplicated {len(tickets)} tickets into {len(deduplicated)} ({policy})")
+        return deduplicated
+
+    def _evict_oldest_cluster(self) -> None:
+        # An entry's canonical entry is never newer than the entry, so the oldest entry is
+        # always canonical and evicting its cluster leaves no entry pointing at a removed one.
+        oldest_key = next(iter(self._signatures))
+        members = self._members.pop(oldest_key)
+        for entry_key in members:
+            signature = self._signatures.pop(entry_key)
+            for band, key in enumerate(self._band_keys(signature)):
+                bucket = self._buckets[band][key]
+                bucket.remove(entry_key)
+                if not bucket:
+                    del self._buckets[band][key]
+            ticket_id = self._ticket_ids.pop(entry_key)
+            entry_keys = self._entry_keys[ticket_id]
+            entry_keys.remove(entry_key)
+            if not entry_keys:
+                del self._entry_keys[ticket_id]
+            del self._canonical[entry_key]
+        self._returned_criteria.pop(oldest_key, None)
+        logger.info(f"Evicted {len(members)} tickets from the full dedup index")
+
+    def _find_entry(self, ticket_id: str, signature: tuple[int, ...]) -> str | None:
+        for entry_key in self._entry_keys.get(ticket_id, ()):
+            if self._signatures[entry_key] == signature:
+                return entry_key
+        return None
+
+    def _matches(
+        self, entry_key: str | None, signature: tuple[int, ...]
+    ) -> list[tuple[str, float]]:
+        candidates: set[str] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        if entry_key is not None:
+            candidates.discard(entry_key)
+
+        matches = []
+        for candidate_id in candidates:
+            similarity = _estimate_similarity(signature, self._signatures[candidate_id])
+            if similarity >= self.threshold:
+                matches.append((candidate_id, similarity))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        return [signature[band * self.rows : (band + 1) * self.rows] for band in range(self.bands)]
+
+    def _shingles(self, ticket: DevinTicket) -> set[str]:
+        text = " ".join([ticket.title, ticket.description, *ticket.acceptance_criteria])
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) <= self.shingle_size:
+            return {" ".join(tokens)} if tokens else set()
+        return {
+            " ".join(tokens[i : i + self.shingle_size])
+            for i in range(len(tokens) - self.shingle_size + 1)
+        }
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _estimate_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    return sum(1 for a, b in zip(left, right, strict=True) if a == b) / len(left)
@@ -0,0 +1,323 @@
+"""
+Ticket Queue for the AI Project Manager.
+
+This module defines the Ticket Queue, a durable SQLite-backed queue that lets any number
+of worker processes, on one or more hosts sharing the database file, lease Devin tickets,
+execute them and push their execution results back without an external broker.
+"""
+
+import dataclasses
+import json
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from backend.app.core.data_models import DevinTicket, ExecutionResult
+from backend.app.utils.logger import get_logger
+
+__all__ = ["TicketLease", "TicketQueue"]
+
+logger = get_logger(__name__)
+
+DEFAULT_QUEUE_PATH = Path(".aipm") / "ticket_queue.sqlite3"
+
+
+@dataclass
+class TicketLease:
+    """Lease granting a worker exclusive ownership of a queued ticket."""
+
+    ticket: DevinTicket
+    worker_id: str
+    token: str
+    expires_at: float
+    attempt: int
+
+
+class TicketQueue:
+    """
+    Durable queue of Devin tickets with leases and visibility timeouts.
+
+    A leased ticket is invisible to other workers until its lease expires, so tickets held
+    by crashed or stalled workers are picked up again after the visibility timeout. Leases
+    that have not been started yet can be stolen by idle workers, which rebalances batches
+    that were prefetched by busy workers. Every operation runs in its own immediate
+    transaction, so concurrent workers never lease the same ticket twice.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_QUEUE_PATH,
+        visibility_timeout: float = 300.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the Ticket Queue.
+
+        Args:
+            path: Path of the SQLite database file shared by producers and workers
+            visibility_timeout: Seconds a lease stays valid unless it is extended
+            max_attempts: Number of executions after which an expired ticket is failed
+                instead of being leased again
+            clock: Wall-clock time source shared by all workers
+        """
+        self.path = Path(path)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.clock = clock
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tickets ("
+            "ticket_id TEXT PRIMARY KEY, payload TEXT NOT NULL, state TEXT NOT NULL, "
+            "worker_id TEXT, lease_token TEXT, lease_expires_at REAL, "
+            "started INTEGER NOT NULL DEFAULT 0, attempts INTEGER NOT NULL DEFAULT 0, "
+            "enqueued_at REAL NOT NULL, result TEXT)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS tickets_state ON tickets (state, enqueued_at)"
+        )
+
+    def close(self) -> None:
+        """Close the connection to the queue database."""
+        self._connection.close()
+
+    def enqueue(self, tickets: Iterable[DevinTicket]) -> int:
+        """
+        Add tickets to the queue, ignoring tickets that were already enqueued.
+
+        Ticket IDs are short hashes, so a different ticket can reuse the ID of an enqueued
+        one. Rather than dropping it, the whole batch is rejected.
+
+        Args:
+            tickets: The tickets to enqueue, in dispatch order
+
+        Returns:
+            The number of newly enqueued tickets
+
+        Raises:
+            ValueError: If a ticket ID is already enqueued for a different ticket
+        """
+        now = self.clock()
+        rows = [
+            (ticket.ticket_id, json.dumps(dataclasses.asdict(ticket)), now + index * 1e-6)
+            for index, ticket in enumerate(tickets)
+        ]
+        added = 0
+        with self._transaction():
+            for ticket_id, payload, enqueued_at in rows:
+                cursor = self._connection.execute(
+                    "INSERT INTO tickets (ticket_id, payload, state, enqueued_at) "
+                    "VALUES (?, ?, 'queued', ?) ON CONFLICT (ticket_id) DO NOTHING",
+                    (ticket_id, payload, enqueued_at),
+                )
+                if cursor.rowcount == 1:
+                    added += 1
+                    continue
+                (existing,) = self._connection.execute(
+                    "SELECT payload FROM tickets WHERE ticket_id = ?", (ticket_id,)
+                ).fetchone()
+                if existing != payload:
+                    raise ValueError(
+                        f"Ticket ID {ticket_id} is already enqueued for a different ticket"
+                    )
+        logger.info(f"Enqueued {added} tickets")
+        return added
+
+    def lease(self, worker_id: str, batch_size: int = 1, steal: bool = True) -> list[TicketLease]:
+        """
+        Lease the oldest available tickets.
+
+        Queued tickets and tickets whose lease expired are leased first. If none are
+        available and steal is enabled, unstarted tickets leased by other workers are
+        stolen, newest first.
+
+        Args:
+            worker_id: The ID of the leasing worker
+            batch_size: The maximum number of tickets to lease
+            steal: Whether to steal unstarted tickets from other workers when idle
+
+        Returns:
+            The granted leases, oldest ticket first
+        """
+        now = self.clock()
+        with self._transaction():
+            self._fail_exhausted(now)
+            rows = self._connection.execute(
+                "SELECT ticket_id, payload, attempts FROM tickets "
+                "WHERE state = 'queued' OR (state = 'leased' AND lease_expires_at <= ?) "
+                "ORDER BY enqueued_at LIMIT ?",
+                (now, batch_size),
+            ).fetchall()
+            if not rows and steal:
+                rows = self._connection.execute(
+                    "SELECT ticket_id, payload, attempts FROM tickets "
+                    "WHERE state = 'leased' AND started = 0 AND worker_id != ? "
+                    "ORDER BY enqueued_at DESC LIMIT ?",
+                    (worker_id, batch_size),
+                ).fetchall()[::-1]
+                if rows:
+                    logger.info(f"Worker {worker_id} stole {len(rows)} tickets")
+
+            leases = []
+            for ticket_id, payload, attempts in rows:
+                lease = TicketLease(
+                    ticket=DevinTicket(**json.loads(payload)),
+                    worker_id=worker_id,
+                    token=uuid.uuid4().hex,
+                    expires_at=now + self.visibility_timeout,
+                    attempt=attempts + 1,
+                )
+                self._connection.execute(
+                    "UPDATE tickets SET state = 'leased', worker_id = ?, lease_token = ?, "
+                    "lease_expires_at = ?, started = 0 WHERE ticket_id = ?",
+                    (worker_id, lease.token, lease.expires_at, ticket_id),
+                )
+                leases.append(lease)
+        return leases
+
+    def start(self, lease: TicketLease) -> bool:
+        """
+        Mark a leased ticket as started and extend its lease.
+
+        A started ticket can no longer be stolen. Workers must call this immediately
+        before executing a ticket and skip the ticket if it returns False.
+
+        Args:
+            lease: The lease of the ticket to start
+
+        Returns:
+            True if the lease was still held, False if it expired or was stolen
+        """
+        lease.expires_at = self.clock() + self.visibility_timeout
+        with self._transaction():
+            cursor = self._connection.execute(
+                "UPDATE tickets SET started = 1, attempts = attempts + 1, lease_expires_at = ? "
+                "WHERE ticket_id = ? AND lease_token = ? AND state = 'leased'",
+                (lease.expires_at, lease.ticket.ticket_id, lease.token),
+            )
+        return cursor.rowcount == 1
+
+    def extend(self, lease: TicketLease) -> bool:
+        """
+        Extend a lease by the visibility timeout, for tickets that take long to execute.
+
+        Args:
+            lease: The lease to extend
+
+        Returns:
+            True if the lease was still held, False if it expired or was stolen
+        """
+        lease.expires_at = self.clock() + self.visibility_timeout
+        with self._transaction():
+            cursor = self._connection.execute(
+                "UPDATE tickets SET lease_expires_at = ? "
+                "WHERE ticket_id = ? AND lease_token = ? AND state = 'leased'",
+                (lease.expires_at, lease.ticket.ticket_id, lease.token),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, lease: TicketLease, result: ExecutionResult) -> bool:
+        """
+        Record the execution result of a leased ticket.
+
+        Args:
+            lease: The lease of the executed ticket
+            result: The execution result
+
+        Returns:
+            True if the result was recorded, False if the lease was lost in the meantime
+        """
+        with self._transaction():
+            cursor = self._connection.execute(
+                "UPDATE tickets SET state = 'done', result = ?, lease_token = NULL "
+                "WHERE ticket_id = ? AND lease_token = ? AND state = 'leased'",
+                (json.dumps(dataclasses.asdict(result)), lease.ticket.ticket_id, lease.token),
+            )
+        if cursor.rowcount != 1:
+            logger.warning(f"Discarding result of {lease.ticket.ticket_id}: lease was lost")
+            return False
+        return True
+
+    def release(self, lease: TicketLease) -> bool:
+        """
+        Return a leased ticket to the queue without executing it.
+
+        Args:
+            lease: The lease to release
+
+        Returns:
+            True if the lease was still held, False if it expired or was stolen
+        """
+        with self._transaction():
+            cursor = self._connection.execute(
+                "UPDATE tickets SET state = 'queued', worker_id = NULL, lease_token = NULL, "
+                "started = 0 WHERE ticket_id = ? AND lease_token = ? AND state = 'leased'",
+                (lease.ticket.ticket_id, lease.token),
+            )
+        return cursor.rowcount == 1
+
+    def results(self, ticket_ids: Iterable[str] | None = None) -> dict[str, ExecutionResult]:
+        """
+        Get the execution results recorded so far.
+
+        Args:
+            ticket_ids: Optional ticket IDs to restrict the results to
+
+        Returns:
+            A mapping of ticket ID to execution result; failed tickets are included with a
+            "failed" status
+        """
+        rows = self._connection.execute(
+            "SELECT ticket_id, state, result FROM tickets WHERE state IN ('done', 'failed')"
+        ).fetchall()
+        wanted = None if ticket_ids is None else set(ticket_ids)
+        results = {}
+        for ticket_id, state, result in rows:
+            if wanted is not None and ticket_id not in wanted:
+                continue
+            if state == "done":
+                results[ticket_id] = ExecutionResult(**json.loads(result))
+            else:
+                results[ticket_id] = ExecutionResult(
+                    ticket_id=ticket_id,
+                    status="failed",
+                    output=f"Lease expired after {self.max_attempts} attempts",
+                    execution_time="unknown",
+                )
+        return results
+
+    def counts(self) -> dict[str, int]:
+        """
+        Count tickets by state.
+
+        Returns:
+            A mapping of state ("queued", "leased", "done" or "failed") to ticket count
+        """
+        rows = self._connection.execute(
+            "SELECT state, COUNT(*) FROM tickets GROUP BY state"
+        ).fetchall()
+        return {"queued": 0, "leased": 0, "done": 0, "failed": 0, **dict(rows)}
+
+    def _fail_exhausted(self, now: float) -> None:
+        self._connection.execute(
+            "UPDATE tickets SET state = 'failed', lease_token = NULL "
+            "WHERE state = 'leased' AND lease_expires_at <= ? AND attempts >= ?",
+            (now, self.max_attempts),
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
@@ -0,0 +1,118 @@
+"""
+Ticket Worker for the AI Project Manager.
+
+This module defines the Ticket Worker, which pulls Devin tickets from a Ticket Queue,
+executes them and pushes their execution results back. Any number of workers can share
+a queue to scale execution across processes and hosts.
+"""
+
+import os
+import socket
+import time
+from collections.abc import Callable
+
+from backend.app.core.data_models import DevinTicket, ExecutionResult
+from backend.app.tools.ticket_queue import TicketLease, TicketQueue
+from backend.app.utils.logger import get_logger
+
+__all__ = ["TicketWorker"]
+
+logger = get_logger(__name__)
+
+
+class TicketWorker:
+    """
+    Worker that executes tickets leased from a Ticket Queue.
+
+    The worker leases a batch of tickets, starts each one just before executing it and
+    records the result under its lease. Tickets of the batch that another worker stole in
+    the meantime are skipped. Failed executions are returned to the queue until the
+    ticket runs out of attempts, after which a failed result is recorded.
+    """
+
+    def __init__(
+        self,
+        queue: TicketQueue,
+        execute: Callable[[DevinTicket], ExecutionResult] | None = None,
+        worker_id: str | None = None,
+        batch_size: int = 1,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        Initialize the Ticket Worker.
+
+        Args:
+            queue: The queue to pull tickets from
+            execute: Callable that executes a ticket; defaults to the Execution Coordinator
+            worker_id: Unique ID of the worker; defaults to the host name and process ID
+            batch_size: Number of tickets to lease at a time
+            poll_interval: Seconds to wait before polling an empty queue again
+        """
+        if execute is None:
+            from backend.app.agents.execution_coordinator import ExecutionCoordinatorAgent
+
+            execute = ExecutionCoordinatorAgent().execute_ticket
+
+        self.queue = queue
+        self.execute = execute
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        logger.info(f"Initializing Ticket Worker {self.worker_id}")
+
+    def run_once(self) -> int:
+        """
+        Lease and execute one batch of tickets.
+
+        Returns:
+            The number of tickets whose result was recorded
+        """
+        processed = 0
+        for lease in self.queue.lease(self.worker_id, self.batch_size):
+            if not self.queue.start(lease):
+                logger.info(f"Skipping {lease.ticket.ticket_id}: lease was stolen or expired")
+                continue
+            if self._execute(lease):
+                processed += 1
+        return processed
+
+    def run(self, exit_when_empty: bool = False, max_tickets: int | None = None) -> int:
+        """
+        Execute tickets until stopped.
+
+        Args:
+            exit_when_empty: Whether to return once no ticket can be leased instead of
+                polling the queue again
+            max_tickets: Optional number of recorded results after which to return
+
+        Returns:
+            The number of tickets whose result was recorded
+        """
+        logger.info(f"Ticket Worker {self.worker_id} started")
+        processed = 0
+        while max_tickets is None or processed < max_tickets:
+            batch = self.run_once()
+            processed += batch
+            if batch == 0 and not self.queue.counts()["queued"]:
+                if exit_when_empty:
+                    break
+                time.sleep(self.poll_interval)
+        logger.info(f"Ticket Worker {self.worker_id} stopped after {processed} tickets")
+        return processed
+
+    def _execute(self, lease: TicketLease) -> bool:
+        ticket = lease.ticket
+        try:
+            result = self.execute(ticket)
+        except Exception as e:
+            logger.error(f"Error executing ticket {ticket.ticket_id}: {str(e)}")
+            if lease.attempt < self.queue.max_attempts:
+                self.queue.release(lease)
+                return False
+            result = ExecutionResult(
+                ticket_id=ticket.ticket_id,
+                status="failed",
+                output=str(e),
+                execution_time="unknown",
+            )
+        return self.queue.complete(lease, result)
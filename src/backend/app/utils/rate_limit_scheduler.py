@@ -0,0 +1,220 @@
+"""
+Rate Limit Scheduler for the AI Project Manager.
+
+This module defines the process-wide Rate Limit Scheduler, which admits model calls
+according to per-model request and token budgets so that concurrently running agents
+share provider rate limits instead of bursting into them.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from backend.app.utils.logger import get_logger
+
+__all__ = [
+    "ModelRateLimit",
+    "Priority",
+    "RateLimitScheduler",
+    "Reservation",
+    "get_rate_limit_scheduler",
+]
+
+logger = get_logger(__name__)
+
+
+class Priority(IntEnum):
+    """Admission priority of a model call; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    PIPELINE = 1
+    BACKGROUND = 2
+
+
+@dataclass
+class ModelRateLimit:
+    """Request and token budget of a model."""
+
+    requests_per_minute: float
+    tokens_per_minute: float
+    burst_seconds: float = 10.0
+
+
+@dataclass
+class _TokenBucket:
+    rate: float
+    capacity: float
+    level: float
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self, amount: float) -> float:
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+
+@dataclass
+class _ModelState:
+    requests: _TokenBucket
+    tokens: _TokenBucket
+    waiters: list[tuple[int, int, float, "asyncio.Future[None]"]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    timer_loop: asyncio.AbstractEventLoop | None = None
+
+
+class Reservation:
+    """Admission of a single model call, settled with its actual token usage."""
+
+    def __init__(self, scheduler: "RateLimitScheduler", model: str, estimated_tokens: float):
+        self.scheduler = scheduler
+        self.model = model
+        self.estimated_tokens = estimated_tokens
+        self.settled = False
+
+    def settle(self, actual_tokens: float) -> None:
+        """
+        Correct the token budget with the tokens the call actually used.
+
+        Args:
+            actual_tokens: The total tokens reported by the provider
+        """
+        if self.settled:
+            return
+        self.settled = True
+        self.scheduler._adjust(self.model, self.estimated_tokens - actual_tokens)
+
+
+class RateLimitScheduler:
+    """
+    Token-bucket scheduler for model calls.
+
+    Each configured model has a request bucket and a token bucket that refill
+    continuously at the model's per-minute limits and hold at most burst_seconds worth
+    of budget, which smooths bursts. Calls wait in a priority queue per model and the
+    highest-priority, oldest call is admitted as soon as both buckets can cover it.
+    Calls to models without a configured limit are admitted immediately.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the Rate Limit Scheduler."""
+        self._limits: dict[str, ModelRateLimit] = {}
+        self._states: dict[str, _ModelState] = {}
+        self._sequence = itertools.count()
+
+    def configure(self, model: str, limit: ModelRateLimit) -> None:
+        """
+        Set the rate limit of a model, resetting its budget.
+
+        Args:
+            model: The model name
+            limit: The request and token budget of the model
+
+        Raises:
+            ValueError: If a limit or the burst window is not positive
+        """
+        if min(limit.requests_per_minute, limit.tokens_per_minute, limit.burst_seconds) <= 0:
+            raise ValueError(
+                f"Rate limits of {model} must be positive; leave the model unconfigured to "
+                "admit its calls without limit"
+            )
+        logger.info(
+            f"Rate limiting {model} to {limit.requests_per_minute} RPM and "
+            f"{limit.tokens_per_minute} TPM"
+        )
+        self._limits[model] = limit
+        self._states.pop(model, None)
+
+    async def acquire(
+        self, model: str, estimated_tokens: float, priority: Priority = Priority.PIPELINE
+    ) -> Reservation:
+        """
+        Wait until a model call fits in the model's budget.
+
+        Args:
+            model: The model name
+            estimated_tokens: The estimated total tokens of the call
+            priority: The admission priority of the call
+
+        Returns:
+            A reservation to settle with the actual token usage once the call completes
+        """
+        state = self._state(model)
+        if state is not None:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                state.waiters, (int(priority), next(self._sequence), estimated_tokens, future)
+            )
+            if state.timer is None or state.timer_loop is not asyncio.get_running_loop():
+                self._dispatch(state)
+            await future
+        return Reservation(self, model, estimated_tokens)
+
+    def _state(self, model: str) -> _ModelState | None:
+        limit = self._limits.get(model)
+        if limit is None:
+            return None
+        state = self._states.get(model)
+        if state is None:
+            request_rate = limit.requests_per_minute / 60
+            token_rate = limit.tokens_per_minute / 60
+            request_capacity = max(1.0, request_rate * limit.burst_seconds)
+            token_capacity = token_rate * limit.burst_seconds
+            state = _ModelState(
+                requests=_TokenBucket(request_rate, request_capacity, request_capacity),
+                tokens=_TokenBucket(token_rate, token_capacity, token_capacity),
+            )
+            self._states[model] = state
+        return state
+
+    def _dispatch(self, state: _ModelState) -> None:
+        if state.timer is not None:
+            state.timer.cancel()
+        state.timer = None
+        state.timer_loop = None
+
+        now = time.monotonic()
+        state.requests.refill(now)
+        state.tokens.refill(now)
+
+        while state.waiters:
+            _, _, tokens, future = state.waiters[0]
+            if future.done():
+                heapq.heappop(state.waiters)
+                continue
+
+            delay = max(state.requests.delay(1), state.tokens.delay(tokens))
+            if delay > 0:
+                loop = future.get_loop()
+                state.timer = loop.call_later(delay, self._dispatch, state)
+                state.timer_loop = loop
+                return
+
+            heapq.heappop(state.waiters)
+            state.requests.level -= 1
+            state.tokens.level -= min(tokens, state.tokens.capacity)
+            future.set_result(None)
+
+    def _adjust(self, model: str, tokens: float) -> None:
+        state = self._states.get(model)
+        if state is None:
+            return
+        state.tokens.refill(time.monotonic())
+        state.tokens.level = min(state.tokens.capacity, state.tokens.level + tokens)
+
+
+_scheduler = RateLimitScheduler()
+
+
+def get_rate_limit_scheduler() -> RateLimitScheduler:
+    """
+    Get the process-wide Rate Limit Scheduler shared by all agents.
+
+    Returns:
+        The process-wide scheduler
+    """
+    return _scheduler
@@ -0,0 +1,192 @@
+"""
+Rate Limited Model for the AI Project Manager.
+
+This module defines the Rate Limited Model and Model Provider, which route the model
+calls of the agents through the process-wide Rate Limit Scheduler.
+"""
+
+from collections.abc import AsyncIterator
+
+from agents import Model, ModelProvider, ModelSettings, ModelTracing, OpenAIProvider, Tool
+from agents.agent_output import AgentOutputSchemaBase
+from agents.handoffs import Handoff
+from agents.items import ModelResponse, TResponseInputItem, TResponseStreamEvent
+
+from backend.app.utils.rate_limit_scheduler import (
+    Priority,
+    RateLimitScheduler,
+    get_rate_limit_scheduler,
+)
+
+__all__ = ["RateLimitedModel", "RateLimitedModelProvider", "estimate_tokens"]
+
+DEFAULT_OUTPUT_TOKENS = 1024
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(
+    system_instructions: str | None,
+    input: str | list[TResponseInputItem],
+    model_settings: ModelSettings,
+) -> int:
+    """
+    Estimate the total tokens of a model call before it is made.
+
+    Args:
+        system_instructions: The system instructions of the call
+        input: The input items of the call
+        model_settings: The model settings of the call
+
+    Returns:
+        The estimated prompt tokens plus the maximum output tokens
+    """
+    prompt_chars = len(system_instructions or "") + len(str(input))
+    output_tokens = model_settings.max_tokens or DEFAULT_OUTPUT_TOKENS
+    return prompt_chars // CHARS_PER_TOKEN + output_tokens
+
+
+class RateLimitedModel(Model):
+    """
+    Model that waits for the Rate Limit Scheduler before every call.
+
+    Each call reserves its estimated tokens up front and settles the reservation with
+    the usage reported by the provider, so the scheduler's token budget tracks actual
+    consumption. Calls that fail are refunded.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        model_name: str,
+        priority: Priority = Priority.PIPELINE,
+        scheduler: RateLimitScheduler | None = None,
+    ) -> None:
+        """
+        Initialize the Rate Limited Model.
+
+        Args:
+            model: The model to wrap
+            model_name: The model name the rate limits are configured under
+            priority: The admission priority of the model's calls
+            scheduler: The scheduler to use; defaults to the process-wide scheduler
+        """
+        self.model = model
+        self.model_name = model_name
+        self.priority = priority
+        self.scheduler = scheduler or get_rate_limit_scheduler()
+
+    async def get_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> ModelResponse:
+        reservation = await self.scheduler.acquire(
+            self.model_name,
+            estimate_tokens(system_instructions, input, model_settings),
+            self.priority,
+        )
+        try:
+            response = await self.model.get_response(
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                tracing,
+                previous_response_id=previous_response_id,
+            )
+        except BaseException:
+            # A failed call reports no usage; refund the reservation rather than leave it
+            # charging the budget for tokens that were most likely never generated.
+            reservation.settle(0)
+            raise
+        reservation.settle(response.usage.total_tokens)
+        return response
+
+    async def stream_response(
+        self,
+        system_instructions: str | None,
+        input: str | list[TResponseInputItem],
+        model_settings: ModelSettings,
+        tools: list[Tool],
+        output_schema: AgentOutputSchemaBase | None,
+        handoffs: list[Handoff],
+        tracing: ModelTracing,
+        *,
+        previous_response_id: str | None,
+    ) -> AsyncIterator[TResponseStreamEvent]:
+        reservation = await self.scheduler.acquire(
+            self.model_name,
+            estimate_tokens(system_instructions, input, model_settings),
+            self.priority,
+        )
+        completed = False
+        try:
+            async for event in self.model.stream_response(
+                system_instructions,
+                input,
+                model_settings,
+                tools,
+                output_schema,
+                handoffs,
+                tracing,
+                previous_response_id=previous_response_id,
+            ):
+                if event.type == "response.completed":
+                    completed = True
+                    if event.response.usage:
+                        reservation.settle(event.response.usage.total_tokens)
+                yield event
+        finally:
+            # A stream that failed or was abandoned before completing is refunded like a failed
+            # call; a completed stream without usage keeps its estimate.
+            if not completed:
+                reservation.settle(0)
+
+
+class RateLimitedModelProvider(ModelProvider):
+    """
+    Model provider whose models are admitted by the Rate Limit Scheduler.
+
+    Pass this provider as the model_provider of a RunConfig so that all model calls of
+    the run share the process-wide request and token budgets at the given priority.
+    """
+
+    def __init__(
+        self,
+        priority: Priority = Priority.PIPELINE,
+        provider: ModelProvider | None = None,
+        default_model: str = "gpt-4o",
+    ) -> None:
+        """
+        Initialize the Rate Limited Model Provider.
+
+        Args:
+            priority: The admission priority of the provided models
+            provider: The provider to wrap; defaults to the OpenAI provider
+            default_model: The model name used when an agent does not set one
+        """
+        self.priority = priority
+        self.provider = provider or OpenAIProvider()
+        self.default_model = default_model
+
+    def get_model(self, model_name: str | None) -> Model:
+        """
+        Get a rate-limited model by name.
+
+        Args:
+            model_name: The name of the model, or None for the default model
+
+        Returns:
+            The model wrapped in a Rate Limited Model
+        """
+        name = model_name or self.default_model
+        return RateLimitedModel(self.provider.get_model(name), name, self.priority)
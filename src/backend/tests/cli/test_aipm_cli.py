@@ -98,3 +98,16 @@ def test_aipm_process_initiative_error_handling(mock_process_initiative) -> None
 
     assert result.exit_code == 1
     assert "Error: Test error" in result.stdout
+
+
+@patch.object(ProjectOrchestrator, "process_initiative")
+def test_aipm_process_initiative_resume(mock_process_initiative) -> None:
+    """Test that the command resumes the given run ID."""
+    mock_process_initiative.return_value = []
+
+    result = runner.invoke(app, ["aipm-process-initiative", "Test goal", "--resume", "run-123"])
+
+    assert result.exit_code == 0
+
+    _, kwargs = mock_process_initiative.call_args
+    assert kwargs["run_id"] == "run-123"
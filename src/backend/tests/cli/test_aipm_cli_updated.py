@@ -2,13 +2,16 @@
 Unit tests for the AI Project Manager CLI commands.
 """
 
+from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
 from backend.app.cli import app
 from backend.app.core.data_models import DevinTicket, InitiativeGoal
 from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
+from backend.app.tools.ticket_queue import TicketQueue
 
 runner = CliRunner()
 
@@ -98,3 +101,49 @@ def test_aipm_process_initiative_error_handling(mock_process_initiative) -> None
 
     assert result.exit_code == 1
     assert "Error: Test error" in result.stdout
+
+
+def test_aipm_worker_drains_queue(tmp_path: Path) -> None:
+    """Test that the worker command executes the queued tickets and exits when drained."""
+    queue_path = tmp_path / "queue.sqlite3"
+    queue = TicketQueue(queue_path)
+    queue.enqueue(
+        [
+            DevinTicket(
+                ticket_id=f"ticket-{i}",
+                epic_id="epic-456",
+                title=f"Test Ticket {i}",
+                description="This is a test ticket",
+                input_files=["file1.py"],
+                output_expectation="Expected output",
+                acceptance_criteria=["Criterion 1"],
+                priority=1,
+                status="ready",
+            )
+            for i in range(3)
+        ]
+    )
+
+    result = runner.invoke(
+        app, ["aipm-worker", "--queue", str(queue_path), "--exit-when-empty", "--batch-size", "2"]
+    )
+
+    assert result.exit_code == 0
+    assert "Executed 3 tickets" in result.stdout
+    assert queue.counts()["done"] == 3
+    queue.close()
+
+
+def test_aipm_process_initiative_checkpoints_only_when_requested(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the checkpoint database is only written with --checkpoint or --resume."""
+    monkeypatch.chdir(tmp_path)
+
+    assert runner.invoke(app, ["aipm-process-initiative", "Test goal"]).exit_code == 0
+    assert not (tmp_path / ".aipm").exists()
+
+    assert (
+        runner.invoke(app, ["aipm-process-initiative", "Test goal", "--checkpoint"]).exit_code == 0
+    )
+    assert (tmp_path / ".aipm" / "checkpoints.sqlite3").exists()
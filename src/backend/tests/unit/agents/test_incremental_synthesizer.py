@@ -0,0 +1,110 @@
+"""
+Unit tests for the Incremental Feedback Synthesizer.
+"""
+
+from pathlib import Path
+
+from backend.app.agents.feedback_synthesizer import FeedbackSynthesizerAgent
+from backend.app.agents.incremental_synthesizer import IncrementalFeedbackSynthesizer
+from backend.app.core.data_models import FeedbackContent, StructuredAnalysisReport
+
+
+def make_report(index: int, suggestions: list[str]) -> StructuredAnalysisReport:
+    return StructuredAnalysisReport(
+        report_id=f"report-{index}",
+        ticket_id=f"ticket-{index}",
+        success_factors=["Clear acceptance criteria"],
+        improvement_suggestions=suggestions,
+    )
+
+
+def make_feedback(index: int, sentiment: str, content: str) -> FeedbackContent:
+    return FeedbackContent(
+        feedback_id=f"feedback-{index}",
+        ticket_id=f"ticket-{index}",
+        content=content,
+        source="user",
+        sentiment=sentiment,
+    )
+
+
+def test_proposal_tracks_most_frequent_suggestions() -> None:
+    """Test that implementation steps follow the suggestion counts as they change."""
+    synthesizer = IncrementalFeedbackSynthesizer()
+    synthesizer.add_report(make_report(1, ["Add unit tests", "Update the README"]))
+    synthesizer.add_report(make_report(2, ["Pin tool versions", "Update the README"]))
+    synthesizer.add_report(make_report(3, ["Reduce build latency", "Pin tool versions"]))
+    synthesizer.add_report(make_report(4, ["Reduce build latency", "Reduce build latency"]))
+
+    proposal = synthesizer.proposal()
+
+    assert proposal.implementation_steps == [
+        "Address: Reduce build latency",
+        "Address: Update the README",
+        "Address: Pin tool versions",
+    ]
+    assert proposal.impact_areas[0] == "Performance"
+    assert proposal.metadata is not None
+    assert proposal.metadata["top_success_factors"] == ["Clear acceptance criteria"]
+
+
+def test_negative_feedback_scores_impact_areas() -> None:
+    """Test that sentiments are tallied and negative feedback raises impact scores."""
+    synthesizer = IncrementalFeedbackSynthesizer()
+    synthesizer.add_feedback(make_feedback(1, "Negative", "The API integration broke"))
+    synthesizer.add_feedback(make_feedback(2, "positive", "Great work"))
+
+    proposal = synthesizer.proposal()
+
+    assert proposal.impact_areas == ["Tool Integration"]
+    assert proposal.metadata is not None
+    assert proposal.metadata["sentiments"] == {"negative": 1, "positive": 1}
+    assert proposal.description == "Learning proposal based on 0 reports and 2 feedback items"
+
+
+def test_state_survives_restart(tmp_path: Path) -> None:
+    """Test that persisted aggregates are reloaded by a new agent."""
+    state_path = tmp_path / "feedback.json"
+    agent = FeedbackSynthesizerAgent(state_path=state_path, synthesizer_id="project-1")
+    agent.record_feedback(
+        reports=[make_report(1, ["Add unit tests"])],
+        feedback=[make_feedback(1, "negative", "Tests are flaky")],
+    )
+
+    restarted = FeedbackSynthesizerAgent(state_path=state_path)
+    restarted.record_feedback(reports=[make_report(2, ["Write docs", "Write docs"])])
+
+    proposal = restarted.current_proposal()
+    assert proposal.proposal_id == "proposal-project-1-3"
+    assert proposal.implementation_steps == ["Address: Write docs", "Address: Add unit tests"]
+    assert proposal.impact_areas == ["Documentation", "Testing"]
+
+
+def test_journal_is_replayed_and_compacted(tmp_path: Path) -> None:
+    """Test that recorded inputs are journaled, replayed on restart and compacted."""
+    state_path = tmp_path / "feedback.json"
+    synthesizer = IncrementalFeedbackSynthesizer(state_path, compact_every=3)
+    synthesizer.record(reports=[make_report(1, ["Add unit tests"])])
+    snapshot = state_path.read_text()
+
+    synthesizer.record(feedback=[make_feedback(2, "negative", "Docs are missing")])
+    synthesizer.record(reports=[make_report(3, ["Add unit tests"])])
+
+    # Appending does not rewrite the snapshot.
+    assert state_path.read_text() == snapshot
+    restarted = IncrementalFeedbackSynthesizer(state_path, compact_every=3)
+    assert restarted.synthesizer_id == synthesizer.synthesizer_id
+    assert restarted.proposal() == synthesizer.proposal()
+
+    synthesizer.record(feedback=[make_feedback(4, "positive", "Nice")] * 2)
+
+    assert not synthesizer.journal_path.exists()
+    assert IncrementalFeedbackSynthesizer(state_path).version == 5
+
+
+def test_proposal_ids_differ_between_synthesizers() -> None:
+    """Test that proposals of different synthesizers at the same version have distinct IDs."""
+    first = IncrementalFeedbackSynthesizer()
+    second = IncrementalFeedbackSynthesizer()
+
+    assert first.proposal().proposal_id != second.proposal().proposal_id
@@ -0,0 +1,99 @@
+"""
+Unit tests for the Plan Stream Parser.
+"""
+
+import json
+from collections.abc import Iterator
+
+from backend.app.agents.plan_stream_parser import PlanStreamParser
+from backend.app.agents.planner_tool import PlannerTool
+from backend.app.core.data_models import InitiativeGoal, WorkPackage
+from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
+
+PLAN = {
+    "title": 'Plan with "quotes" and {braces}',
+    "metadata": {"work_packages": [{"title": "Not a work package"}]},
+    "work_packages": [
+        {
+            "package_id": "wp-1",
+            "title": "Setup [infra] {base}",
+            "description": 'Escaped \\" quote',
+            "tasks": ["Provision database", "Configure CI"],
+            "estimated_complexity": 2,
+            "estimated_time": "1 day",
+            "unknown_field": "ignored",
+        },
+        {
+            "package_id": "wp-2",
+            "plan_id": "plan-explicit",
+            "title": "Implementation",
+            "description": "Core work",
+            "tasks": ["Build API"],
+            "estimated_complexity": 3,
+            "estimated_time": "2 days",
+        },
+    ],
+    "estimated_time": "3 days",
+}
+
+
+def chunked(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_parse_yields_work_packages_for_any_chunking() -> None:
+    """Test that work packages are parsed regardless of where chunks are split."""
+    text = json.dumps(PLAN, indent=2)
+
+    for size in (1, 3, 17, len(text)):
+        parser = PlanStreamParser("plan-default", WorkPackage)
+        packages = list(parser.parse(chunked(text, size)))
+
+        assert [wp.package_id for wp in packages] == ["wp-1", "wp-2"]
+        assert packages[0].title == "Setup [infra] {base}"
+        assert packages[0].description == 'Escaped \\" quote'
+        assert packages[0].plan_id == "plan-default"
+        assert packages[1].plan_id == "plan-explicit"
+
+
+def test_feed_emits_package_as_soon_as_it_closes() -> None:
+    """Test that a work package is emitted by the chunk that completes it."""
+    text = json.dumps(PLAN)
+    first_end = text.index('"package_id": "wp-2"')
+    parser = PlanStreamParser("plan-default", WorkPackage)
+
+    first = parser.feed(text[:first_end])
+    rest = parser.feed(text[first_end:])
+
+    assert [wp.package_id for wp in first] == ["wp-1"]
+    assert [wp.package_id for wp in rest] == ["wp-2"]
+
+
+def test_planner_tool_iter_work_packages_matches_plan() -> None:
+    """Test that iterating work packages yields the same packages as the full plan."""
+    tool = PlannerTool()
+    goal = InitiativeGoal(id="goal-123", title="Test Goal", description="This is a test goal")
+
+    assert list(tool.iter_work_packages(goal)) == tool.plan_initiative(goal).work_packages
+
+
+def test_orchestrator_details_work_packages_while_plan_streams() -> None:
+    """Test that the first tickets are produced before the plan stream is finished."""
+    text = json.dumps(PLAN)
+    split = text.index('"package_id": "wp-2"')
+    consumed: list[str] = []
+
+    def plan_stream() -> Iterator[str]:
+        for chunk in (text[:split], text[split:]):
+            consumed.append(chunk)
+            yield chunk
+
+    orchestrator = ProjectOrchestrator()
+    goal = InitiativeGoal(id="goal-123", title="Test Goal", description="This is a test goal")
+    tickets = orchestrator.iter_initiative_tickets(goal, plan_stream())
+
+    first_ticket = next(tickets)
+
+    assert first_ticket.epic_id == "wp-1"
+    assert len(consumed) == 1
+    assert [ticket.epic_id for ticket in tickets] == ["wp-1", "wp-2"]
@@ -0,0 +1,119 @@
+"""
+Unit tests for the Checkpoint Store.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from backend.app.core.data_models import DevinTicket
+from backend.app.core.orchestration.checkpoint_store import CheckpointStore
+from backend.app.custom_agents.ai_project_manager.core.data_models import (
+    InitiativeGoal,
+    WorkPackage,
+)
+from backend.app.custom_agents.ai_project_manager.core.master_orchestrator import (
+    MasterOrchestratorAgent,
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CheckpointStore:
+    return CheckpointStore(tmp_path / "checkpoints.sqlite3")
+
+
+@pytest.fixture
+def goal() -> InitiativeGoal:
+    return InitiativeGoal(id="goal-123", title="Test Initiative", description="Test initiative")
+
+
+def test_save_and_load(store: CheckpointStore) -> None:
+    """Test that saved payloads can be loaded back per run and unit."""
+    store.save("run-1", "plan", 2)
+    store.save("run-1", "tickets:0", [{"ticket_id": "ticket-1"}])
+    store.save("run-2", "plan", 5)
+
+    assert store.load("run-1", "plan") == 2
+    assert store.load("run-1", "tickets:0") == [{"ticket_id": "ticket-1"}]
+    assert store.load("run-1", "tickets:1") is None
+    assert store.units("run-1") == ["plan", "tickets:0"]
+
+
+def test_checkpoints_survive_new_store_instance(store: CheckpointStore) -> None:
+    """Test that checkpoints are durable across store instances."""
+    store.save("run-1", "plan", 2)
+
+    assert CheckpointStore(store.path).load("run-1", "plan") == 2
+
+
+def test_new_run_ids_are_unique(store: CheckpointStore) -> None:
+    """Test that generated run IDs do not repeat."""
+    assert store.new_run_id() != store.new_run_id()
+
+
+def test_resume_skips_completed_work_packages(store: CheckpointStore, goal: InitiativeGoal) -> None:
+    """Test that a resumed run only details the work packages that did not complete."""
+    agent = MasterOrchestratorAgent(checkpoint_store=store)
+    detail = agent.detailer_tool.detail_work_package
+    outcomes = [detail, RuntimeError("crash")]
+
+    def crash_on_second_package(work_package: WorkPackage) -> list[DevinTicket]:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome(work_package)
+
+    with (
+        patch.object(agent.detailer_tool, "detail_work_package", crash_on_second_package),
+        pytest.raises(RuntimeError),
+    ):
+        agent.process_initiative(goal, run_id="run-1")
+
+    assert store.units("run-1") == [
+        "initiative",
+        "work_package:0",
+        "tickets:0",
+        "work_package:1",
+    ]
+
+    resumed = MasterOrchestratorAgent(checkpoint_store=store)
+    with patch.object(
+        resumed.detailer_tool,
+        "detail_work_package",
+        wraps=resumed.detailer_tool.detail_work_package,
+    ) as mock_detail:
+        tickets = resumed.process_initiative(goal, run_id="run-1")
+
+    assert mock_detail.call_count == 1
+    assert len(tickets) == 4
+    assert store.load("run-1", "plan") == 2
+
+
+def test_resume_of_completed_run_replays_everything(
+    store: CheckpointStore, goal: InitiativeGoal
+) -> None:
+    """Test that resuming a completed run does not call the planner or the detailer."""
+    first = MasterOrchestratorAgent(checkpoint_store=store).process_initiative(goal, run_id="run-1")
+
+    resumed = MasterOrchestratorAgent(checkpoint_store=store)
+    with (
+        patch.object(resumed.planner_tool, "iter_work_packages") as mock_plan,
+        patch.object(resumed.detailer_tool, "detail_work_package") as mock_detail,
+    ):
+        tickets = resumed.process_initiative(goal, run_id="run-1")
+
+    mock_plan.assert_not_called()
+    mock_detail.assert_not_called()
+    assert tickets == first
+
+
+def test_resume_with_different_initiative_is_refused(
+    store: CheckpointStore, goal: InitiativeGoal
+) -> None:
+    """Test that a run ID cannot be resumed with another initiative's description."""
+    MasterOrchestratorAgent(checkpoint_store=store).process_initiative(goal, run_id="run-1")
+    other = InitiativeGoal(id="goal-456", title="Other Initiative", description="Other initiative")
+
+    with pytest.raises(ValueError, match="different initiative"):
+        MasterOrchestratorAgent(checkpoint_store=store).process_initiative(other, run_id="run-1")
@@ -0,0 +1,147 @@
+"""
+Unit tests for webhook-driven Devin session completion.
+"""
+
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from backend.app.agents.execution_coordinator import ExecutionCoordinatorAgent
+from backend.app.core.data_models import DevinTicket, ExecutionResult
+from backend.app.main import app
+from backend.app.tools.session_completion import LocalWebhookSender, SessionCompletionRegistry
+
+
+def make_ticket() -> DevinTicket:
+    return DevinTicket(
+        ticket_id="ticket-1",
+        epic_id="epic-1",
+        title="Test Ticket",
+        description="This is a test ticket",
+        input_files=["file1.py"],
+        output_expectation="Expected output",
+        acceptance_criteria=["Criterion 1"],
+        priority=1,
+        status="ready",
+    )
+
+
+def make_result(status: str = "completed") -> ExecutionResult:
+    return ExecutionResult(
+        ticket_id="ticket-1",
+        status=status,
+        output="Webhook output",
+        execution_time="5 minutes",
+    )
+
+
+@pytest.fixture
+def sender() -> LocalWebhookSender:
+    return LocalWebhookSender(base_url="http://test", transport=httpx.ASGITransport(app=app))
+
+
+@pytest.fixture
+def coordinator(monkeypatch: pytest.MonkeyPatch) -> ExecutionCoordinatorAgent:
+    coordinator = ExecutionCoordinatorAgent()
+    session_id = f"session-{uuid.uuid4().hex}"
+    monkeypatch.setattr(
+        coordinator.devin_session_manager, "create_session", lambda ticket: session_id
+    )
+    return coordinator
+
+
+async def test_result_recorded_before_wait_is_returned() -> None:
+    """Test that a webhook delivered before anyone waits is not lost."""
+    registry = SessionCompletionRegistry()
+    assert registry.record("session-1", make_result())
+    assert not registry.record("session-1", make_result())
+
+    assert await registry.wait("session-1", timeout=0.01) == make_result()
+
+
+async def test_forgotten_session_ignores_redelivered_webhook() -> None:
+    """Test that a webhook redelivered after the result was consumed is not stored again."""
+    registry = SessionCompletionRegistry()
+    registry.record("session-1", make_result())
+    registry.forget("session-1")
+
+    assert not registry.record("session-1", make_result())
+    assert registry.get("session-1") is None
+
+
+def test_uncollected_results_are_bounded() -> None:
+    """Test that results nobody waits for expire and are capped in number."""
+    registry = SessionCompletionRegistry(ttl=60, max_sessions=2)
+    for i in range(3):
+        registry.record(f"session-{i}", make_result())
+
+    assert registry.get("session-0") is None
+    assert registry.get("session-2") == make_result()
+
+    registry.ttl = 0
+    assert registry.get("session-2") is None
+    registry.record("session-3", make_result())
+    assert len(registry._results) == 1
+
+
+async def test_coordinator_awaits_webhook(
+    coordinator: ExecutionCoordinatorAgent,
+    sender: LocalWebhookSender,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the coordinator completes on the webhook without polling."""
+
+    def fail_poll(session_id: str) -> ExecutionResult:
+        raise AssertionError("Session should not be polled")
+
+    monkeypatch.setattr(coordinator.devin_session_manager, "get_session_result", fail_poll)
+    session_id = coordinator.devin_session_manager.create_session(make_ticket())
+
+    execution = asyncio.create_task(coordinator.execute_ticket_async(make_ticket()))
+    await asyncio.sleep(0)
+    response = await sender.send(session_id, make_result())
+    duplicate = await sender.send(session_id, make_result())
+
+    assert response.json() == {"status": "recorded"}
+    assert duplicate.json() == {"status": "duplicate"}
+    assert await asyncio.wait_for(execution, 1) == make_result()
+
+
+async def test_coordinator_polls_when_webhook_is_missed(
+    coordinator: ExecutionCoordinatorAgent,
+) -> None:
+    """Test that polling finds the result when no webhook arrives."""
+    result = await coordinator.execute_ticket_async(make_ticket(), poll_interval=0.01)
+
+    assert result.ticket_id == "ticket-1"
+    assert result.status == "completed"
+
+
+async def test_coordinator_times_out_on_pending_session(
+    coordinator: ExecutionCoordinatorAgent, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a session that never completes raises a timeout."""
+    monkeypatch.setattr(
+        coordinator.devin_session_manager,
+        "get_session_result",
+        lambda session_id: make_result(status="running"),
+    )
+
+    with pytest.raises(TimeoutError):
+        await coordinator.execute_ticket_async(make_ticket(), poll_interval=0.01, timeout=0.05)
+
+
+async def test_webhook_rejects_invalid_secret(
+    sender: LocalWebhookSender, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the webhook requires the configured shared secret."""
+    monkeypatch.setenv("DEVIN_WEBHOOK_SECRET", "expected")
+
+    rejected = await sender.send(f"session-{uuid.uuid4().hex}", make_result())
+    sender.secret = "expected"
+    accepted = await sender.send(f"session-{uuid.uuid4().hex}", make_result())
+
+    assert rejected.status_code == 401
+    assert accepted.status_code == 200
@@ -0,0 +1,195 @@
+"""
+Unit tests for the Ticket Dedup Index.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from backend.app.core.data_models import DevinTicket, InitiativeGoal
+from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
+from backend.app.tools.ticket_dedup_index import TicketDedupIndex
+
+
+def make_ticket(ticket_id: str, title: str, description: str, criteria: list[str]) -> DevinTicket:
+    return DevinTicket(
+        ticket_id=ticket_id,
+        epic_id="epic-1",
+        title=title,
+        description=description,
+        input_files=["file1.py"],
+        output_expectation="Expected output",
+        acceptance_criteria=criteria,
+        priority=1,
+        status="ready",
+    )
+
+
+@pytest.fixture
+def setup_tickets() -> list[DevinTicket]:
+    description = (
+        "Set up the local development environment with the project dependencies, "
+        "pre-commit hooks and a working test runner for the backend service"
+    )
+    return [
+        make_ticket(
+            "ticket-1",
+            "Setup environment",
+            description,
+            ["Dependencies install cleanly", "Tests run locally"],
+        ),
+        make_ticket(
+            "ticket-2",
+            "Setup environment",
+            description,
+            ["Dependencies install cleanly", "Tests run locally", "Hooks run"],
+        ),
+        make_ticket(
+            "ticket-3",
+            "Add login form",
+            "Build the login form with email and password fields and client side validation",
+            ["Form validates email", "Errors are shown inline"],
+        ),
+    ]
+
+
+def test_invalid_band_configuration() -> None:
+    """Test that num_perm must be divisible by the number of bands."""
+    with pytest.raises(ValueError):
+        TicketDedupIndex(num_perm=100, bands=16)
+
+
+def test_signature_is_deterministic(setup_tickets: list[DevinTicket]) -> None:
+    """Test that signatures do not depend on the index instance."""
+    first = TicketDedupIndex().signature(setup_tickets[0])
+    second = TicketDedupIndex().signature(setup_tickets[0])
+
+    assert first == second
+    assert len(first) == 128
+
+
+def test_add_clusters_near_duplicates(setup_tickets: list[DevinTicket]) -> None:
+    """Test that near-duplicates join the cluster of the first equivalent ticket."""
+    index = TicketDedupIndex()
+
+    assert index.add(setup_tickets[0]) is None
+    assert index.add(setup_tickets[1]) == "ticket-1"
+    assert index.add(setup_tickets[2]) is None
+
+    assert len(index) == 3
+    assert index.canonical_id("ticket-2") == "ticket-1"
+    assert index.clusters() == {"ticket-1": ["ticket-1", "ticket-2"]}
+
+
+def test_add_is_idempotent(setup_tickets: list[DevinTicket]) -> None:
+    """Test that re-adding an indexed ticket does not change the index."""
+    index = TicketDedupIndex()
+    index.add(setup_tickets[0])
+    index.add(setup_tickets[1])
+
+    assert index.add(setup_tickets[0]) is None
+    assert index.add(setup_tickets[1]) == "ticket-1"
+    assert len(index) == 2
+
+
+def test_colliding_ticket_ids_are_indexed_separately(setup_tickets: list[DevinTicket]) -> None:
+    """Test that a different ticket reusing an indexed ID is not taken for the indexed one."""
+    index = TicketDedupIndex()
+    index.add(setup_tickets[0])
+    colliding = replace(setup_tickets[2], ticket_id="ticket-1")
+
+    assert index.add(colliding) is None
+    assert index.add(colliding) is None
+    assert len(index) == 2
+    assert index.query(setup_tickets[1]) == ["ticket-1"]
+
+    tickets = TicketDedupIndex().deduplicate([setup_tickets[0], colliding], "merge")
+    assert tickets == [setup_tickets[0], colliding]
+
+
+def test_query_does_not_index(setup_tickets: list[DevinTicket]) -> None:
+    """Test that query finds matches without adding the ticket."""
+    index = TicketDedupIndex()
+    index.add(setup_tickets[0])
+
+    assert index.query(setup_tickets[1]) == ["ticket-1"]
+    assert index.query(setup_tickets[2]) == []
+    assert "ticket-2" not in index
+
+
+def test_deduplicate_link(setup_tickets: list[DevinTicket]) -> None:
+    """Test that the link policy keeps duplicates and records their canonical ticket."""
+    tickets = TicketDedupIndex().deduplicate(setup_tickets, "link")
+
+    assert [ticket.ticket_id for ticket in tickets] == ["ticket-1", "ticket-2", "ticket-3"]
+    assert tickets[1].metadata == {"duplicate_of": "ticket-1"}
+    assert tickets[0].metadata is None
+
+
+def test_deduplicate_merge(setup_tickets: list[DevinTicket]) -> None:
+    """Test that the merge policy drops duplicates and folds them into the canonical ticket."""
+    tickets = TicketDedupIndex().deduplicate(setup_tickets, "merge")
+
+    assert [ticket.ticket_id for ticket in tickets] == ["ticket-1", "ticket-3"]
+    assert tickets[0].acceptance_criteria == [
+        "Dependencies install cleanly",
+        "Tests run locally",
+        "Hooks run",
+    ]
+    assert tickets[0].metadata == {"merged_tickets": ["ticket-2"]}
+
+
+def test_deduplicate_merge_across_work_packages(setup_tickets: list[DevinTicket]) -> None:
+    """Test that tickets returned by an earlier batch are never changed by a merge."""
+    index = TicketDedupIndex()
+    first = index.deduplicate([setup_tickets[0]], "merge")
+    second = index.deduplicate([setup_tickets[1], setup_tickets[2]], "merge")
+    third = index.deduplicate([replace(setup_tickets[0], ticket_id="ticket-4")], "merge")
+
+    # ticket-2 has a criterion ticket-1 was returned without, so it is linked instead.
+    assert [ticket.ticket_id for ticket in second] == ["ticket-2", "ticket-3"]
+    assert second[0].metadata == {"duplicate_of": "ticket-1"}
+    assert first[0].acceptance_criteria == ["Dependencies install cleanly", "Tests run locally"]
+    assert first[0].metadata is None
+    assert third == []
+
+
+def test_full_index_evicts_oldest_cluster(setup_tickets: list[DevinTicket]) -> None:
+    """Test that the index stays bounded by evicting its oldest cluster."""
+    index = TicketDedupIndex(max_entries=2)
+    index.add(setup_tickets[0])
+    index.add(setup_tickets[1])
+
+    assert index.add(setup_tickets[2]) is None
+    assert len(index) == 1
+    assert "ticket-1" not in index and "ticket-2" not in index
+    assert index.query(setup_tickets[0]) == []
+    assert {key for band in index._buckets for bucket in band.values() for key in bucket} == {
+        "ticket-3"
+    }
+    assert index.add(setup_tickets[0]) is None
+
+
+def test_orchestrator_links_duplicates_across_initiatives() -> None:
+    """Test that the orchestrator's index persists across initiatives."""
+    orchestrator = ProjectOrchestrator()
+    first_goal = InitiativeGoal(id="initiative-1", title="First", description="First")
+    second_goal = InitiativeGoal(id="initiative-2", title="Second", description="Second")
+
+    first = orchestrator.process_initiative(first_goal)
+    second = orchestrator.process_initiative(second_goal)
+
+    assert all(ticket.metadata is None for ticket in first)
+    assert [ticket.metadata for ticket in second] == [
+        {"duplicate_of": ticket.ticket_id} for ticket in first
+    ]
+
+
+def test_orchestrator_merges_duplicates_across_initiatives() -> None:
+    """Test that the merge policy drops tickets already dispatched for another initiative."""
+    orchestrator = ProjectOrchestrator(dedup_policy="merge")
+    first_goal = InitiativeGoal(id="initiative-1", title="First", description="First")
+    second_goal = InitiativeGoal(id="initiative-2", title="Second", description="Second")
+
+    assert len(orchestrator.process_initiative(first_goal)) == 4
+    assert orchestrator.process_initiative(second_goal) == []
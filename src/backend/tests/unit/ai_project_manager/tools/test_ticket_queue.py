@@ -0,0 +1,200 @@
+"""
+Unit tests for the Ticket Queue and Ticket Worker.
+"""
+
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from backend.app.core.data_models import DevinTicket, ExecutionResult, InitiativeGoal
+from backend.app.core.orchestration.project_orchestrator import ProjectOrchestrator
+from backend.app.tools.ticket_queue import TicketQueue
+from backend.app.tools.ticket_worker import TicketWorker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_ticket(ticket_id: str) -> DevinTicket:
+    return DevinTicket(
+        ticket_id=ticket_id,
+        epic_id="epic-1",
+        title=f"Ticket {ticket_id}",
+        description="This is a test ticket",
+        input_files=["file1.py"],
+        output_expectation="Expected output",
+        acceptance_criteria=["Criterion 1"],
+        priority=1,
+        status="ready",
+    )
+
+
+def make_result(ticket: DevinTicket) -> ExecutionResult:
+    return ExecutionResult(
+        ticket_id=ticket.ticket_id,
+        status="completed",
+        output=f"Output for {ticket.ticket_id}",
+        execution_time="1 minute",
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path: Path, clock: FakeClock) -> Iterator[TicketQueue]:
+    queue = TicketQueue(tmp_path / "queue.sqlite3", visibility_timeout=60.0, clock=clock)
+    yield queue
+    queue.close()
+
+
+def test_enqueue_ignores_duplicates(queue: TicketQueue) -> None:
+    """Test that re-enqueued tickets are not added twice."""
+    assert queue.enqueue([make_ticket("ticket-1"), make_ticket("ticket-2")]) == 2
+    assert queue.enqueue([make_ticket("ticket-1")]) == 0
+    assert queue.counts()["queued"] == 2
+
+
+def test_enqueue_rejects_colliding_ticket_ids(queue: TicketQueue) -> None:
+    """Test that a different ticket reusing an enqueued ticket ID rejects the batch."""
+    queue.enqueue([make_ticket("ticket-1")])
+    colliding = replace(make_ticket("ticket-1"), title="A different ticket")
+
+    with pytest.raises(ValueError, match="ticket-1"):
+        queue.enqueue([make_ticket("ticket-2"), colliding])
+
+    assert queue.counts()["queued"] == 1
+
+
+def test_orchestrator_enqueues_initiative_tickets(queue: TicketQueue) -> None:
+    """Test that the orchestrator enqueues every ticket it generates, once."""
+    orchestrator = ProjectOrchestrator()
+    goal = InitiativeGoal(id="initiative-1", title="Initiative", description="Initiative")
+
+    tickets = orchestrator.enqueue_initiative(goal, queue)
+
+    assert tickets
+    assert queue.counts()["queued"] == len(tickets)
+    leased = queue.lease("worker-a", batch_size=len(tickets))
+    assert [lease.ticket for lease in leased] == tickets
+
+
+def test_lease_and_complete(queue: TicketQueue) -> None:
+    """Test that leased tickets are invisible to other workers until completed."""
+    queue.enqueue([make_ticket("ticket-1"), make_ticket("ticket-2")])
+
+    first = queue.lease("worker-a")
+    second = queue.lease("worker-b")
+
+    assert [lease.ticket.ticket_id for lease in first] == ["ticket-1"]
+    assert [lease.ticket.ticket_id for lease in second] == ["ticket-2"]
+    assert queue.lease("worker-c", steal=False) == []
+
+    assert queue.start(first[0])
+    assert queue.complete(first[0], make_result(first[0].ticket))
+    assert queue.results() == {"ticket-1": make_result(first[0].ticket)}
+
+
+def test_expired_lease_is_leased_again(queue: TicketQueue, clock: FakeClock) -> None:
+    """Test that a ticket held by a crashed worker is redelivered after the timeout."""
+    queue.enqueue([make_ticket("ticket-1")])
+    [crashed] = queue.lease("worker-a")
+    queue.start(crashed)
+
+    assert queue.lease("worker-b") == []
+
+    clock.now += 61
+    [redelivered] = queue.lease("worker-b")
+
+    assert redelivered.attempt == 2
+    assert not queue.complete(crashed, make_result(crashed.ticket))
+    assert queue.start(redelivered)
+    assert queue.complete(redelivered, make_result(redelivered.ticket))
+
+
+def test_extend_keeps_lease_alive(queue: TicketQueue, clock: FakeClock) -> None:
+    """Test that extending a lease prevents redelivery."""
+    queue.enqueue([make_ticket("ticket-1")])
+    [lease] = queue.lease("worker-a")
+    queue.start(lease)
+
+    clock.now += 50
+    assert queue.extend(lease)
+    clock.now += 50
+
+    assert queue.lease("worker-b") == []
+
+
+def test_exhausted_ticket_is_failed(tmp_path: Path, clock: FakeClock) -> None:
+    """Test that a ticket is failed once its lease expires too many times."""
+    queue = TicketQueue(
+        tmp_path / "queue.sqlite3", visibility_timeout=1.0, max_attempts=1, clock=clock
+    )
+    queue.enqueue([make_ticket("ticket-1")])
+    [lease] = queue.lease("worker-a")
+    queue.start(lease)
+
+    clock.now += 2
+
+    assert queue.lease("worker-b") == []
+    assert queue.results()["ticket-1"].status == "failed"
+    queue.close()
+
+
+def test_idle_worker_steals_unstarted_tickets(queue: TicketQueue) -> None:
+    """Test that an idle worker steals the newest unstarted tickets of another worker."""
+    queue.enqueue([make_ticket(f"ticket-{i}") for i in range(4)])
+    prefetched = queue.lease("worker-a", batch_size=4)
+    assert queue.start(prefetched[0])
+
+    stolen = queue.lease("worker-b", batch_size=2)
+
+    assert [lease.ticket.ticket_id for lease in stolen] == ["ticket-2", "ticket-3"]
+    assert queue.start(prefetched[1])
+    assert not queue.start(prefetched[2])
+
+
+def test_started_tickets_are_not_stolen(queue: TicketQueue) -> None:
+    """Test that tickets already being executed cannot be stolen."""
+    queue.enqueue([make_ticket("ticket-1")])
+    [lease] = queue.lease("worker-a")
+    queue.start(lease)
+
+    assert queue.lease("worker-b") == []
+
+
+def test_worker_drains_queue(queue: TicketQueue) -> None:
+    """Test that a worker executes every queued ticket and records the results."""
+    tickets = [make_ticket(f"ticket-{i}") for i in range(5)]
+    queue.enqueue(tickets)
+    worker = TicketWorker(queue, execute=make_result, worker_id="worker-a", batch_size=2)
+
+    assert worker.run(exit_when_empty=True) == 5
+    assert queue.results() == {ticket.ticket_id: make_result(ticket) for ticket in tickets}
+
+
+def test_worker_retries_then_fails(queue: TicketQueue) -> None:
+    """Test that failing tickets are retried until they run out of attempts."""
+    queue.enqueue([make_ticket("ticket-1")])
+    calls = []
+
+    def failing_execute(ticket: DevinTicket) -> ExecutionResult:
+        calls.append(ticket.ticket_id)
+        raise RuntimeError("boom")
+
+    worker = TicketWorker(queue, execute=failing_execute, worker_id="worker-a")
+    worker.run(exit_when_empty=True)
+
+    assert len(calls) == queue.max_attempts
+    result = queue.results()["ticket-1"]
+    assert result.status == "failed"
+    assert result.output == "boom"
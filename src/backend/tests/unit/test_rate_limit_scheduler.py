@@ -0,0 +1,167 @@
+"""
+Unit tests for the Rate Limit Scheduler and Rate Limited Model.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from agents import ModelSettings, ModelTracing, Usage
+from agents.items import ModelResponse
+
+from backend.app.utils.rate_limit_scheduler import ModelRateLimit, Priority, RateLimitScheduler
+from backend.app.utils.rate_limited_model import RateLimitedModel
+
+
+class FakeModel:
+    def __init__(self, total_tokens: int, error: Exception | None = None) -> None:
+        self.total_tokens = total_tokens
+        self.error = error
+        self.calls = 0
+
+    async def get_response(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return ModelResponse(
+            output=[], usage=Usage(total_tokens=self.total_tokens), response_id=None
+        )
+
+    def stream_response(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        raise NotImplementedError
+
+
+async def test_unconfigured_model_is_admitted_immediately() -> None:
+    """Test that models without a rate limit are not throttled."""
+    scheduler = RateLimitScheduler()
+    start = time.monotonic()
+    for _ in range(100):
+        await scheduler.acquire("unlimited", 10_000)
+    assert time.monotonic() - start < 0.1
+
+
+async def test_requests_are_smoothed() -> None:
+    """Test that calls beyond the burst budget wait for the bucket to refill."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(600, 1_000_000, burst_seconds=0.2))
+
+    start = time.monotonic()
+    for _ in range(4):
+        await scheduler.acquire("model", 1)
+
+    # Two requests fit in the burst; the other two are admitted at 10 requests/second.
+    assert 0.15 < time.monotonic() - start < 0.5
+
+
+async def test_higher_priority_is_admitted_first() -> None:
+    """Test that waiting interactive calls overtake waiting background calls."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(600, 1_000_000, burst_seconds=0.1))
+    await scheduler.acquire("model", 1)
+    order: list[str] = []
+
+    async def call(name: str, priority: Priority) -> None:
+        await scheduler.acquire("model", 1, priority)
+        order.append(name)
+
+    await asyncio.gather(
+        call("background", Priority.BACKGROUND),
+        call("pipeline", Priority.PIPELINE),
+        call("interactive", Priority.INTERACTIVE),
+    )
+
+    assert order == ["interactive", "pipeline", "background"]
+
+
+async def test_settle_refunds_overestimated_tokens() -> None:
+    """Test that settling with fewer tokens than estimated returns the difference."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(6000, 600, burst_seconds=10))
+
+    reservation = await scheduler.acquire("model", 100)
+    reservation.settle(10)
+
+    start = time.monotonic()
+    await scheduler.acquire("model", 90)
+    assert time.monotonic() - start < 0.05
+
+
+async def test_rate_limited_model_settles_with_usage() -> None:
+    """Test that the wrapped model's reported usage is charged to the budget."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(6000, 6000, burst_seconds=1))
+    fake = FakeModel(total_tokens=100)
+    model = RateLimitedModel(fake, "model", Priority.INTERACTIVE, scheduler)  # type: ignore[arg-type]
+
+    response = await model.get_response(
+        "You are a planner",
+        "Plan the work",
+        ModelSettings(max_tokens=50),
+        [],
+        None,
+        [],
+        ModelTracing.DISABLED,
+        previous_response_id=None,
+    )
+
+    assert response.usage.total_tokens == 100
+    assert fake.calls == 1
+    assert scheduler._states["model"].tokens.level < 1
+
+
+async def test_rate_limited_model_refunds_failed_calls() -> None:
+    """Test that a call that raises does not keep its reservation charged."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(6000, 6000, burst_seconds=1))
+    fake = FakeModel(total_tokens=0, error=RuntimeError("rate limited"))
+    model = RateLimitedModel(fake, "model", Priority.INTERACTIVE, scheduler)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError):
+        await model.get_response(
+            "You are a planner",
+            "Plan the work",
+            ModelSettings(max_tokens=50),
+            [],
+            None,
+            [],
+            ModelTracing.DISABLED,
+            previous_response_id=None,
+        )
+
+    assert scheduler._states["model"].tokens.level == pytest.approx(100, abs=1)
+
+
+async def test_rate_limited_model_waits_for_the_bucket() -> None:
+    """Test that a wrapped model call is not made until the token bucket covers it."""
+    scheduler = RateLimitScheduler()
+    scheduler.configure("model", ModelRateLimit(6000, 6000, burst_seconds=0.1))
+    fake = FakeModel(total_tokens=10)
+    model = RateLimitedModel(fake, "model", Priority.INTERACTIVE, scheduler)  # type: ignore[arg-type]
+    await scheduler.acquire("model", 10)
+
+    start = time.monotonic()
+    await model.get_response(
+        None,
+        "",
+        ModelSettings(max_tokens=10),
+        [],
+        None,
+        [],
+        ModelTracing.DISABLED,
+        previous_response_id=None,
+    )
+
+    # The bucket holds 10 tokens and refills at 100 tokens/second.
+    assert time.monotonic() - start > 0.08
+    assert fake.calls == 1
+
+
+def test_non_positive_limits_are_rejected() -> None:
+    """Test that a zero limit is rejected instead of failing when calls are admitted."""
+    scheduler = RateLimitScheduler()
+    with pytest.raises(ValueError):
+        scheduler.configure("model", ModelRateLimit(0, 1000))
+    with pytest.raises(ValueError):
+        scheduler.configure("model", ModelRateLimit(60, 1000, burst_seconds=0))